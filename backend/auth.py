@@ -1,28 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, Request, status, Header
+from sqlalchemy import select
 import os
-from database import SessionLocal, User
+from database import AsyncSessionLocal, User
+from schemas import Principal
 
 # Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 알림 스트림 연결용 토큰 유효 시간 (초, URL 쿼리로 전달되어 접근 로그에 남으므로 짧게 유지)
+STREAM_TOKEN_EXPIRE_SECONDS = int(os.getenv("STREAM_TOKEN_EXPIRE_SECONDS", 60))
+# 알림 스트림 연결용 토큰의 scope 클레임 (액세스 토큰에는 scope가 없음)
+STREAM_TOKEN_SCOPE = "notification_stream"
+
+# 토큰 버전/사용자명 메모리 캐시 유효 시간 (다른 워커의 변경을 반영하는 주기)
+TOKEN_STATE_TTL_SECONDS = int(os.getenv("TOKEN_STATE_TTL_SECONDS", 60))
+
+# user_id -> (token_version, username, loaded_at)
+_token_state = {}
 
+# /api/batch 하위 요청에 배치 요청에서 인증한 사용자를 전달하는 ASGI scope 키
+BATCH_PRINCIPAL_SCOPE_KEY = "batch_principal"
 
-def hash_password(password: str) -> str:
+# Password hashing
+# 비용(rounds)이 바뀌면 기존 해시는 로그인 시 새 비용으로 재해시됨
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
+
+# bcrypt 연산은 이벤트 루프를 막지 않도록 제한된 스레드 풀에서 실행
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 4))
+_password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+
+async def _run_password_task(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)
+
+
+async def hash_password(password: str) -> str:
     """비밀번호를 해시합니다."""
-    return pwd_context.hash(password)
+    return await _run_password_task(pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호를 검증합니다."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return await _run_password_task(pwd_context.verify, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -40,26 +79,105 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def decode_token(token: str) -> Optional[str]:
-    """JWT 토큰을 검증하고 이메일을 반환합니다."""
+def create_user_token(user: User) -> str:
+    """사용자 ID, 사용자명, 토큰 버전을 담은 JWT 토큰을 생성합니다."""
+    remember_token_state(user)
+    return create_access_token(
+        data={
+            "sub": user.email,
+            "uid": user.id,
+            "username": user.username,
+            "ver": user.token_version,
+        },
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+
+
+def create_stream_token(principal: Principal) -> str:
+    """알림 스트림 연결에만 쓸 수 있는 짧은 수명의 토큰을 생성합니다."""
+    return create_access_token(
+        data={
+            "sub": principal.email,
+            "uid": principal.id,
+            "ver": principal.token_version,
+            "scope": STREAM_TOKEN_SCOPE,
+        },
+        expires_delta=timedelta(seconds=STREAM_TOKEN_EXPIRE_SECONDS),
+    )
+
+
+def decode_token(token: str) -> Optional[dict]:
+    """JWT 토큰을 검증하고 클레임을 반환합니다."""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        
-        if email is None:
+
+        if payload.get("sub") is None or payload.get("uid") is None:
             return None
-            
-        return email
+
+        return payload
     except JWTError:
         return None
 
 
-async def get_current_user(authorization: Optional[str] = Header(None)) -> User:
+def remember_token_state(user: User):
+    """사용자의 현재 토큰 버전과 사용자명을 메모리 캐시에 반영합니다."""
+    _token_state[user.id] = (user.token_version, user.username, time.monotonic())
+
+
+async def _get_token_state(user_id: int):
+    """캐시된 토큰 상태를 반환하고, 없거나 오래되었으면 DB에서 다시 읽습니다."""
+    state = _token_state.get(user_id)
+    if state and time.monotonic() - state[2] < TOKEN_STATE_TTL_SECONDS:
+        return state
+
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(
+            select(User.token_version, User.username).where(User.id == user_id)
+        )).first()
+
+    if row is None:
+        _token_state.pop(user_id, None)
+        return None
+
+    state = (row.token_version, row.username, time.monotonic())
+    _token_state[user_id] = state
+    return state
+
+
+async def resolve_principal(token: str, scope: Optional[str] = None) -> Optional[Principal]:
+    """
+    토큰 클레임으로 사용자를 식별합니다.
+
+    토큰 버전이 현재 버전과 다르면(비밀번호 변경 등) 폐기된 토큰으로 간주합니다.
+    scope가 다른 토큰(예: 알림 스트림 토큰을 액세스 토큰으로 사용)은 거부합니다.
+    """
+    claims = decode_token(token)
+
+    if claims is None or claims.get("scope") != scope:
+        return None
+
+    state = await _get_token_state(claims["uid"])
+    if state is None or claims.get("ver", 0) != state[0]:
+        return None
+
+    return Principal(
+        id=claims["uid"],
+        email=claims["sub"],
+        username=state[1],
+        token_version=state[0],
+    )
+
+
+async def get_current_user(request: Request, authorization: Optional[str] = Header(None)) -> Principal:
     """
     현재 인증된 사용자를 반환합니다.
     
     보호된 엔드포인트에서 사용됩니다.
     """
+    principal = request.scope.get(BATCH_PRINCIPAL_SCOPE_KEY)
+    if principal is not None:
+        return principal
+
     if not authorization:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -77,37 +195,30 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> User:
         )
     
     token = parts[1]
-    email = decode_token(token)
+    principal = await resolve_principal(token)
     
-    if email is None:
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.email == email).first()
-        
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        return user
-    finally:
-        db.close()
-
-
-async def get_current_user_optional(authorization: Optional[str] = Header(None)) -> Optional[User]:
+    return principal
+
+
+async def get_current_user_optional(
+    request: Request, authorization: Optional[str] = Header(None)
+) -> Optional[Principal]:
     """
     현재 인증된 사용자를 반환합니다. (인증 선택사항)
     
     인증이 있으면 사용자 반환, 없으면 None 반환
     """
+    principal = request.scope.get(BATCH_PRINCIPAL_SCOPE_KEY)
+    if principal is not None:
+        return principal
+
     if not authorization:
         return None
     
@@ -117,27 +228,23 @@ async def get_current_user_optional(authorization: Optional[str] = Header(None))
         return None
     
     token = parts[1]
-    email = decode_token(token)
-    
-    if email is None:
-        return None
-    
-    db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.email == email).first()
-        return user
-    finally:
-        db.close()
+    return await resolve_principal(token)
 
 
-def authenticate_user(db, email: str, password: str) -> Optional[User]:
+async def authenticate_user(db, email: str, password: str) -> Optional[User]:
     """사용자의 이메일과 비밀번호로 인증합니다."""
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.scalar(select(User).where(User.email == email))
     
     if not user:
         return None
     
-    if not verify_password(password, user.password):
+    valid, new_hash = await _run_password_task(pwd_context.verify_and_update, password, user.password)
+    if not valid:
         return None
+
+    # 비용 설정이 바뀐 해시는 새 비용으로 교체
+    if new_hash:
+        user.password = new_hash
+        await db.commit()
     
     return user
@@ -0,0 +1,139 @@
+"""
+스터디 대시보드 지연 시간 벤치마크
+
+설정된 DB(DATABASE_URL)에 임시 스터디(멤버, 게시물, 이슈, 가입 요청)를 만들고
+get_study_dashboard를 반복 실행해 지연 시간과 쿼리 수를 측정한 뒤 데이터를 정리합니다.
+p95가 DASHBOARD_LATENCY_BUDGET_MS를 넘거나 쿼리 수가 DASHBOARD_MAX_QUERIES를 넘으면
+종료 코드 1을 반환합니다.
+
+    python benchmark_dashboard.py             # 기본 200회
+    python benchmark_dashboard.py 1000        # 1000회 반복
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, event
+
+from database import AsyncSessionLocal, Issue, JoinRequest, Post, Study, StudyMember, User, engine
+from dashboard_utils import DASHBOARD_MAX_QUERIES, get_study_dashboard
+from study_purge import purge_study
+
+# 대시보드 조회 p95 지연 시간 예산 (밀리초)
+DASHBOARD_LATENCY_BUDGET_MS = float(os.getenv("DASHBOARD_LATENCY_BUDGET_MS", 50))
+
+BENCH_MEMBERS = 30
+BENCH_POSTS = 500
+BENCH_ISSUES = 200
+BENCH_JOIN_REQUESTS = 10
+
+
+async def _seed() -> tuple:
+    """임시 사용자/스터디/게시물/이슈를 만들고 (study_id, admin_id, user_ids)를 반환"""
+    tag = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    today = date.today()
+    async with AsyncSessionLocal() as db:
+        users = [
+            User(email=f"bench-{tag}-{i}@example.com", username=f"bench{tag}{i}", password="x")
+            for i in range(BENCH_MEMBERS + BENCH_JOIN_REQUESTS)
+        ]
+        db.add_all(users)
+        await db.flush()
+        admin = users[0]
+        study = Study(name=f"benchmark-{tag}", description="dashboard benchmark", creator_id=admin.id)
+        db.add(study)
+        await db.flush()
+
+        db.add_all(
+            StudyMember(study_id=study.id, user_id=user.id, role="admin" if i == 0 else "member")
+            for i, user in enumerate(users[:BENCH_MEMBERS])
+        )
+        db.add_all(
+            JoinRequest(study_id=study.id, user_id=user.id, status="pending")
+            for user in users[BENCH_MEMBERS:]
+        )
+        db.add_all(
+            Post(
+                study_id=study.id, user_id=users[i % BENCH_MEMBERS].id, title=f"Post {i}",
+                content="내용 " * 100, comment_count=i % 9, created_at=now - timedelta(minutes=i),
+            )
+            for i in range(BENCH_POSTS)
+        )
+        # 예정 / 진행 중 / 완료가 섞이도록 날짜 지정
+        db.add_all(
+            Issue(
+                study_id=study.id, user_id=users[i % BENCH_MEMBERS].id, title=f"Issue {i}",
+                start_date=today + timedelta(days=(i % 3 - 1) * 7),
+                end_date=today + timedelta(days=(i % 3 - 1) * 7 + 3),
+                created_at=now - timedelta(minutes=i),
+            )
+            for i in range(BENCH_ISSUES)
+        )
+        await db.commit()
+        return study.id, admin.id, [user.id for user in users]
+
+
+async def _cleanup(study_id: int, user_ids: list):
+    async with AsyncSessionLocal() as db:
+        study = await db.get(Study, study_id)
+        study.deleted_at = datetime.utcnow()
+        await db.commit()
+    await purge_study(study_id)
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(User).where(User.id.in_(user_ids)))
+        await db.commit()
+
+
+async def _main(argv) -> int:
+    iterations = int(argv[0]) if argv else 200
+    study_id, admin_id, user_ids = await _seed()
+
+    statements = [0]
+
+    def count_statement(*args, **kwargs):
+        statements[0] += 1
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await get_study_dashboard(db, study_id, admin_id)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+        async with AsyncSessionLocal() as db:
+            dashboard = await get_study_dashboard(db, study_id, admin_id)
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+        queries = statements[0]
+
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                await get_study_dashboard(db, study_id, admin_id)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        await _cleanup(study_id, user_ids)
+        await engine.dispose()
+
+    timings.sort()
+    p50 = statistics.median(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{engine.dialect.name}: {iterations} iterations, "
+        f"{len(dashboard['recent_posts'])} posts / {len(dashboard['in_progress_issues'])} issues"
+    )
+    print(f"queries {queries} (max {DASHBOARD_MAX_QUERIES})")
+    print(f"p50 {p50:.2f} ms   p95 {p95:.2f} ms   max {timings[-1]:.2f} ms   (budget p95 {DASHBOARD_LATENCY_BUDGET_MS:.0f} ms)")
+
+    if queries > DASHBOARD_MAX_QUERIES or p95 > DASHBOARD_LATENCY_BUDGET_MS:
+        print("FAIL: dashboard exceeds its query or latency budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
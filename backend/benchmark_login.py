@@ -0,0 +1,155 @@
+"""
+로그인 동시 부하 벤치마크
+
+설정된 DB(DATABASE_URL)에 임시 사용자를 만들고, 로그인 요청(POST /api/auth/login)을
+동시에 보내면서 /health 응답 시간으로 이벤트 루프 지연을 함께 측정한 뒤 사용자를 정리합니다.
+요청은 앱을 ASGI로 직접 호출하므로 서버를 따로 띄울 필요가 없습니다.
+로그인 p99가 LOGIN_LATENCY_BUDGET_MS를 넘거나 /health p99가 EVENT_LOOP_LAG_BUDGET_MS를
+넘으면 종료 코드 1을 반환합니다.
+
+    python benchmark_login.py             # 로그인 64회, 동시 8개
+    python benchmark_login.py 200 32      # 로그인 200회, 동시 32개
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+import orjson
+from sqlalchemy import delete
+
+from auth import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, hash_password
+from database import AsyncSessionLocal, User, engine
+from main import app
+
+# 로그인 p99 지연 시간 예산 (밀리초)
+LOGIN_LATENCY_BUDGET_MS = float(os.getenv("LOGIN_LATENCY_BUDGET_MS", 5000))
+# 로그인 부하 중 /health p99 지연 시간 예산 (밀리초, 이벤트 루프가 막히는지 확인)
+EVENT_LOOP_LAG_BUDGET_MS = float(os.getenv("EVENT_LOOP_LAG_BUDGET_MS", 100))
+# /health 확인 간격 (초)
+HEALTH_INTERVAL_SECONDS = 0.05
+
+BENCH_PASSWORD = "benchmark-password"
+
+
+async def _request(method: str, path: str, body: dict = None) -> int:
+    """앱을 ASGI로 직접 호출하고 응답 상태 코드를 반환"""
+    payload = orjson.dumps(body) if body is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "server": ("benchmark", 80),
+        "client": ("127.0.0.1", 0),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())],
+    }
+    response_start = {}
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response_start.update(message)
+
+    await app(scope, receive, send)
+    return response_start.get("status", 500)
+
+
+async def _seed() -> tuple:
+    """임시 사용자를 만들고 (user_id, email)을 반환"""
+    tag = uuid.uuid4().hex[:8]
+    email = f"bench-login-{tag}@example.com"
+    async with AsyncSessionLocal() as db:
+        user = User(email=email, username=f"benchlogin{tag}", password=await hash_password(BENCH_PASSWORD))
+        db.add(user)
+        await db.commit()
+        return user.id, email
+
+
+async def _cleanup(user_id: int):
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(User).where(User.id == user_id))
+        await db.commit()
+
+
+def _percentile(timings: list, q: float) -> float:
+    return timings[min(len(timings) - 1, int(len(timings) * q))]
+
+
+async def _main(argv) -> int:
+    logins = int(argv[0]) if argv else 64
+    concurrency = int(argv[1]) if len(argv) > 1 else 8
+    user_id, email = await _seed()
+
+    login_timings = []
+    health_timings = []
+    remaining = [logins]
+    done = asyncio.Event()
+
+    async def login_worker():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            started = time.perf_counter()
+            code = await _request("POST", "/api/auth/login", {"email": email, "password": BENCH_PASSWORD})
+            login_timings.append((time.perf_counter() - started) * 1000)
+            if code != 200:
+                raise RuntimeError(f"login failed with status {code}")
+
+    async def health_worker():
+        while not done.is_set():
+            started = time.perf_counter()
+            await _request("GET", "/health")
+            health_timings.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(HEALTH_INTERVAL_SECONDS)
+
+    try:
+        # 커넥션 풀과 첫 로그인 비용을 측정에서 제외
+        await _request("POST", "/api/auth/login", {"email": email, "password": BENCH_PASSWORD})
+
+        started = time.perf_counter()
+        health = asyncio.create_task(health_worker())
+        try:
+            await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        finally:
+            done.set()
+            await health
+        elapsed = time.perf_counter() - started
+    finally:
+        await _cleanup(user_id)
+        await engine.dispose()
+
+    login_timings.sort()
+    health_timings.sort()
+    login_p99 = _percentile(login_timings, 0.99)
+    health_p99 = _percentile(health_timings, 0.99)
+    print(
+        f"{engine.dialect.name}: {logins} logins, concurrency {concurrency}, "
+        f"bcrypt rounds {BCRYPT_ROUNDS}, {PASSWORD_HASH_WORKERS} hash workers, {logins / elapsed:.1f} req/s"
+    )
+    print(
+        f"login   p50 {statistics.median(login_timings):.1f} ms   p99 {login_p99:.1f} ms   "
+        f"max {login_timings[-1]:.1f} ms   (budget p99 {LOGIN_LATENCY_BUDGET_MS:.0f} ms)"
+    )
+    print(
+        f"/health p50 {statistics.median(health_timings):.1f} ms   p99 {health_p99:.1f} ms   "
+        f"max {health_timings[-1]:.1f} ms   (budget p99 {EVENT_LOOP_LAG_BUDGET_MS:.0f} ms)"
+    )
+
+    if login_p99 > LOGIN_LATENCY_BUDGET_MS or health_p99 > EVENT_LOOP_LAG_BUDGET_MS:
+        print("FAIL: login exceeds its latency or event loop lag budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
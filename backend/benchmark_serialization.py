@@ -0,0 +1,165 @@
+"""
+목록 API 직렬화 비용 마이크로벤치마크 (DB 없이 메모리의 ORM 객체만 사용)
+
+- before: 행마다 dict를 만들고 .isoformat() / StudyResponse.from_orm().dict()를 호출한 뒤
+          response_model=dict 검증 + JSONResponse(json.dumps)로 인코딩하던 방식
+- adapter: pydantic TypeAdapter(PostListResponse 등)로 ORM 행을 from_attributes 검증한 뒤
+           dump_json으로 bytes를 만드는 방식 (비교용, 행마다 검증 비용이 커서 채택하지 않음)
+- after:  datetime을 그대로 담은 dict를 serialization_utils.json_response(orjson)로 인코딩하는 방식
+
+    python benchmark_serialization.py             # 기본 100개 항목
+    python benchmark_serialization.py 20 5000     # 항목 20개, 5000회 반복
+"""
+import asyncio
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+
+from database import Post, Study, User
+from routes.studies_routes import study_to_dict
+from schemas import PostListResponse, StudyListResponse, StudyResponse
+from serialization_utils import json_response
+
+_DICT_FIELD = create_response_field(name="Response_benchmark", type_=dict)
+_POST_LIST_ADAPTER = TypeAdapter(PostListResponse)
+_STUDY_LIST_ADAPTER = TypeAdapter(StudyListResponse)
+
+
+def _make_rows(count: int):
+    now = datetime.utcnow()
+    users = [User(id=i, username=f"user{i}", email=f"user{i}@example.com") for i in range(1, 11)]
+    posts, studies = [], []
+    for i in range(1, count + 1):
+        created_at = now - timedelta(minutes=i)
+        post = Post(
+            id=i, study_id=1, user_id=users[i % 10].id, title=f"Week {i} 정리",
+            content="내용 " * 50, comment_count=i % 7, created_at=created_at, updated_at=created_at,
+        )
+        post.user = users[i % 10]
+        posts.append(post)
+        studies.append(Study(
+            id=i, name=f"스터디 {i}", description="알고리즘 스터디입니다", creator_id=users[i % 10].id,
+            created_at=created_at, updated_at=created_at,
+        ))
+    return posts, studies
+
+
+async def _encode_before(content) -> bytes:
+    value = await serialize_response(field=_DICT_FIELD, response_content=content)
+    return JSONResponse(value).body
+
+
+async def posts_before(posts) -> bytes:
+    items = []
+    for post in posts:
+        items.append({
+            "id": post.id,
+            "study_id": post.study_id,
+            "title": post.title,
+            "author": {
+                "id": post.user.id,
+                "username": post.user.username
+            },
+            "comment_count": post.comment_count,
+            "created_at": post.created_at.isoformat()
+        })
+    return await _encode_before({"total": len(posts), "items": items, "next_cursor": None})
+
+
+async def posts_adapter(posts) -> bytes:
+    page = _POST_LIST_ADAPTER.validate_python(
+        {"total": len(posts), "items": [{**post.__dict__, "author": post.user} for post in posts]},
+        from_attributes=True,
+    )
+    return _POST_LIST_ADAPTER.dump_json(page)
+
+
+async def posts_after(posts) -> bytes:
+    items = []
+    for post in posts:
+        items.append({
+            "id": post.id,
+            "study_id": post.study_id,
+            "title": post.title,
+            "author": {
+                "id": post.user.id,
+                "username": post.user.username
+            },
+            "comment_count": post.comment_count,
+            "created_at": post.created_at
+        })
+    return json_response({"total": len(posts), "items": items, "next_cursor": None}).body
+
+
+async def studies_before(studies) -> bytes:
+    items = []
+    for study in studies:
+        items.append({
+            **StudyResponse.from_orm(study).dict(),
+            "member_count": 3,
+            "is_member": True,
+            "has_pending_request": False
+        })
+    return await _encode_before({"total": len(studies), "items": items, "next_cursor": None})
+
+
+async def studies_adapter(studies) -> bytes:
+    page = _STUDY_LIST_ADAPTER.validate_python(
+        {"total": len(studies), "items": [
+            {**study.__dict__, "member_count": 3, "is_member": True} for study in studies
+        ]},
+        from_attributes=True,
+    )
+    return _STUDY_LIST_ADAPTER.dump_json(page)
+
+
+async def studies_after(studies) -> bytes:
+    items = []
+    for study in studies:
+        items.append({
+            **study_to_dict(study),
+            "member_count": 3,
+            "is_member": True,
+            "has_pending_request": False
+        })
+    return json_response({"total": len(studies), "items": items, "next_cursor": None}).body
+
+
+async def _measure(func, rows, iterations: int) -> float:
+    await func(rows)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await func(rows)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def _main(argv):
+    count = int(argv[0]) if argv else 100
+    iterations = int(argv[1]) if len(argv) > 1 else 2000
+    posts, studies = _make_rows(count)
+
+    print(f"{count} items per page, {iterations} iterations")
+    for name, before, adapter, after, rows in (
+        ("posts", posts_before, posts_adapter, posts_after, posts),
+        ("studies", studies_before, studies_adapter, studies_after, studies),
+    ):
+        before_us = await _measure(before, rows, iterations)
+        adapter_us = await _measure(adapter, rows, iterations)
+        after_us = await _measure(after, rows, iterations)
+        print(
+            f"{name:8s} before {before_us:9.1f} us   adapter {adapter_us:9.1f} us   "
+            f"after {after_us:9.1f} us   x{before_us / after_us:.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    # from_orm / dict 는 pydantic v2에서 deprecated (before 측정용으로만 사용)
+    warnings.simplefilter("ignore", DeprecationWarning)
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
@@ -0,0 +1,162 @@
+"""
+목록 API 쿼리 수 확인
+
+설정된 DB(DATABASE_URL)에 임시 사용자/스터디/알림을 만들고, 목록 API를 페이지 크기 100으로
+호출하면서 실행된 SQL 구문 수를 센 뒤 데이터를 정리합니다.
+쿼리 수가 각 라우트의 상한(NOTIFICATION_LIST_MAX_QUERIES, STUDY_LIST_MAX_QUERIES)을 넘으면
+종료 코드 1을 반환합니다. 인증 쿼리는 제외하고 라우트 함수만 측정합니다.
+
+    python check_query_counts.py
+"""
+import asyncio
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+import orjson
+from sqlalchemy import delete, event
+
+from database import AsyncSessionLocal, JoinRequest, Notification, Study, StudyMember, User, engine
+from routes.notifications_routes import NOTIFICATION_LIST_MAX_QUERIES, get_notifications
+from routes.studies_routes import STUDY_LIST_MAX_QUERIES, get_studies
+from schemas import Principal
+
+PAGE_SIZE = 100
+
+BENCH_USERS = 20
+BENCH_STUDIES = 150
+BENCH_NOTIFICATIONS = 250
+
+
+async def _seed() -> tuple:
+    """임시 사용자/스터디/알림을 만들고 (viewer, user_ids, study_ids)를 반환"""
+    tag = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        users = [
+            User(email=f"bench-{tag}-{i}@example.com", username=f"bench{tag}{i}", password="x")
+            for i in range(BENCH_USERS)
+        ]
+        db.add_all(users)
+        await db.flush()
+        viewer = users[0]
+
+        studies = [
+            Study(name=f"benchmark-{tag}-{i}", creator_id=users[i % BENCH_USERS].id, created_at=now - timedelta(minutes=i))
+            for i in range(BENCH_STUDIES)
+        ]
+        db.add_all(studies)
+        await db.flush()
+
+        # 스터디마다 멤버 몇 명, 조회하는 사용자는 일부 스터디의 멤버이고 일부에는 가입 요청 중
+        db.add_all(
+            StudyMember(study_id=study.id, user_id=users[(i + j) % BENCH_USERS].id, role="admin" if j == 0 else "member")
+            for i, study in enumerate(studies)
+            for j in range(3)
+        )
+        db.add_all(
+            JoinRequest(study_id=study.id, user_id=viewer.id, status="pending")
+            for i, study in enumerate(studies)
+            if i % 5 == 1
+        )
+
+        # 발신자가 여러 명이고 읽음/읽지 않음이 섞인 알림
+        db.add_all(
+            Notification(
+                user_id=viewer.id, notification_type="new_post", message=f"Notification {i}",
+                from_user_id=users[1 + i % (BENCH_USERS - 1)].id, is_read=i % 3 == 0,
+                created_at=now - timedelta(seconds=i),
+            )
+            for i in range(BENCH_NOTIFICATIONS)
+        )
+        await db.commit()
+
+        principal = Principal(id=viewer.id, email=viewer.email, username=viewer.username, token_version=0)
+        return principal, [user.id for user in users], [study.id for study in studies]
+
+
+async def _cleanup(user_ids: list, study_ids: list):
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Notification).where(Notification.user_id.in_(user_ids)))
+        await db.execute(delete(JoinRequest).where(JoinRequest.study_id.in_(study_ids)))
+        await db.execute(delete(StudyMember).where(StudyMember.study_id.in_(study_ids)))
+        await db.execute(delete(Study).where(Study.id.in_(study_ids)))
+        await db.execute(delete(User).where(User.id.in_(user_ids)))
+        await db.commit()
+
+
+def _body(result) -> dict:
+    """라우트 반환값(dict 또는 json_response 응답)을 dict로 변환"""
+    return result if isinstance(result, dict) else orjson.loads(result.body)
+
+
+async def _count_queries(call) -> tuple:
+    """call(db)를 한 번 실행해 캐시를 채운 뒤, 다시 실행하며 (쿼리 수, 응답 dict)를 반환"""
+    async with AsyncSessionLocal() as db:
+        await call(db)
+
+    statements = [0]
+
+    def count_statement(*args, **kwargs):
+        statements[0] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await call(db)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+    return statements[0], _body(result)
+
+
+async def _main(argv) -> int:
+    viewer, user_ids, study_ids = await _seed()
+
+    def notifications(**params):
+        options = {"skip": 0, "limit": PAGE_SIZE, "unread_only": False, "cursor": None, "include_total": True}
+        options.update(params)
+        return lambda db: get_notifications(**options, current_user=viewer, db=db)
+
+    def studies(current_user, **params):
+        options = {"skip": 0, "limit": PAGE_SIZE, "cursor": None, "include_total": True}
+        options.update(params)
+        return lambda db: get_studies(**options, current_user=current_user, db=db)
+
+    checks = [
+        ("notifications", NOTIFICATION_LIST_MAX_QUERIES, notifications()),
+        ("notifications unread_only", NOTIFICATION_LIST_MAX_QUERIES, notifications(unread_only=True)),
+        ("notifications include_total=false", NOTIFICATION_LIST_MAX_QUERIES, notifications(include_total=False)),
+        ("studies (signed in)", STUDY_LIST_MAX_QUERIES, studies(viewer)),
+        ("studies (anonymous)", STUDY_LIST_MAX_QUERIES, studies(None)),
+        ("studies include_total=false", STUDY_LIST_MAX_QUERIES, studies(viewer, include_total=False)),
+        ("studies (offset page)", STUDY_LIST_MAX_QUERIES, studies(viewer, skip=PAGE_SIZE)),
+    ]
+
+    results = []
+    try:
+        for name, limit, call in checks:
+            queries, body = await _count_queries(call)
+            results.append((name, limit, queries, body))
+
+        # 다음 페이지(cursor)도 같은 쿼리 수로 조회되는지 확인
+        queries, body = await _count_queries(notifications(cursor=results[0][3]["next_cursor"]))
+        results.append(("notifications (cursor page)", NOTIFICATION_LIST_MAX_QUERIES, queries, body))
+        queries, body = await _count_queries(studies(viewer, cursor=results[3][3]["next_cursor"]))
+        results.append(("studies (cursor page)", STUDY_LIST_MAX_QUERIES, queries, body))
+    finally:
+        await _cleanup(user_ids, study_ids)
+        await engine.dispose()
+
+    print(f"{engine.dialect.name}: page size {PAGE_SIZE}")
+    for name, limit, queries, body in results:
+        print(f"{name:<36} {len(body['items']):>4} items   queries {queries} (max {limit})")
+
+    if any(queries > limit for _, limit, queries, _ in results):
+        print("FAIL: a list endpoint exceeds its query budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
@@ -0,0 +1,107 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from database import Comment, Issue, Post, User
+from pagination_utils import paginate
+
+# 상세 조회에 함께 내려주는 첫 페이지 댓글 수
+COMMENT_PAGE_SIZE = 20
+
+
+def comment_to_dict(comment: Comment) -> dict:
+    """댓글을 작성자 정보와 함께 응답 형식으로 변환"""
+    return {
+        "id": comment.id,
+        "post_id": comment.post_id,
+        "issue_id": comment.issue_id,
+        "user_id": comment.user_id,
+        "content": comment.content,
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at,
+        "author": {
+            "id": comment.user.id,
+            "username": comment.user.username
+        }
+    }
+
+
+def thread_query(post_id: int = None, issue_id: int = None):
+    """게시물 또는 이슈의 댓글 조회 쿼리"""
+    if post_id:
+        return select(Comment).where(Comment.post_id == post_id)
+    return select(Comment).where(Comment.issue_id == issue_id)
+
+
+def thread_version(post_id: int = None, issue_id: int = None):
+    """
+    댓글 목록의 변경 여부를 판단하는 집계 서브쿼리 (ETag 계산용)
+
+    last_id(최대 댓글 id), updated_at(최근 수정 시각), authors_updated_at(작성자 정보 수정 시각)
+    """
+    condition = Comment.post_id == post_id if post_id else Comment.issue_id == issue_id
+    return (
+        select(
+            func.max(Comment.id).label("last_id"),
+            func.max(Comment.updated_at).label("updated_at"),
+            func.max(User.updated_at).label("authors_updated_at"),
+        )
+        .join(Comment.user)
+        .where(condition)
+        .subquery()
+    )
+
+
+async def get_comment_page(
+    db: AsyncSession,
+    post_id: int = None,
+    issue_id: int = None,
+    limit: int = COMMENT_PAGE_SIZE,
+    cursor: str = None
+):
+    """
+    댓글을 작성 순서대로 한 페이지 조회합니다.
+
+    작성자는 같은 쿼리에서 조인하며 (items, next_cursor)를 반환합니다.
+    """
+    comments, next_cursor = await paginate(
+        db, thread_query(post_id, issue_id).options(joinedload(Comment.user)),
+        Comment.created_at, Comment.id, limit, cursor=cursor
+    )
+    return [comment_to_dict(comment) for comment in comments], next_cursor
+
+
+async def adjust_comment_count(db: AsyncSession, delta: int, post_id: int = None, issue_id: int = None):
+    """
+    게시물 또는 이슈의 comment_count를 현재 트랜잭션 안에서 증감합니다.
+
+    댓글 수 변경으로 updated_at이 바뀌지 않도록 기존 값을 그대로 유지합니다.
+    """
+    model = Post if post_id else Issue
+    await db.execute(
+        update(model)
+        .where(model.id == (post_id or issue_id))
+        .values(comment_count=model.comment_count + delta, updated_at=model.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def recompute_comment_counts(db: AsyncSession) -> dict:
+    """
+    comment_count를 comments 테이블의 실제 개수로 다시 계산합니다.
+
+    어긋난 행만 갱신하며 {"posts": 보정된 게시물 수, "issues": 보정된 이슈 수}를 반환합니다.
+    """
+    fixed = {}
+    for key, model, column in (("posts", Post, Comment.post_id), ("issues", Issue, Comment.issue_id)):
+        actual = select(func.count(Comment.id)).where(column == model.id).scalar_subquery()
+        result = await db.execute(
+            update(model)
+            .where(model.comment_count != actual)
+            .values(comment_count=actual, updated_at=model.updated_at)
+            .returning(model.id)
+            .execution_options(synchronize_session=False)
+        )
+        fixed[key] = len(result.all())
+    await db.commit()
+    return fixed
@@ -0,0 +1,153 @@
+"""
+응답 압축 (gzip / brotli)
+
+Accept-Encoding에 따라 brotli 또는 gzip으로 응답 본문을 압축하는 ASGI 미들웨어입니다.
+COMPRESSION_MIN_SIZE보다 작은 응답과 스트리밍 응답(SSE 알림 스트림 등)은 그대로 보냅니다.
+ETag가 있는 응답은 같은 ETag면 본문도 같으므로, 압축 결과를 (ETag, 인코딩) 키로
+LRU 캐시에 보관해 반복 조회 시 다시 압축하지 않습니다.
+"""
+import asyncio
+import gzip
+import os
+from collections import OrderedDict
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+
+# 이 크기(bytes) 이상인 응답만 압축
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 500))
+# gzip 압축 레벨 (1~9)
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+# brotli 압축 품질 (0~11, 높을수록 느림)
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 5))
+# ETag별 압축 결과를 보관할 최대 항목 수 (0이면 캐시 사용 안 함)
+COMPRESSION_CACHE_SIZE = int(os.getenv("COMPRESSION_CACHE_SIZE", 256))
+
+# 이 크기 이상이면 이벤트 루프를 막지 않도록 스레드 풀에서 압축
+_THREAD_MIN_SIZE = 64 * 1024
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/html", "text/plain", "text/css", "application/javascript")
+
+# (etag, encoding) -> (원본 길이, 압축된 본문) (가장 최근에 사용한 항목이 끝)
+_compressed_cache = OrderedDict()
+compression_stats = {"compressed": 0, "skipped": 0, "cache_hits": 0, "bytes_in": 0, "bytes_out": 0}
+
+
+def choose_encoding(accept_encoding: str):
+    """Accept-Encoding에서 사용할 인코딩 선택 (br > gzip, q=0은 제외)"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL)
+
+
+def describe_compression_cache() -> dict:
+    """압축 설정과 캐시 상태 (/api/compression)"""
+    return {
+        "min_size": COMPRESSION_MIN_SIZE,
+        "gzip_level": COMPRESSION_GZIP_LEVEL,
+        "brotli_quality": COMPRESSION_BROTLI_QUALITY,
+        "cache_size": len(_compressed_cache),
+        "cache_max_size": COMPRESSION_CACHE_SIZE,
+        **compression_stats,
+    }
+
+
+async def _compress_cached(body: bytes, encoding: str, etag: str) -> bytes:
+    key = (etag, encoding)
+    cached = _compressed_cache.get(key) if etag else None
+    if cached is not None and cached[0] == len(body):
+        compression_stats["cache_hits"] += 1
+        _compressed_cache.move_to_end(key)
+        return cached[1]
+
+    if len(body) >= _THREAD_MIN_SIZE:
+        loop = asyncio.get_running_loop()
+        compressed = await loop.run_in_executor(None, compress, body, encoding)
+    else:
+        compressed = compress(body, encoding)
+
+    if etag and COMPRESSION_CACHE_SIZE > 0:
+        _compressed_cache[key] = (len(body), compressed)
+        _compressed_cache.move_to_end(key)
+        while len(_compressed_cache) > COMPRESSION_CACHE_SIZE:
+            _compressed_cache.popitem(last=False)
+    return compressed
+
+
+class CompressionMiddleware:
+    """Accept-Encoding에 따라 응답을 brotli/gzip으로 압축하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or not content_type.startswith(_COMPRESSIBLE_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < COMPRESSION_MIN_SIZE:
+                # 스트리밍 응답이거나 작은 응답은 압축하지 않음
+                compression_stats["skipped"] += 1
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            etag = headers.get("etag")
+            compressed = await _compress_cached(body, encoding, etag)
+            compression_stats["compressed"] += 1
+            compression_stats["bytes_in"] += len(body)
+            compression_stats["bytes_out"] += len(compressed)
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
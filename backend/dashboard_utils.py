@@ -0,0 +1,143 @@
+"""
+스터디 대시보드 (GET /studies/{study_id}/dashboard)
+
+스터디 첫 화면에 필요한 정보(스터디, 멤버 수, 내 역할, 대기 중인 가입 요청 수,
+최근 게시물, 진행 중인 이슈)를 고정된 수의 쿼리로 조회합니다.
+
+1. 스터디 + 생성자 + 멤버 수 + 내 역할 + 대기 중인 가입 요청 수 (1개 쿼리)
+2. 최근 게시물과 진행 중인 이슈 (멤버일 때만, 별도 세션으로 동시에 실행하는 2개 쿼리)
+"""
+import asyncio
+import os
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import AsyncSessionLocal, Issue, JoinRequest, Post, Study, StudyMember, User
+from issue_utils import status_condition
+
+# 대시보드에 포함할 최근 게시물 수 기본값
+DASHBOARD_POST_LIMIT = int(os.getenv("DASHBOARD_POST_LIMIT", 5))
+# 대시보드에 포함할 진행 중인 이슈 최대 수
+DASHBOARD_ISSUE_LIMIT = int(os.getenv("DASHBOARD_ISSUE_LIMIT", 10))
+
+# 대시보드 조회의 쿼리 수 상한 (benchmark_dashboard.py에서 확인)
+DASHBOARD_MAX_QUERIES = 3
+
+
+def _author(row) -> dict:
+    return {"id": row.author_id, "username": row.author_username}
+
+
+async def _summary(db: AsyncSession, study_id: int, user_id: int):
+    member_count = select(func.count(StudyMember.id)).where(StudyMember.study_id == Study.id)
+    role = select(StudyMember.role).where(StudyMember.study_id == Study.id, StudyMember.user_id == user_id)
+    pending = select(func.count(JoinRequest.id)).where(
+        JoinRequest.study_id == Study.id, JoinRequest.status == "pending"
+    )
+    return (await db.execute(
+        select(
+            Study.id, Study.name, Study.description, Study.creator_id, Study.created_at, Study.updated_at,
+            User.username.label("creator_username"),
+            member_count.scalar_subquery().label("member_count"),
+            role.scalar_subquery().label("role"),
+            pending.scalar_subquery().label("pending_join_request_count"),
+        )
+        .join(Study.creator)
+        .where(Study.id == study_id, Study.deleted_at.is_(None))
+    )).first()
+
+
+async def _recent_posts(db: AsyncSession, study_id: int, limit: int) -> list:
+    rows = (await db.execute(
+        select(
+            Post.id, Post.title, Post.comment_count, Post.created_at,
+            User.id.label("author_id"), User.username.label("author_username"),
+        )
+        .join(Post.user)
+        .where(Post.study_id == study_id)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .limit(limit)
+    )).all()
+    items = []
+    for row in rows:
+        items.append({
+            "id": row.id,
+            "study_id": study_id,
+            "title": row.title,
+            "author": _author(row),
+            "comment_count": row.comment_count,
+            "created_at": row.created_at
+        })
+    return items
+
+
+async def _in_progress_issues(db: AsyncSession, study_id: int, today: date, limit: int) -> list:
+    rows = (await db.execute(
+        select(
+            Issue.id, Issue.title, Issue.start_date, Issue.end_date, Issue.comment_count, Issue.created_at,
+            User.id.label("author_id"), User.username.label("author_username"),
+        )
+        .join(Issue.user)
+        .where(Issue.study_id == study_id, status_condition("In Progress", today))
+        .order_by(Issue.created_at.desc(), Issue.id.desc())
+        .limit(limit)
+    )).all()
+    items = []
+    for row in rows:
+        items.append({
+            "id": row.id,
+            "study_id": study_id,
+            "title": row.title,
+            "status": "In Progress",
+            "start_date": row.start_date,
+            "end_date": row.end_date,
+            "author": _author(row),
+            "comment_count": row.comment_count,
+            "created_at": row.created_at
+        })
+    return items
+
+
+async def _in_new_session(query, *args):
+    async with AsyncSessionLocal() as db:
+        return await query(db, *args)
+
+
+async def get_study_dashboard(
+    db: AsyncSession, study_id: int, user_id: int, post_limit: int = DASHBOARD_POST_LIMIT
+) -> Optional[dict]:
+    """
+    스터디 대시보드 정보를 반환합니다 (스터디가 없으면 None).
+
+    멤버가 아니면 recent_posts / in_progress_issues는 None이고,
+    pending_join_request_count는 관리자에게만 포함됩니다.
+    """
+    summary = await _summary(db, study_id, user_id)
+    if summary is None:
+        return None
+
+    recent_posts = in_progress_issues = None
+    if summary.role is not None:
+        # 하나의 세션은 동시에 쿼리를 실행할 수 없으므로 이슈 조회는 별도 세션에서 실행
+        recent_posts, in_progress_issues = await asyncio.gather(
+            _recent_posts(db, study_id, post_limit),
+            _in_new_session(_in_progress_issues, study_id, date.today(), DASHBOARD_ISSUE_LIMIT),
+        )
+
+    return {
+        "id": summary.id,
+        "name": summary.name,
+        "description": summary.description,
+        "creator_id": summary.creator_id,
+        "created_at": summary.created_at,
+        "updated_at": summary.updated_at,
+        "creator": {"id": summary.creator_id, "username": summary.creator_username},
+        "member_count": summary.member_count,
+        "role": summary.role,
+        "pending_join_request_count": summary.pending_join_request_count if summary.role == "admin" else None,
+        "recent_posts": recent_posts,
+        "in_progress_issues": in_progress_issues,
+    }
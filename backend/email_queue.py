@@ -0,0 +1,207 @@
+"""
+메일 발송 큐 (백그라운드)
+
+요청 처리 중에는 메시지를 큐에 넣기만 하고, 백그라운드 작업이 큐를 비우며 발송합니다.
+SMTP 연결은 MAIL_POOL_SIZE 개까지 열어 둔 채 재사용하고(MAIL_IDLE_TIMEOUT_SECONDS 동안
+사용하지 않으면 닫음), 한 번에 최대 MAIL_BATCH_SIZE 개씩 묶어 연결별로 나눠 보냅니다.
+실패한 메시지는 지수 백오프로 MAIL_MAX_RETRIES 번까지 다시 시도합니다.
+
+큐는 프로세스 메모리에만 있으므로 서버가 종료되면 남은 메시지는 사라집니다
+(종료 시 MAIL_SHUTDOWN_TIMEOUT_SECONDS 동안 남은 메시지 발송을 기다림).
+"""
+import asyncio
+import logging
+import os
+import time
+from email.message import EmailMessage
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+# 큐에 쌓아 둘 수 있는 최대 메시지 수 (넘으면 버림)
+MAIL_QUEUE_MAX_SIZE = int(os.getenv("MAIL_QUEUE_MAX_SIZE", 1000))
+# 동시에 열어 둘 SMTP 연결 수
+MAIL_POOL_SIZE = int(os.getenv("MAIL_POOL_SIZE", 2))
+# 한 번에 꺼내 발송할 최대 메시지 수
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", 20))
+# 발송 실패 시 최대 재시도 횟수
+MAIL_MAX_RETRIES = int(os.getenv("MAIL_MAX_RETRIES", 5))
+# 첫 재시도 대기 시간 (초, 재시도마다 두 배)
+MAIL_RETRY_BASE_SECONDS = float(os.getenv("MAIL_RETRY_BASE_SECONDS", 2))
+# 사용하지 않는 SMTP 연결을 닫기까지의 시간 (초)
+MAIL_IDLE_TIMEOUT_SECONDS = float(os.getenv("MAIL_IDLE_TIMEOUT_SECONDS", 60))
+# 서버 종료 시 남은 메시지 발송을 기다리는 최대 시간 (초)
+MAIL_SHUTDOWN_TIMEOUT_SECONDS = float(os.getenv("MAIL_SHUTDOWN_TIMEOUT_SECONDS", 10))
+
+# (메시지, 시도 횟수)
+_queue = asyncio.Queue(maxsize=MAIL_QUEUE_MAX_SIZE)
+# 재시도 대기 중인 작업 (가비지 컬렉션 방지)
+_retry_tasks = set()
+mail_queue_stats = {"enqueued": 0, "sent": 0, "retried": 0, "failed": 0, "dropped": 0, "connections_opened": 0}
+
+
+def enqueue_mail(message: EmailMessage) -> bool:
+    """메시지를 발송 큐에 넣고 바로 반환 (큐가 가득 차면 False)"""
+    try:
+        _queue.put_nowait((message, 0))
+    except asyncio.QueueFull:
+        mail_queue_stats["dropped"] += 1
+        logger.error("Mail queue is full, dropping message to %s", message["To"])
+        return False
+    mail_queue_stats["enqueued"] += 1
+    return True
+
+
+class SMTPConnectionPool:
+    """로그인까지 마친 SMTP 연결을 열어 두고 재사용하는 풀"""
+
+    def __init__(self, connect_options: dict):
+        self.connect_options = connect_options
+        # (연결, 마지막 사용 시각)
+        self._idle = []
+
+    async def acquire(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            client, _ = self._idle.pop()
+            if not client.is_connected:
+                continue
+            try:
+                # 서버가 먼저 끊은 연결인지 확인 (새로 연결하는 것보다 훨씬 저렴)
+                await client.noop()
+                return client
+            except (aiosmtplib.SMTPException, OSError):
+                client.close()
+        client = aiosmtplib.SMTP(**self.connect_options)
+        await client.connect()
+        mail_queue_stats["connections_opened"] += 1
+        return client
+
+    def release(self, client: aiosmtplib.SMTP):
+        if client.is_connected and len(self._idle) < MAIL_POOL_SIZE:
+            self._idle.append((client, time.monotonic()))
+        else:
+            client.close()
+
+    async def close_idle(self, older_than: float = 0):
+        """older_than초 넘게 사용하지 않은 연결을 닫음"""
+        now = time.monotonic()
+        keep = []
+        for client, last_used in self._idle:
+            if now - last_used >= older_than:
+                try:
+                    await client.quit()
+                except aiosmtplib.SMTPException:
+                    client.close()
+            else:
+                keep.append((client, last_used))
+        self._idle = keep
+
+    def describe(self) -> dict:
+        return {"idle_connections": len(self._idle), "max_connections": MAIL_POOL_SIZE}
+
+
+async def _retry_later(item, delay: float):
+    await asyncio.sleep(delay)
+    try:
+        _queue.put_nowait(item)
+    except asyncio.QueueFull:
+        mail_queue_stats["dropped"] += 1
+        logger.error("Mail queue is full, dropping retried message to %s", item[0]["To"])
+
+
+def _schedule_retry(message: EmailMessage, attempt: int, error: Exception):
+    if attempt >= MAIL_MAX_RETRIES:
+        mail_queue_stats["failed"] += 1
+        logger.error("Giving up sending mail to %s after %d attempts: %s", message["To"], attempt + 1, error)
+        return
+    delay = MAIL_RETRY_BASE_SECONDS * (2 ** attempt)
+    mail_queue_stats["retried"] += 1
+    logger.warning("Mail to %s failed (%s), retrying in %.1fs", message["To"], error, delay)
+    task = asyncio.create_task(_retry_later((message, attempt + 1), delay))
+    _retry_tasks.add(task)
+    task.add_done_callback(_retry_tasks.discard)
+
+
+async def _send_chunk(pool: SMTPConnectionPool, chunk: list):
+    """하나의 연결로 메시지들을 차례로 발송 (연결이 끊기면 나머지는 재시도로 넘김)"""
+    try:
+        client = await pool.acquire()
+    except Exception as error:
+        for message, attempt in chunk:
+            _schedule_retry(message, attempt, error)
+        return
+
+    index = 0
+    try:
+        for index, (message, attempt) in enumerate(chunk):
+            try:
+                await client.send_message(message)
+                mail_queue_stats["sent"] += 1
+            except aiosmtplib.SMTPRecipientsRefused as error:
+                # 받는 주소가 거부된 경우는 다시 보내도 실패하므로 재시도하지 않음
+                mail_queue_stats["failed"] += 1
+                logger.error("Mail to %s refused: %s", message["To"], error)
+            except (aiosmtplib.SMTPException, OSError) as error:
+                _schedule_retry(message, attempt, error)
+                if not client.is_connected:
+                    for rest_message, rest_attempt in chunk[index + 1:]:
+                        _schedule_retry(rest_message, rest_attempt, error)
+                    break
+    except Exception as error:
+        # 예상하지 못한 오류(예: 잘못된 헤더)는 해당 메시지만 실패로 처리하고, 연결 상태를 알 수 없으므로
+        # 연결을 닫은 뒤 남은 메시지는 재시도로 넘김
+        mail_queue_stats["failed"] += 1
+        logger.exception("Unexpected error sending mail to %s", chunk[index][0]["To"])
+        client.close()
+        for rest_message, rest_attempt in chunk[index + 1:]:
+            _schedule_retry(rest_message, rest_attempt, error)
+    finally:
+        pool.release(client)
+
+
+async def send_batch(pool: SMTPConnectionPool, batch: list):
+    """메시지 묶음을 최대 MAIL_POOL_SIZE 개 연결에 나눠 동시에 발송"""
+    chunks = [batch[index::MAIL_POOL_SIZE] for index in range(min(MAIL_POOL_SIZE, len(batch)))]
+    await asyncio.gather(*(_send_chunk(pool, chunk) for chunk in chunks))
+
+
+async def run_mail_worker(pool: SMTPConnectionPool):
+    """큐에서 메시지를 MAIL_BATCH_SIZE 개씩 꺼내 발송하고, 한가할 때는 오래된 연결을 닫음"""
+    while True:
+        try:
+            first = await asyncio.wait_for(_queue.get(), timeout=MAIL_IDLE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            await pool.close_idle(MAIL_IDLE_TIMEOUT_SECONDS)
+            continue
+
+        batch = [first]
+        while len(batch) < MAIL_BATCH_SIZE and not _queue.empty():
+            batch.append(_queue.get_nowait())
+        try:
+            await send_batch(pool, batch)
+        except Exception:
+            logger.exception("Mail worker failed to send a batch")
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+async def drain_mail_queue(timeout: float = MAIL_SHUTDOWN_TIMEOUT_SECONDS) -> bool:
+    """큐에 남은 메시지가 모두 처리될 때까지 최대 timeout초 기다림 (재시도 대기 중인 메시지는 제외)"""
+    try:
+        await asyncio.wait_for(_queue.join(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        logger.warning("Mail queue not drained before shutdown (%d messages left)", _queue.qsize())
+        return False
+
+
+def describe_mail_queue(pool: SMTPConnectionPool = None) -> dict:
+    """메일 큐 상태 (/api/mail-queue)"""
+    return {
+        "queued": _queue.qsize(),
+        "retry_pending": len(_retry_tasks),
+        **(pool.describe() if pool else {}),
+        **mail_queue_stats,
+    }
@@ -1,33 +1,47 @@
+from email.message import EmailMessage
 from pydantic import EmailStr
 import os
 import logging
 
+from email_queue import SMTPConnectionPool, enqueue_mail
+
 logger = logging.getLogger(__name__)
 
 # SMTP 설정 여부 확인
 MAIL_USERNAME = os.getenv("MAIL_USERNAME", "")
 MAIL_PASSWORD = os.getenv("MAIL_PASSWORD", "")
-SMTP_CONFIGURED = bool(MAIL_USERNAME and MAIL_PASSWORD)
+MAIL_FROM = os.getenv("MAIL_FROM", MAIL_USERNAME or "noreply@localhost")
+# 로그인하지 않는 로컬 SMTP(mailpit 등)를 사용할 때는 False
+MAIL_USE_CREDENTIALS = os.getenv("MAIL_USE_CREDENTIALS", "True").lower() == "true"
+SMTP_CONFIGURED = bool(MAIL_USERNAME and MAIL_PASSWORD) or (
+    not MAIL_USE_CREDENTIALS and bool(os.getenv("MAIL_SERVER"))
+)
+
+# 백그라운드 메일 작업이 재사용하는 SMTP 연결 풀 (email_queue.py)
+smtp_pool = None
 
 if SMTP_CONFIGURED:
-    from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-    conf = ConnectionConfig(
-        MAIL_USERNAME=MAIL_USERNAME,
-        MAIL_PASSWORD=MAIL_PASSWORD,
-        MAIL_FROM=os.getenv("MAIL_FROM", MAIL_USERNAME),
-        MAIL_PORT=int(os.getenv("MAIL_PORT", 587)),
-        MAIL_SERVER=os.getenv("MAIL_SERVER", "smtp.gmail.com"),
-        MAIL_STARTTLS=os.getenv("MAIL_STARTTLS", "True").lower() == "true",
-        MAIL_SSL_TLS=os.getenv("MAIL_SSL_TLS", "False").lower() == "true",
-        USE_CREDENTIALS=True,
-        VALIDATE_CERTS=True,
-    )
+    smtp_pool = SMTPConnectionPool({
+        "hostname": os.getenv("MAIL_SERVER", "smtp.gmail.com"),
+        "port": int(os.getenv("MAIL_PORT", 587)),
+        "username": MAIL_USERNAME if MAIL_USE_CREDENTIALS else None,
+        "password": MAIL_PASSWORD if MAIL_USE_CREDENTIALS else None,
+        "start_tls": os.getenv("MAIL_STARTTLS", "True").lower() == "true",
+        "use_tls": os.getenv("MAIL_SSL_TLS", "False").lower() == "true",
+        "validate_certs": True,
+        "timeout": float(os.getenv("MAIL_TIMEOUT_SECONDS", 30)),
+    })
 else:
     logger.warning("SMTP not configured. Password reset links will be printed to console.")
 
 
 async def send_password_reset_email(email: EmailStr, reset_token: str):
-    """비밀번호 재설정 이메일 전송"""
+    """
+    비밀번호 재설정 이메일 전송
+
+    메시지를 메일 큐에 넣고 바로 반환하며, 실제 발송은 백그라운드 작업이 합니다.
+    큐가 가득 차 넣지 못하면 RuntimeError를 발생시킵니다.
+    """
     frontend_url = os.getenv("FRONTEND_URL", "http://localhost:3000")
     reset_link = f"{frontend_url}/reset-password?token={reset_token}"
 
@@ -39,7 +53,6 @@ async def send_password_reset_email(email: EmailStr, reset_token: str):
         logger.info(f"Password reset link for {email}: {reset_link}")
         return
 
-    from fastapi_mail import FastMail, MessageSchema, MessageType
     html_body = f"""<html>
 <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
 <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
@@ -63,12 +76,12 @@ async def send_password_reset_email(email: EmailStr, reset_token: str):
 </body>
 </html>"""
 
-    message = MessageSchema(
-        subject="[Study Together] 비밀번호 재설정",
-        recipients=[email],
-        body=html_body,
-        subtype=MessageType.html
-    )
+    message = EmailMessage()
+    message["Subject"] = "[Study Together] 비밀번호 재설정"
+    message["From"] = MAIL_FROM
+    message["To"] = email
+    message.set_content(f"비밀번호 재설정 링크 (1시간 후 만료): {reset_link}")
+    message.add_alternative(html_body, subtype="html")
 
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    if not enqueue_mail(message):
+        raise RuntimeError("Mail queue is full")
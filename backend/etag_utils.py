@@ -0,0 +1,73 @@
+"""
+ETag / 조건부 GET
+
+응답을 만들기 전에 가벼운 버전 쿼리(updated_at, 하위 컬렉션의 개수와 최대 id 등)로
+ETag를 계산하고, If-None-Match가 같으면 본문 없이 304 Not Modified를 반환합니다.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+
+from database import Comment, Post, User
+
+
+def make_etag(request: Request, *parts) -> str:
+    """
+    경로, 쿼리 문자열, 버전 값으로 약한(weak) ETag 생성
+
+    응답이 gzip/brotli로 압축되면 바이트가 달라지므로 약한 ETag를 사용합니다.
+    """
+    raw = repr((request.url.path, request.url.query, parts)).encode()
+    return 'W/"' + hashlib.sha256(raw).hexdigest()[:32] + '"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두어는 무시
+    etag = etag.removeprefix("W/")
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def conditional_response(request: Request, response: Response, *parts) -> Optional[Response]:
+    """
+    If-None-Match가 현재 ETag와 같으면 304 응답을 반환합니다.
+
+    다르면 응답에 ETag 헤더만 설정하고 None을 반환하므로 평소처럼 본문을 만들면 됩니다.
+    """
+    etag = make_etag(request, *parts)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def collection_version(db, query, model) -> tuple:
+    """
+    게시물/이슈 목록 쿼리와 같은 조건의 버전 값을 한 번의 쿼리로 조회합니다.
+
+    (행 수, 최대 id, 최근 수정 시각, 작성자 정보 수정 시각, 댓글 수 합계, 최대 댓글 id)
+    """
+    comment_parent = Comment.post_id if model is Post else Comment.issue_id
+    last_comment_id = (
+        select(func.max(Comment.id))
+        .where(comment_parent.in_(query.with_only_columns(model.id)))
+        .scalar_subquery()
+        .correlate(None)
+    )
+    return tuple((await db.execute(
+        query.join(model.user).with_only_columns(
+            func.count(model.id),
+            func.max(model.id),
+            func.max(model.updated_at),
+            func.max(User.updated_at),
+            func.sum(model.comment_count),
+            last_comment_id,
+        )
+    )).one())
@@ -0,0 +1,39 @@
+"""
+이슈 상태 계산
+
+이슈 상태(Scheduled / In Progress / Closed)는 저장하지 않고 시작일/종료일과 오늘 날짜로 계산합니다.
+"""
+from datetime import date
+
+from sqlalchemy import and_, or_
+
+from database import Issue
+
+
+def calculate_status(start_date: date, end_date: date) -> str:
+    """날짜를 기반으로 상태를 자동 계산"""
+    today = date.today()
+
+    if start_date is None and end_date is None:
+        return "In Progress"  # 날짜 미설정시 진행중으로
+
+    if start_date and today < start_date:
+        return "Scheduled"  # 시작일 전 = 예정
+
+    if end_date and today > end_date:
+        return "Closed"  # 종료일 후 = 완료
+
+    return "In Progress"  # 기간 내 = 진행중
+
+
+def status_condition(status_value: str, today: date):
+    """calculate_status와 동일한 규칙을 start_date/end_date 조건식으로 표현"""
+    started = or_(Issue.start_date.is_(None), Issue.start_date <= today)
+
+    if status_value == "Scheduled":
+        return and_(Issue.start_date.isnot(None), Issue.start_date > today)
+
+    if status_value == "Closed":
+        return and_(started, Issue.end_date.isnot(None), Issue.end_date < today)
+
+    return and_(started, or_(Issue.end_date.is_(None), Issue.end_date >= today))
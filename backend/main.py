@@ -1,16 +1,56 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from database import Base, engine, get_db
-from routes import auth_router, studies_router, posts_router, comments_router, issues_router, notifications_router
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from database import AsyncSessionLocal, engine
+from migrate import check_schema_version
+from pool_utils import describe_pool
+from notification_utils import run_unread_count_reconciler
+import notification_retention
+from markdown_utils import describe_render_cache
+from compression_utils import CompressionMiddleware, describe_compression_cache
+from study_cache import describe_study_cache
+from email_utils import SMTP_CONFIGURED, smtp_pool
+from email_queue import describe_mail_queue, drain_mail_queue, run_mail_worker
+from study_purge import run_study_purger
+from routes import auth_router, studies_router, posts_router, comments_router, issues_router, notifications_router, batch_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마 반영은 `python migrate.py`에서 하고, 시작 시에는 버전만 확인
+    await check_schema_version()
+    tasks = [
+        asyncio.create_task(run_unread_count_reconciler()),
+        asyncio.create_task(run_study_purger()),
+    ]
+    if notification_retention.RETENTION_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(notification_retention.run_notification_retention()))
+    if SMTP_CONFIGURED:
+        tasks.append(asyncio.create_task(run_mail_worker(smtp_pool)))
+    yield
+    if SMTP_CONFIGURED:
+        # 큐에 남은 메일을 보낼 시간을 준 뒤 종료
+        await drain_mail_queue()
+    for task in tasks:
+        task.cancel()
+    # 진행 중인 배치가 취소를 처리하고 커넥션을 돌려준 뒤에 엔진을 정리
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if SMTP_CONFIGURED:
+        await smtp_pool.close_idle()
+    await engine.dispose()
 
-# Create tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Study Together API",
     description="스터디 자료 공유 및 토론 플랫폼 API",
     version="0.1.0",
+    lifespan=lifespan,
+    # 모든 응답을 orjson으로 직렬화 (serialization_utils.py 참고)
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정
@@ -23,6 +63,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (gzip / brotli)
+app.add_middleware(CompressionMiddleware)
+
 # 라우트 등록
 app.include_router(auth_router, prefix="/api")
 app.include_router(studies_router, prefix="/api")
@@ -30,6 +73,7 @@ app.include_router(posts_router, prefix="/api")
 app.include_router(comments_router, prefix="/api")
 app.include_router(issues_router, prefix="/api")
 app.include_router(notifications_router, prefix="/api")
+app.include_router(batch_router, prefix="/api")
 
 @app.get("/")
 def read_root():
@@ -40,15 +84,44 @@ def health_check():
     return {"status": "healthy"}
 
 @app.get("/api/db-status")
-def db_status():
+async def db_status():
     try:
-        db = next(get_db())
-        db.execute("SELECT 1")
-        db.close()
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT 1"))
         return {"database": "connected"}
     except Exception as e:
         return {"database": "disconnected", "error": str(e)}
 
+@app.get("/api/db-pool")
+def db_pool_status():
+    return describe_pool(engine.pool)
+
+@app.get("/api/notification-retention")
+def notification_retention_status():
+    return {
+        "read_days": notification_retention.RETENTION_READ_DAYS,
+        "unread_cap_per_user": notification_retention.UNREAD_CAP_PER_USER,
+        "batch_size": notification_retention.RETENTION_BATCH_SIZE,
+        "interval_seconds": notification_retention.RETENTION_INTERVAL_SECONDS,
+        "last_run": notification_retention.last_retention_stats,
+    }
+
+@app.get("/api/render-cache")
+def render_cache_status():
+    return describe_render_cache()
+
+@app.get("/api/compression")
+def compression_status():
+    return describe_compression_cache()
+
+@app.get("/api/study-cache")
+def study_cache_status():
+    return describe_study_cache()
+
+@app.get("/api/mail-queue")
+def mail_queue_status():
+    return {"smtp_configured": SMTP_CONFIGURED, **describe_mail_queue(smtp_pool)}
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
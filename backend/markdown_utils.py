@@ -0,0 +1,93 @@
+"""
+게시물 Markdown 서버 렌더링
+
+게시물 작성/수정 시 한 번 렌더링해 posts.content_html에 저장하고,
+저장된 값이 없거나 내용과 맞지 않으면 내용 해시를 키로 하는 LRU 캐시에서 찾습니다.
+렌더링 결과는 nh3로 허용된 태그/속성만 남기도록 정리합니다.
+"""
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+
+import nh3
+from markdown_it import MarkdownIt
+
+# 렌더링 결과를 보관할 최대 항목 수
+MARKDOWN_RENDER_CACHE_SIZE = int(os.getenv("MARKDOWN_RENDER_CACHE_SIZE", 512))
+# 렌더링한 HTML을 게시물 행에 함께 저장할지 여부
+MARKDOWN_STORE_RENDERED_HTML = os.getenv("MARKDOWN_STORE_RENDERED_HTML", "True").lower() == "true"
+
+# 프론트엔드(react-markdown)와 같은 CommonMark, 원본 HTML 태그는 그대로 문자열로 출력
+_markdown = MarkdownIt("commonmark", {"html": False})
+
+# content_hash -> html (가장 최근에 사용한 항목이 끝)
+_render_cache = OrderedDict()
+render_cache_stats = {"hits": 0, "misses": 0, "renders": 0}
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def render_markdown(content: str) -> str:
+    """Markdown을 정리된(sanitized) HTML로 변환"""
+    render_cache_stats["renders"] += 1
+    return nh3.clean(_markdown.render(content), link_rel="noopener noreferrer nofollow")
+
+
+def _remember(digest: str, html: str):
+    _render_cache[digest] = html
+    _render_cache.move_to_end(digest)
+    while len(_render_cache) > MARKDOWN_RENDER_CACHE_SIZE:
+        _render_cache.popitem(last=False)
+
+
+def invalidate_rendered(content: str):
+    """이전 내용의 렌더링 결과를 캐시에서 제거"""
+    _render_cache.pop(content_hash(content), None)
+
+
+def describe_render_cache() -> dict:
+    """렌더링 캐시 상태 (/api/render-cache)"""
+    return {
+        "size": len(_render_cache),
+        "max_size": MARKDOWN_RENDER_CACHE_SIZE,
+        "store_rendered_html": MARKDOWN_STORE_RENDERED_HTML,
+        **render_cache_stats,
+    }
+
+
+async def get_rendered_html(content: str, stored_html: str = None, stored_hash: str = None) -> str:
+    """
+    Markdown 내용의 HTML을 반환합니다.
+
+    게시물에 저장된 HTML이 현재 내용과 같은 해시면 그대로 사용하고,
+    아니면 LRU 캐시를 확인한 뒤 없을 때만 스레드 풀에서 렌더링합니다.
+    """
+    digest = content_hash(content)
+    if stored_html is not None and stored_hash == digest:
+        render_cache_stats["hits"] += 1
+        return stored_html
+
+    html = _render_cache.get(digest)
+    if html is not None:
+        render_cache_stats["hits"] += 1
+        _render_cache.move_to_end(digest)
+        return html
+
+    render_cache_stats["misses"] += 1
+    loop = asyncio.get_running_loop()
+    html = await loop.run_in_executor(None, render_markdown, content)
+    _remember(digest, html)
+    return html
+
+
+async def store_rendered_html(post):
+    """게시물 작성/수정 시 렌더링 결과를 게시물에 저장 (MARKDOWN_STORE_RENDERED_HTML)"""
+    if not MARKDOWN_STORE_RENDERED_HTML:
+        post.content_html = None
+        post.content_hash = None
+        return
+    post.content_html = await get_rendered_html(post.content)
+    post.content_hash = content_hash(post.content)
@@ -0,0 +1,180 @@
+"""
+버전 기반 스키마 마이그레이션
+
+migrations/ 디렉터리의 NNNN_설명.sql 파일을 번호 순서대로 적용하고
+schema_migrations 테이블에 적용된 버전을 기록합니다.
+
+    python migrate.py            # 미적용 마이그레이션 적용
+    python migrate.py --status   # 현재/최신 스키마 버전 확인
+"""
+import asyncio
+import re
+import sys
+from pathlib import Path
+
+from sqlalchemy import inspect, text
+
+from database import Base, engine
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+# 여러 워커/컨테이너가 동시에 마이그레이션하지 않도록 잡는 advisory lock 키
+MIGRATION_LOCK_KEY = 7_420_011
+
+CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def load_migrations():
+    """(version, name, sql) 목록을 버전 순으로 반환"""
+    migrations = []
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        match = re.match(r"(\d+)_(.+)\.sql$", path.name)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), path.read_text(encoding="utf-8")))
+    return migrations
+
+
+MIGRATIONS = load_migrations()
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+
+def split_statements(sql: str):
+    """세미콜론으로 끝나는 줄 단위로 구문을 나눕니다. ($$ 로 감싼 함수 본문은 나누지 않음)"""
+    statements = []
+    current = []
+    in_dollar_quote = False
+    for line in sql.splitlines():
+        stripped = line.strip()
+        if not current and (not stripped or stripped.startswith("--")):
+            continue
+        current.append(line)
+        if line.count("$$") % 2 == 1:
+            in_dollar_quote = not in_dollar_quote
+        if not in_dollar_quote and stripped.endswith(";"):
+            statements.append("\n".join(current).rstrip().rstrip(";"))
+            current = []
+    if "".join(current).strip():
+        statements.append("\n".join(current))
+    return statements
+
+
+async def _current_version(conn) -> int:
+    has_table = await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table("schema_migrations"))
+    if not has_table:
+        return 0
+    return await conn.scalar(text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations"))
+
+
+def _existing_model_tables(sync_conn) -> list:
+    """ORM 모델에 정의된 테이블 중 이미 DB에 있는 테이블 이름"""
+    tables = set(inspect(sync_conn).get_table_names())
+    return sorted(name for name in Base.metadata.tables if name in tables)
+
+
+async def get_schema_version() -> int:
+    async with engine.connect() as conn:
+        return await _current_version(conn)
+
+
+async def check_schema_version():
+    """
+    앱 시작 시 스키마 버전만 확인합니다.
+
+    스키마 반영은 하지 않으며, 버전이 뒤처져 있으면 SchemaVersionError를 발생시킵니다.
+    """
+    version = await get_schema_version()
+    if version < LATEST_SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema version {version} is behind {LATEST_SCHEMA_VERSION}. "
+            "Run `python migrate.py` first."
+        )
+    return version
+
+
+async def migrate():
+    """
+    미적용 마이그레이션을 적용하고 적용된 버전 목록을 반환합니다.
+
+    PostgreSQL에서는 마이그레이션마다 하나의 트랜잭션으로 적용합니다.
+    그 외(로컬 SQLite 등)는 빈 DB에만 ORM 모델 기준으로 테이블을 만들고 최신 버전으로 기록합니다.
+    create_all은 기존 테이블을 변경하지 않으므로, 테이블이 이미 있는 DB는 버전을 올리지 않고
+    SchemaVersionError를 발생시킵니다 (DB를 지우고 다시 만들어야 함).
+    """
+    applied = []
+
+    if engine.dialect.name != "postgresql":
+        async with engine.begin() as conn:
+            await conn.execute(text(CREATE_VERSION_TABLE))
+            current = await _current_version(conn)
+            pending = [m for m in MIGRATIONS if m[0] > current]
+            if pending:
+                existing = await conn.run_sync(_existing_model_tables)
+                if current > 0 or existing:
+                    raise SchemaVersionError(
+                        f"The {engine.dialect.name} database is at schema version {current} and already has tables "
+                        f"({', '.join(existing)}). Migrations {', '.join(str(m[0]) for m in pending)} can only be "
+                        "applied on PostgreSQL; delete the local database and run `python migrate.py` again "
+                        "to recreate it from the models."
+                    )
+                await conn.run_sync(Base.metadata.create_all)
+                for version, name, _ in pending:
+                    await conn.execute(
+                        text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                        {"version": version, "name": name}
+                    )
+                    applied.append(version)
+        return applied
+
+    for version, name, sql in MIGRATIONS:
+        async with engine.begin() as conn:
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            await conn.execute(text(CREATE_VERSION_TABLE))
+            done = await conn.scalar(
+                text("SELECT 1 FROM schema_migrations WHERE version = :version"), {"version": version}
+            )
+            if done:
+                continue
+
+            for statement in split_statements(sql):
+                await conn.exec_driver_sql(statement)
+            await conn.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {"version": version, "name": name}
+            )
+        applied.append(version)
+
+    return applied
+
+
+async def _main(argv):
+    try:
+        if "--status" in argv:
+            version = await get_schema_version()
+            print(f"schema version: {version} (latest: {LATEST_SCHEMA_VERSION})")
+            return 0 if version >= LATEST_SCHEMA_VERSION else 1
+
+        try:
+            applied = await migrate()
+        except SchemaVersionError as error:
+            print(error)
+            return 1
+        if applied:
+            print(f"Applied migrations: {', '.join(str(v) for v in applied)}")
+        else:
+            print(f"Schema is up to date (version {LATEST_SCHEMA_VERSION})")
+        return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
@@ -1,28 +0,0 @@
--- Migration: Add password reset fields and notifications table
--- Run this in PostgreSQL
-
--- Add password reset fields to users table
-ALTER TABLE users ADD COLUMN IF NOT EXISTS password_reset_token VARCHAR(255) NULL;
-ALTER TABLE users ADD COLUMN IF NOT EXISTS password_reset_expires TIMESTAMP NULL;
-
--- Create notifications table
-CREATE TABLE IF NOT EXISTS notifications (
-    id SERIAL PRIMARY KEY,
-    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    notification_type VARCHAR(50) NOT NULL,
-    message TEXT NOT NULL,
-    post_id INTEGER REFERENCES posts(id) ON DELETE SET NULL,
-    issue_id INTEGER REFERENCES issues(id) ON DELETE SET NULL,
-    study_id INTEGER REFERENCES studies(id) ON DELETE SET NULL,
-    from_user_id INTEGER REFERENCES users(id) ON DELETE SET NULL,
-    is_read BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
-
--- Create indexes for faster queries
-CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON notifications(user_id);
-CREATE INDEX IF NOT EXISTS idx_notifications_is_read ON notifications(is_read);
-CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications(created_at);
-
--- Verify tables
-SELECT 'Migration completed successfully!' as status;
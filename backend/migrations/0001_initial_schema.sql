@@ -0,0 +1,133 @@
+-- 0001: 기준 스키마
+-- 기존 schema.sql + migration_*.sql 을 합친 상태입니다.
+-- 이미 운영 중인 DB에도 안전하게 적용되도록 모든 구문은 IF NOT EXISTS 로 작성합니다.
+
+-- Users Table
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    username VARCHAR(100) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS password_reset_token VARCHAR(255) NULL;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS password_reset_expires TIMESTAMP NULL;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS unread_notification_count INTEGER NOT NULL DEFAULT 0;
+
+-- Studies Table
+CREATE TABLE IF NOT EXISTS studies (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    description TEXT,
+    creator_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Study Members Table (스터디 멤버십)
+CREATE TABLE IF NOT EXISTS study_members (
+    id SERIAL PRIMARY KEY,
+    study_id INTEGER NOT NULL REFERENCES studies(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    role VARCHAR(50) DEFAULT 'member', -- 'admin' or 'member'
+    joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT _study_user_uc UNIQUE (study_id, user_id)
+);
+
+-- Posts Table
+CREATE TABLE IF NOT EXISTS posts (
+    id SERIAL PRIMARY KEY,
+    study_id INTEGER NOT NULL REFERENCES studies(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    title VARCHAR(255) NOT NULL,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Issues Table
+CREATE TABLE IF NOT EXISTS issues (
+    id SERIAL PRIMARY KEY,
+    study_id INTEGER NOT NULL REFERENCES studies(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    status VARCHAR(50) DEFAULT 'Scheduled',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE issues ADD COLUMN IF NOT EXISTS start_date DATE NULL;
+ALTER TABLE issues ADD COLUMN IF NOT EXISTS end_date DATE NULL;
+
+-- Comments Table (게시물 또는 이슈에 달리는 댓글)
+CREATE TABLE IF NOT EXISTS comments (
+    id SERIAL PRIMARY KEY,
+    post_id INTEGER REFERENCES posts(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE comments ALTER COLUMN post_id DROP NOT NULL;
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS issue_id INTEGER NULL REFERENCES issues(id) ON DELETE CASCADE;
+
+-- Join Requests Table (가입 요청)
+CREATE TABLE IF NOT EXISTS join_requests (
+    id SERIAL PRIMARY KEY,
+    study_id INTEGER NOT NULL REFERENCES studies(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    status VARCHAR(50) DEFAULT 'pending', -- pending, approved, rejected
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    reviewed_at TIMESTAMP NULL,
+    reviewed_by INTEGER NULL REFERENCES users(id) ON DELETE SET NULL,
+    CONSTRAINT _join_request_study_user_uc UNIQUE (study_id, user_id)
+);
+
+-- Notifications Table
+CREATE TABLE IF NOT EXISTS notifications (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    notification_type VARCHAR(50) NOT NULL,
+    message TEXT NOT NULL,
+    post_id INTEGER REFERENCES posts(id) ON DELETE SET NULL,
+    issue_id INTEGER REFERENCES issues(id) ON DELETE SET NULL,
+    study_id INTEGER REFERENCES studies(id) ON DELETE SET NULL,
+    from_user_id INTEGER REFERENCES users(id) ON DELETE SET NULL,
+    is_read BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 읽지 않은 알림 카운터 초기값 채우기
+UPDATE users u
+SET unread_notification_count = (
+    SELECT COUNT(*) FROM notifications n
+    WHERE n.user_id = u.id AND n.is_read = FALSE
+);
+
+-- Indexes
+CREATE INDEX IF NOT EXISTS idx_studies_creator_id ON studies(creator_id);
+CREATE INDEX IF NOT EXISTS idx_study_members_study_id ON study_members(study_id);
+CREATE INDEX IF NOT EXISTS idx_study_members_user_id ON study_members(user_id);
+CREATE INDEX IF NOT EXISTS idx_posts_study_id ON posts(study_id);
+CREATE INDEX IF NOT EXISTS idx_posts_user_id ON posts(user_id);
+CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id);
+CREATE INDEX IF NOT EXISTS idx_comments_user_id ON comments(user_id);
+CREATE INDEX IF NOT EXISTS idx_issues_study_id ON issues(study_id);
+CREATE INDEX IF NOT EXISTS idx_issues_user_id ON issues(user_id);
+CREATE INDEX IF NOT EXISTS idx_issues_status ON issues(status);
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON notifications(user_id);
+CREATE INDEX IF NOT EXISTS idx_notifications_is_read ON notifications(is_read);
+CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications(created_at);
+
+-- (created_at, id) 순서 조회용 복합 인덱스
+CREATE INDEX IF NOT EXISTS idx_studies_created_at_id ON studies(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_study_members_study_joined_at_id ON study_members(study_id, joined_at, id);
+CREATE INDEX IF NOT EXISTS idx_posts_study_created_at_id ON posts(study_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_issues_study_created_at_id ON issues(study_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_issues_study_dates ON issues(study_id, start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_notifications_user_created_at_id ON notifications(user_id, created_at, id);
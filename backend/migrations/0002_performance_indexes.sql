@@ -0,0 +1,17 @@
+-- 0002: 조회 패턴에 맞춘 인덱스 정리
+
+-- 읽지 않은 알림만 담는 부분 인덱스 (unread_only 목록, 읽지 않은 개수 보정)
+CREATE INDEX IF NOT EXISTS idx_notifications_user_unread_created_at
+    ON notifications(user_id, created_at DESC) WHERE NOT is_read;
+
+-- 게시물/이슈별 댓글을 작성 순서대로 조회
+CREATE INDEX IF NOT EXISTS idx_comments_post_created_at_id ON comments(post_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_comments_issue_created_at_id ON comments(issue_id, created_at, id);
+
+-- 복합 인덱스의 선두 컬럼과 겹치거나 선택도가 낮아 쓰기 비용만 늘리는 인덱스 제거
+DROP INDEX IF EXISTS idx_study_members_study_id;
+DROP INDEX IF EXISTS idx_posts_study_id;
+DROP INDEX IF EXISTS idx_comments_post_id;
+DROP INDEX IF EXISTS idx_issues_study_id;
+DROP INDEX IF EXISTS idx_notifications_user_id;
+DROP INDEX IF EXISTS idx_notifications_is_read;
@@ -0,0 +1,7 @@
+-- 0003: 스터디 소프트 삭제
+
+-- 삭제 요청 시각 (값이 있으면 조회에서 제외되고 백그라운드 작업이 하위 데이터를 정리)
+ALTER TABLE studies ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP NULL;
+
+-- 정리 대기 중인 스터디 조회용
+CREATE INDEX IF NOT EXISTS idx_studies_deleted_at ON studies(deleted_at) WHERE deleted_at IS NOT NULL;
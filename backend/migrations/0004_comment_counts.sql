@@ -0,0 +1,11 @@
+-- 0004: 게시물/이슈 댓글 수 비정규화 컬럼
+
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE issues ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0;
+
+-- 기존 댓글 수로 초기값 채우기
+UPDATE posts p
+SET comment_count = (SELECT COUNT(*) FROM comments c WHERE c.post_id = p.id);
+
+UPDATE issues i
+SET comment_count = (SELECT COUNT(*) FROM comments c WHERE c.issue_id = i.id);
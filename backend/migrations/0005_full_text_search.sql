@@ -0,0 +1,22 @@
+-- 0005: 스터디 내 전문 검색 (게시물/이슈/댓글)
+-- 생성 컬럼이라 INSERT/UPDATE 시 DB가 search_vector를 함께 갱신합니다.
+-- 한국어 형태소 사전이 없으므로 'simple' 설정을 쓰고, 검색 시 접두어 매칭(:*)을 사용합니다.
+
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+    ) STORED;
+
+ALTER TABLE issues ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED;
+
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_posts_search_vector ON posts USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_issues_search_vector ON issues USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_comments_search_vector ON comments USING GIN (search_vector);
@@ -0,0 +1,5 @@
+-- 0006: 게시물 Markdown 렌더링 결과 저장
+-- 기존 게시물은 NULL로 두고 다음 수정 시 채워지며, 그 전까지는 조회 시 렌더링 캐시를 사용합니다.
+
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS content_html TEXT NULL;
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) NULL;
@@ -0,0 +1,169 @@
+"""
+알림 보존 정책 (오래된 알림 정리)
+
+- 읽은 알림: NOTIFICATION_RETENTION_READ_DAYS 일이 지나면 삭제
+- 읽지 않은 알림: 사용자별 최신 NOTIFICATION_UNREAD_CAP_PER_USER 개만 유지
+
+작은 배치 단위로 삭제하고 배치마다 커밋하며, 다른 트랜잭션이 잡고 있는 행은
+SKIP LOCKED 로 건너뜁니다. 앱 lifespan에서 주기적으로 실행되거나 CLI로 실행합니다.
+
+    python notification_retention.py            # 한 번 실행
+    python notification_retention.py --vacuum   # 실행 후 VACUUM ANALYZE notifications
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select, text
+
+from database import AsyncSessionLocal, Notification, User, engine
+from notification_stream import mark_notifications_changed
+from notification_utils import adjust_unread_counts
+
+logger = logging.getLogger(__name__)
+
+# 읽은 알림 보존 기간 (일, 0이면 삭제 안 함)
+RETENTION_READ_DAYS = int(os.getenv("NOTIFICATION_RETENTION_READ_DAYS", 30))
+# 사용자별 읽지 않은 알림 최대 보존 수 (0이면 제한 없음)
+UNREAD_CAP_PER_USER = int(os.getenv("NOTIFICATION_UNREAD_CAP_PER_USER", 1000))
+# 한 번에 삭제할 행 수
+RETENTION_BATCH_SIZE = int(os.getenv("NOTIFICATION_RETENTION_BATCH_SIZE", 500))
+# 배치 사이 대기 시간 (초)
+RETENTION_PAUSE_SECONDS = float(os.getenv("NOTIFICATION_RETENTION_PAUSE_SECONDS", 0.2))
+# lifespan 실행 주기 (초, 0이면 앱에서 실행하지 않음)
+RETENTION_INTERVAL_SECONDS = int(os.getenv("NOTIFICATION_RETENTION_INTERVAL_SECONDS", 3600))
+
+# 마지막 실행 결과 (/api/notification-retention)
+last_retention_stats = None
+
+
+async def _purge_read_batch(cutoff: datetime) -> int:
+    async with AsyncSessionLocal() as db:
+        candidates = (
+            select(Notification.id)
+            .where(Notification.is_read == True, Notification.created_at < cutoff)
+            .order_by(Notification.id)
+            .limit(RETENTION_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            delete(Notification)
+            .where(Notification.id.in_(candidates))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount
+
+
+async def _purge_unread_batch(user_id: int) -> int:
+    async with AsyncSessionLocal() as db:
+        # 최신 UNREAD_CAP_PER_USER 개를 건너뛴 나머지 (부분 인덱스 사용)
+        candidates = (
+            select(Notification.id)
+            .where(Notification.user_id == user_id, Notification.is_read == False)
+            .order_by(Notification.created_at.desc(), Notification.id.desc())
+            .offset(UNREAD_CAP_PER_USER)
+            .limit(RETENTION_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            delete(Notification)
+            .where(Notification.id.in_(candidates), Notification.is_read == False)
+            .returning(Notification.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = len(result.all())
+        if deleted:
+            await adjust_unread_counts(db, {user_id: -deleted})
+            mark_notifications_changed(db, {user_id})
+        await db.commit()
+        return deleted
+
+
+async def purge_notifications() -> dict:
+    """
+    보존 정책에 따라 알림을 정리하고 결과를 반환합니다.
+
+    반환값: read_deleted, unread_deleted, batches, elapsed_seconds
+    """
+    global last_retention_stats
+
+    started = time.perf_counter()
+    stats = {"read_deleted": 0, "unread_deleted": 0, "batches": 0}
+
+    if RETENTION_READ_DAYS > 0:
+        cutoff = datetime.utcnow() - timedelta(days=RETENTION_READ_DAYS)
+        while True:
+            deleted = await _purge_read_batch(cutoff)
+            stats["batches"] += 1
+            stats["read_deleted"] += deleted
+            if deleted < RETENTION_BATCH_SIZE:
+                break
+            await asyncio.sleep(RETENTION_PAUSE_SECONDS)
+
+    if UNREAD_CAP_PER_USER > 0:
+        # 카운터로 한도를 넘은 사용자만 골라 처리
+        async with AsyncSessionLocal() as db:
+            user_ids = (await db.scalars(
+                select(User.id).where(User.unread_notification_count > UNREAD_CAP_PER_USER)
+            )).all()
+
+        for user_id in user_ids:
+            while True:
+                deleted = await _purge_unread_batch(user_id)
+                stats["batches"] += 1
+                stats["unread_deleted"] += deleted
+                if deleted < RETENTION_BATCH_SIZE:
+                    break
+                await asyncio.sleep(RETENTION_PAUSE_SECONDS)
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    stats["finished_at"] = datetime.utcnow()
+    last_retention_stats = stats
+    logger.info(
+        "Notification retention removed %d read and %d unread rows in %.3fs (%d batches)",
+        stats["read_deleted"], stats["unread_deleted"], stats["elapsed_seconds"], stats["batches"]
+    )
+    return stats
+
+
+async def vacuum_notifications():
+    """삭제 후 공간 재사용과 통계 갱신을 위해 VACUUM ANALYZE 실행 (PostgreSQL 전용)"""
+    if engine.dialect.name != "postgresql":
+        return
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM (ANALYZE) notifications"))
+
+
+async def run_notification_retention():
+    """RETENTION_INTERVAL_SECONDS마다 보존 정책을 실행하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(RETENTION_INTERVAL_SECONDS)
+        try:
+            await purge_notifications()
+        except Exception:
+            logger.exception("Notification retention failed")
+
+
+async def _main(argv):
+    try:
+        stats = await purge_notifications()
+        print(
+            f"Removed {stats['read_deleted']} read and {stats['unread_deleted']} unread notifications "
+            f"in {stats['elapsed_seconds']}s ({stats['batches']} batches)"
+        )
+        if "--vacuum" in argv:
+            await vacuum_notifications()
+            print("VACUUM ANALYZE notifications completed")
+        return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
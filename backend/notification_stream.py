@@ -0,0 +1,83 @@
+import asyncio
+import os
+from collections import defaultdict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from database import Notification
+
+# 워커당 최대 SSE 연결 수
+MAX_STREAM_CONNECTIONS = int(os.getenv("NOTIFICATION_STREAM_MAX_CONNECTIONS", 200))
+# 연결 유지를 위한 heartbeat 주기 (초)
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", 15))
+
+_SESSION_KEY = "changed_notification_user_ids"
+
+
+class StreamLimitExceeded(Exception):
+    pass
+
+
+class NotificationBroker:
+    """사용자별 SSE 연결을 관리하고 알림 변경 시 깨우는 워커 내 브로커"""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._subscribers = defaultdict(set)
+        self._connection_count = 0
+
+    @property
+    def connection_count(self) -> int:
+        return self._connection_count
+
+    def subscribe(self, user_id: int) -> asyncio.Event:
+        if self._connection_count >= self.max_connections:
+            raise StreamLimitExceeded()
+
+        wakeup = asyncio.Event()
+        self._subscribers[user_id].add(wakeup)
+        self._connection_count += 1
+        return wakeup
+
+    def unsubscribe(self, user_id: int, wakeup: asyncio.Event):
+        subscribers = self._subscribers.get(user_id)
+        if not subscribers or wakeup not in subscribers:
+            return
+
+        subscribers.discard(wakeup)
+        self._connection_count -= 1
+        if not subscribers:
+            del self._subscribers[user_id]
+
+    def publish(self, user_ids):
+        for user_id in user_ids:
+            for wakeup in self._subscribers.get(user_id, ()):
+                wakeup.set()
+
+
+broker = NotificationBroker(MAX_STREAM_CONNECTIONS)
+
+
+def mark_notifications_changed(db, user_ids):
+    """커밋 후 해당 사용자들의 스트림을 깨우도록 세션에 기록"""
+    db.info.setdefault(_SESSION_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_notifications(session, flush_context):
+    user_ids = {obj.user_id for obj in session.new if isinstance(obj, Notification)}
+    if user_ids:
+        mark_notifications_changed(session, user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_notifications(session):
+    user_ids = session.info.pop(_SESSION_KEY, None)
+    if user_ids:
+        broker.publish(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_notifications(session):
+    session.info.pop(_SESSION_KEY, None)
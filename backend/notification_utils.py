@@ -1,9 +1,166 @@
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import Integer, event, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import Notification, StudyMember
+from database import AsyncSessionLocal, Notification, StudyMember, User, engine
+from notification_stream import mark_notifications_changed
+
+logger = logging.getLogger(__name__)
+
+# 읽지 않은 알림 카운터를 실제 개수와 맞추는 주기 (초)
+UNREAD_COUNT_RECONCILE_SECONDS = int(os.getenv("UNREAD_COUNT_RECONCILE_SECONDS", 300))
+# 여러 워커 중 한 곳에서만 보정하도록 잡는 advisory lock 키
+UNREAD_COUNT_RECONCILE_LOCK_KEY = 7_420_010
+
+# user_id -> 읽지 않은 알림 수 (커밋된 값만 반영)
+_unread_counts = {}
+_SESSION_KEY = "pending_unread_counts"
+
+
+# ==================== Unread Counter ====================
+
+async def adjust_unread_counts(db: AsyncSession, deltas: dict):
+    """
+    users.unread_notification_count를 현재 트랜잭션 안에서 증감합니다.
+
+    - **deltas**: {user_id: 증감값}
+
+    갱신된 값은 커밋 후에 메모리 캐시에 반영됩니다.
+    카운터 변경은 프로필 변경이 아니므로 updated_at은 그대로 유지합니다.
+    """
+    user_ids_by_delta = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if delta:
+            user_ids_by_delta[delta].append(user_id)
+
+    for delta, user_ids in user_ids_by_delta.items():
+        result = await db.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(unread_notification_count=User.unread_notification_count + delta, updated_at=User.updated_at)
+            .returning(User.id, User.unread_notification_count)
+            .execution_options(synchronize_session=False)
+        )
+        db.info.setdefault(_SESSION_KEY, {}).update(result.tuples().all())
 
 
-def create_notification(
-    db: Session,
+async def reset_unread_count(db: AsyncSession, user_id: int):
+    """사용자의 읽지 않은 알림 카운터를 0으로 설정"""
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(unread_notification_count=0, updated_at=User.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.info.setdefault(_SESSION_KEY, {})[user_id] = 0
+
+
+async def get_user_unread_count(db: AsyncSession, user_id: int) -> int:
+    """읽지 않은 알림 수를 메모리에서 반환 (없으면 users 행 하나만 조회)"""
+    count = _unread_counts.get(user_id)
+    if count is None:
+        count = await db.scalar(select(User.unread_notification_count).where(User.id == user_id)) or 0
+        _unread_counts[user_id] = count
+    return count
+
+
+def _actual_unread_count():
+    return (
+        select(func.count(Notification.id))
+        .where(Notification.user_id == User.id, Notification.is_read == False)
+        .scalar_subquery()
+    )
+
+
+async def _reconcile_user(db: AsyncSession, user_id: int) -> bool:
+    """
+    한 사용자의 카운터를 짧은 트랜잭션에서 보정합니다 (보정했으면 True).
+
+    users 행을 먼저 잠근 뒤 개수를 세므로, 그 사이 커밋된 알림 생성/읽음 처리도 개수에 포함되고
+    아직 커밋되지 않은 변경은 잠금이 풀린 뒤 보정된 값에 더해집니다.
+    """
+    await db.execute(select(User.id).where(User.id == user_id).with_for_update())
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id, User.unread_notification_count != _actual_unread_count())
+        .values(unread_notification_count=_actual_unread_count(), updated_at=User.updated_at)
+        .returning(User.id, User.unread_notification_count)
+        .execution_options(synchronize_session=False)
+    )
+    fixed = result.tuples().all()
+    db.info.setdefault(_SESSION_KEY, {}).update(fixed)
+    await db.commit()
+    return bool(fixed)
+
+
+async def reconcile_unread_counts() -> Optional[int]:
+    """
+    카운터를 notifications 테이블의 실제 개수로 보정하고, 보정된 사용자 수를 반환합니다.
+
+    어긋난 사용자를 먼저 찾은 뒤 사용자마다 따로 보정합니다. PostgreSQL에서는 advisory lock으로
+    한 워커만 실행하며, 다른 워커가 실행 중이면 None을 반환합니다.
+    """
+    async with engine.connect() as lock_conn:
+        if engine.dialect.name == "postgresql":
+            locked = await lock_conn.scalar(
+                select(func.pg_try_advisory_lock(UNREAD_COUNT_RECONCILE_LOCK_KEY))
+            )
+            # 잠금은 세션 단위로 유지되므로 트랜잭션은 바로 끝냄
+            await lock_conn.commit()
+            if not locked:
+                return None
+        try:
+            async with AsyncSessionLocal() as db:
+                user_ids = (await db.scalars(
+                    select(User.id).where(User.unread_notification_count != _actual_unread_count())
+                )).all()
+
+            fixed = 0
+            for user_id in user_ids:
+                async with AsyncSessionLocal() as db:
+                    fixed += await _reconcile_user(db, user_id)
+            return fixed
+        finally:
+            if engine.dialect.name == "postgresql":
+                await lock_conn.execute(select(func.pg_advisory_unlock(UNREAD_COUNT_RECONCILE_LOCK_KEY)))
+                await lock_conn.commit()
+
+
+async def run_unread_count_reconciler():
+    """UNREAD_COUNT_RECONCILE_SECONDS마다 카운터를 보정하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(UNREAD_COUNT_RECONCILE_SECONDS)
+        # 다른 워커가 보정한 값을 다시 읽도록 이 워커의 캐시를 비움
+        _unread_counts.clear()
+        try:
+            fixed = await reconcile_unread_counts()
+            if fixed:
+                logger.warning("Reconciled unread notification counts for %d users", fixed)
+        except Exception:
+            logger.exception("Unread notification count reconciliation failed")
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_unread_counts(session):
+    counts = session.info.pop(_SESSION_KEY, None)
+    if counts:
+        _unread_counts.update(counts)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_unread_counts(session):
+    session.info.pop(_SESSION_KEY, None)
+
+
+# ==================== Notification Creation ====================
+
+async def create_notification(
+    db: AsyncSession,
     user_id: int,
     notification_type: str,
     message: str,
@@ -28,33 +185,50 @@ def create_notification(
     )
 
     db.add(notification)
+    await adjust_unread_counts(db, {user_id: 1})
     return notification
 
 
-def notify_study_members(
-    db: Session,
+async def notify_study_members(
+    db: AsyncSession,
     study_id: int,
     notification_type: str,
     message: str,
     exclude_user_id: int = None,
     post_id: int = None,
     issue_id: int = None,
-    from_user_id: int = None
-):
-    """스터디 멤버들에게 알림 전송"""
-    members = db.query(StudyMember).filter(StudyMember.study_id == study_id).all()
-
-    for member in members:
-        if exclude_user_id and member.user_id == exclude_user_id:
-            continue
-
-        create_notification(
-            db=db,
-            user_id=member.user_id,
-            notification_type=notification_type,
-            message=message,
-            post_id=post_id,
-            issue_id=issue_id,
-            study_id=study_id,
-            from_user_id=from_user_id
-        )
+    from_user_id: int = None,
+    role: str = None
+) -> int:
+    """
+    스터디 멤버들에게 알림 전송
+
+    study_members에서 대상을 골라 INSERT ... SELECT 한 번으로 DB 안에서 생성합니다.
+    멤버 수와 관계없이 ORM 객체를 만들지 않으며, 생성된 알림 수를 반환합니다.
+    """
+    recipients = select(
+        StudyMember.user_id,
+        literal(notification_type),
+        literal(message),
+        literal(post_id, Integer),
+        literal(issue_id, Integer),
+        literal(study_id, Integer),
+        literal(from_user_id, Integer),
+    ).where(StudyMember.study_id == study_id)
+
+    if role:
+        recipients = recipients.where(StudyMember.role == role)
+    # 제외 대상과 자기 자신에게는 알림 안 보냄
+    for user_id in {exclude_user_id, from_user_id} - {None}:
+        recipients = recipients.where(StudyMember.user_id != user_id)
+
+    result = await db.execute(
+        insert(Notification).from_select(
+            ["user_id", "notification_type", "message", "post_id", "issue_id", "study_id", "from_user_id"],
+            recipients
+        ).returning(Notification.user_id)
+    )
+    user_ids = result.scalars().all()
+    await adjust_unread_counts(db, {user_id: 1 for user_id in user_ids})
+    mark_notifications_changed(db, user_ids)
+    return len(user_ids)
@@ -0,0 +1,75 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select, tuple_
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id) 위치를 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """커서 문자열을 (created_at, id) 튜플로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+async def count_rows(db, stmt) -> int:
+    """조회 쿼리의 전체 행 수를 계산"""
+    return await db.scalar(select(func.count()).select_from(stmt.order_by(None).subquery()))
+
+
+def page_statement(stmt, created_col, id_col, limit: int, skip: int = 0, cursor: str = None, descending: bool = False):
+    """
+    조회 쿼리에 (created_at, id) 정렬, 커서/offset 조건, limit + 1을 적용합니다.
+
+    다른 쿼리의 서브쿼리로 쓰는 경우를 위해 실행하지 않고 구문만 반환합니다.
+    """
+    if descending:
+        stmt = stmt.order_by(created_col.desc(), id_col.desc())
+    else:
+        stmt = stmt.order_by(created_col.asc(), id_col.asc())
+
+    if cursor:
+        position = decode_cursor(cursor)
+        key = tuple_(created_col, id_col)
+        stmt = stmt.where(key < position if descending else key > position)
+    elif skip:
+        stmt = stmt.offset(skip)
+
+    return stmt.limit(limit + 1)
+
+
+def split_page(rows, limit: int, created_key: str = "created_at", id_key: str = "id"):
+    """limit + 1개로 조회한 행을 (rows, next_cursor)로 나눕니다."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, created_key), getattr(last, id_key))
+
+    return rows, next_cursor
+
+
+async def paginate(db, stmt, created_col, id_col, limit: int, skip: int = 0, cursor: str = None, descending: bool = False):
+    """
+    (created_at, id) 순서로 페이지를 조회합니다.
+
+    cursor가 주어지면 키셋 방식으로 해당 위치 이후의 행만 조회하고,
+    없으면 기존 skip/offset 방식으로 동작합니다.
+    limit + 1개를 조회해 다음 페이지 존재 여부를 판단하며 (rows, next_cursor)를 반환합니다.
+    """
+    stmt = page_statement(stmt, created_col, id_col, limit, skip=skip, cursor=cursor, descending=descending)
+    rows = (await db.scalars(stmt)).all()
+    return split_page(rows, limit, created_col.key, id_col.key)
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# 커넥션 체크아웃 대기 시간 히스토그램 구간 (ms)
+CHECKOUT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+
+class PoolStats:
+    """커넥션 풀 체크아웃 통계 수집기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self.buckets = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+
+    def record(self, wait: float, timed_out: bool = False):
+        wait_ms = wait * 1000
+        index = len(CHECKOUT_BUCKETS_MS)
+        for i, bound in enumerate(CHECKOUT_BUCKETS_MS):
+            if wait_ms <= bound:
+                index = i
+                break
+
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.buckets[index] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            histogram = {f"le_{bound}ms": count for bound, count in zip(CHECKOUT_BUCKETS_MS, self.buckets)}
+            histogram["gt_{}ms".format(CHECKOUT_BUCKETS_MS[-1])] = self.buckets[-1]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "checkout_latency_histogram": histogram,
+            }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 pool_stats에 기록하는 커넥션 풀"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_stats.record(time.perf_counter() - start)
+        return connection
+
+
+def describe_pool(pool) -> dict:
+    """현재 풀 상태(체크아웃/오버플로우)와 누적 통계를 반환"""
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    status.update(pool_stats.snapshot())
+    return status
@@ -0,0 +1,27 @@
+"""
+게시물/이슈 댓글 수 재계산
+
+posts.comment_count, issues.comment_count가 실제 댓글 수와 어긋났을 때
+(수동 삭제, 사용자 삭제에 따른 CASCADE 등) 실제 개수로 보정합니다.
+
+    python recompute_comment_counts.py
+"""
+import asyncio
+import sys
+
+from database import AsyncSessionLocal, engine
+from comment_utils import recompute_comment_counts
+
+
+async def _main():
+    try:
+        async with AsyncSessionLocal() as db:
+            fixed = await recompute_comment_counts(db)
+        print(f"Recomputed comment counts: {fixed['posts']} posts, {fixed['issues']} issues fixed")
+        return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
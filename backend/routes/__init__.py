@@ -4,6 +4,7 @@ from .posts_routes import router as posts_router
 from .comments_routes import router as comments_router
 from .issues_routes import router as issues_router
 from .notifications_routes import router as notifications_router
+from .batch_routes import router as batch_router
 
 __all__ = [
     "auth_router",
@@ -11,5 +12,6 @@ __all__ = [
     "posts_router",
     "comments_router",
     "issues_router",
-    "notifications_router"
+    "notifications_router",
+    "batch_router"
 ]
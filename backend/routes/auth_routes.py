@@ -1,30 +1,32 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 import secrets
 
-from database import SessionLocal, User, get_db
+from database import User, get_db
 from schemas import (
     UserCreate, UserLogin, UserResponse, Token,
     ForgotPasswordRequest, ForgotPasswordResponse,
     ResetPasswordRequest, ResetPasswordResponse,
-    UserUpdateRequest
+    UserUpdateRequest, Principal
 )
 from auth import (
     hash_password,
     verify_password,
     authenticate_user,
-    create_access_token,
+    create_user_token,
     get_current_user,
-    ACCESS_TOKEN_EXPIRE_MINUTES,
+    remember_token_state,
 )
 from email_utils import send_password_reset_email, SMTP_CONFIGURED
+from study_cache import invalidate_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     사용자 회원가입
     
@@ -33,7 +35,7 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     - **password**: 비밀번호 (최소 8자)
     """
     # 이메일 중복 체크
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -41,7 +43,7 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
         )
     
     # 새 사용자 생성
-    hashed_password = hash_password(user.password)
+    hashed_password = await hash_password(user.password)
     db_user = User(
         email=user.email,
         username=user.username,
@@ -49,14 +51,14 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
 
 @router.post("/login", response_model=Token)
-async def login(user: UserLogin, db: Session = Depends(get_db)):
+async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
     """
     사용자 로그인
     
@@ -66,7 +68,7 @@ async def login(user: UserLogin, db: Session = Depends(get_db)):
     성공 시 JWT 토큰 반환
     """
     # 사용자 인증
-    db_user = authenticate_user(db, user.email, user.password)
+    db_user = await authenticate_user(db, user.email, user.password)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,12 +76,8 @@ async def login(user: UserLogin, db: Session = Depends(get_db)):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # 토큰 생성
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": db_user.email},
-        expires_delta=access_token_expires,
-    )
+    # 토큰 생성 (사용자 ID, 사용자명, 토큰 버전 포함)
+    access_token = create_user_token(db_user)
     
     return {
         "access_token": access_token,
@@ -89,7 +87,7 @@ async def login(user: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
+async def logout(current_user: Principal = Depends(get_current_user)):
     """
     사용자 로그아웃
     
@@ -99,18 +97,21 @@ async def logout(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
     """
     현재 로그인한 사용자 정보 조회
     """
-    return current_user
+    return await db.get(User, current_user.id)
 
 
 @router.put("/me", response_model=UserResponse)
 async def update_profile(
     request: UserUpdateRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     회원 정보 수정
@@ -119,8 +120,9 @@ async def update_profile(
     - **current_password**: 현재 비밀번호 (비밀번호 변경 시 필수)
     - **new_password**: 새로운 비밀번호 (선택)
     """
-    user = db.query(User).filter(User.id == current_user.id).first()
+    user = await db.get(User, current_user.id)
 
+    username_changed = request.username is not None and request.username != user.username
     if request.username is not None:
         user.username = request.username
 
@@ -130,22 +132,28 @@ async def update_profile(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="현재 비밀번호를 입력해주세요"
             )
-        if not verify_password(request.current_password, user.password):
+        if not await verify_password(request.current_password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="현재 비밀번호가 일치하지 않습니다"
             )
-        user.password = hash_password(request.new_password)
-
-    db.commit()
-    db.refresh(user)
+        user.password = await hash_password(request.new_password)
+        # 기존에 발급된 토큰 무효화
+        user.token_version += 1
+
+    await db.commit()
+    await db.refresh(user)
+    remember_token_state(user)
+    if username_changed:
+        # 스터디 상세 캐시의 생성자/멤버 이름 갱신
+        invalidate_user(user.id)
     return user
 
 
 @router.post("/forgot-password", response_model=ForgotPasswordResponse)
 async def forgot_password(
     request: ForgotPasswordRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     비밀번호 재설정 이메일 전송
@@ -155,7 +163,7 @@ async def forgot_password(
     등록된 이메일이면 재설정 링크를 전송합니다.
     보안을 위해 이메일 존재 여부와 관계없이 동일한 응답을 반환합니다.
     """
-    user = db.query(User).filter(User.email == request.email).first()
+    user = await db.scalar(select(User).where(User.email == request.email))
 
     if user:
         # 토큰 생성 (URL-safe)
@@ -167,9 +175,9 @@ async def forgot_password(
         # DB에 저장
         user.password_reset_token = reset_token
         user.password_reset_expires = expires
-        db.commit()
+        await db.commit()
 
-        # 이메일 전송 (비동기)
+        # 메일 큐에 넣고 바로 응답 (발송은 백그라운드 작업이 처리)
         try:
             await send_password_reset_email(request.email, reset_token)
         except Exception as e:
@@ -193,7 +201,7 @@ async def forgot_password(
 @router.post("/reset-password", response_model=ResetPasswordResponse)
 async def reset_password(
     request: ResetPasswordRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     비밀번호 재설정
@@ -202,9 +210,9 @@ async def reset_password(
     - **new_password**: 새 비밀번호 (최소 8자)
     """
     # 토큰으로 사용자 찾기
-    user = db.query(User).filter(
+    user = await db.scalar(select(User).where(
         User.password_reset_token == request.token
-    ).first()
+    ))
 
     if not user:
         raise HTTPException(
@@ -217,17 +225,19 @@ async def reset_password(
         # 만료된 토큰 삭제
         user.password_reset_token = None
         user.password_reset_expires = None
-        db.commit()
+        await db.commit()
 
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="토큰이 만료되었습니다. 다시 요청해주세요."
         )
 
-    # 새 비밀번호 설정
-    user.password = hash_password(request.new_password)
+    # 새 비밀번호 설정 (기존에 발급된 토큰 무효화)
+    user.password = await hash_password(request.new_password)
     user.password_reset_token = None
     user.password_reset_expires = None
-    db.commit()
+    user.token_version += 1
+    await db.commit()
+    remember_token_state(user)
 
     return {"message": "비밀번호가 성공적으로 변경되었습니다."}
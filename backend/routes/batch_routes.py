@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import os
+from urllib.parse import unquote, urlsplit
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import Optional
+
+from schemas import BatchRequest, Principal
+from auth import get_current_user_optional, BATCH_PRINCIPAL_SCOPE_KEY
+from serialization_utils import json_response
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+logger = logging.getLogger(__name__)
+
+# 한 번에 보낼 수 있는 최대 하위 요청 수
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", 10))
+# 동시에 실행할 하위 요청 수 (각 요청이 DB 커넥션을 하나씩 사용)
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", 4))
+
+# 묶어서 호출할 수 없는 경로 (끝나지 않는 스트림, 배치 자신)
+_EXCLUDED_PATHS = ("/api/batch", "/api/notifications/stream")
+
+
+async def _dispatch(request: Request, principal: Optional[Principal], url: str, semaphore: asyncio.Semaphore) -> dict:
+    """하위 GET 요청을 앱 내부에서 실행하고 {status, etag, body}를 반환"""
+    parts = urlsplit(url)
+    path = "/api" + unquote(parts.path)
+    if parts.scheme or parts.netloc or not parts.path.startswith("/") or path.startswith(_EXCLUDED_PATHS):
+        return {"status": status.HTTP_400_BAD_REQUEST, "body": {"detail": "Unsupported batch url"}}
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": request.url.scheme,
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": ("/api" + parts.path).encode(),
+        "query_string": parts.query.encode(),
+        "headers": [(b"accept", b"application/json")],
+        # 배치 요청에서 한 번 인증한 사용자를 그대로 사용 (auth.get_current_user)
+        BATCH_PRINCIPAL_SCOPE_KEY: principal,
+    }
+    response_start = {}
+    chunks = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response_start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    async with semaphore:
+        try:
+            await request.app(scope, receive, send)
+        except Exception:
+            # 하위 요청 하나의 오류로 배치 전체가 실패하지 않도록 500으로 기록
+            logger.exception("Batch sub-request failed: %s", url)
+            response_start.setdefault("status", status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    headers = {key.decode(): value.decode() for key, value in response_start.get("headers", [])}
+    body = b"".join(chunks)
+    result = {"status": response_start.get("status", status.HTTP_500_INTERNAL_SERVER_ERROR)}
+    if "etag" in headers:
+        result["etag"] = headers["etag"]
+    if body and headers.get("content-type", "").startswith("application/json"):
+        # 이미 직렬화된 JSON을 다시 파싱하지 않고 그대로 삽입
+        result["body"] = orjson.Fragment(body)
+    else:
+        result["body"] = body.decode() if body else None
+    return result
+
+
+# ==================== 배치 요청 ====================
+@router.post("")
+async def batch(
+    batch_request: BatchRequest,
+    request: Request,
+    current_user: Optional[Principal] = Depends(get_current_user_optional),
+):
+    """
+    여러 GET 요청을 한 번에 실행
+
+    - **requests**: [{"id": "study", "url": "/studies/1"}, ...] (url은 /api 기준 경로)
+
+    인증은 배치 요청에서 한 번만 하고, 하위 요청은 BATCH_CONCURRENCY 개씩 동시에 실행합니다.
+    응답은 {"responses": [{"id", "status", "etag", "body"}, ...]} 이며 요청 순서와 같습니다.
+    """
+    if len(batch_request.requests) > BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {BATCH_MAX_REQUESTS} requests can be batched"
+        )
+    if len({item.id for item in batch_request.requests}) != len(batch_request.requests):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch request ids must be unique"
+        )
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    results = await asyncio.gather(*(
+        _dispatch(request, current_user, item.url, semaphore) for item in batch_request.requests
+    ))
+    return json_response({
+        "responses": [{"id": item.id, **result} for item, result in zip(batch_request.requests, results)]
+    })
@@ -1,23 +1,86 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select, true
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from typing import Optional
-from database import get_db, Comment, User, Post, Issue
-from schemas import CommentCreate, CommentUpdate, CommentResponse
+from database import get_db, Comment, User, Post, Issue, Study
+from schemas import CommentCreate, CommentUpdate, CommentResponse, CommentListResponse, Principal
 from auth import get_current_user
 from notification_utils import create_notification
+from comment_utils import COMMENT_PAGE_SIZE, adjust_comment_count, get_comment_page, thread_version
+from etag_utils import conditional_response
+from serialization_utils import json_response
 
 router = APIRouter(prefix="/comments", tags=["comments"])
 
 
+# ==================== 댓글 목록 조회 ====================
+@router.get("", response_model=CommentListResponse)
+async def get_comments(
+    request: Request,
+    response: Response,
+    post_id: Optional[int] = None,
+    issue_id: Optional[int] = None,
+    limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    게시물 또는 이슈의 댓글 목록 조회 (작성 순)
+
+    - **post_id**: 게시물 ID (쿼리 파라미터) - 포스트 댓글일 경우
+    - **issue_id**: 이슈 ID (쿼리 파라미터) - 이슈 댓글일 경우
+    - **limit**: 반환할 최대 항목 수
+    - **cursor**: 이전 응답 또는 상세 조회의 next_cursor
+    - **include_total**: 전체 개수 포함 여부
+
+    댓글이 바뀌지 않았으면 If-None-Match에 304로 응답합니다.
+    """
+    if bool(post_id) == bool(issue_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Exactly one of post_id or issue_id must be provided"
+        )
+
+    # 전체 개수는 게시물/이슈의 comment_count 컬럼에서 읽고, 같은 쿼리로 ETag용 버전 값도 조회
+    comments = thread_version(post_id, issue_id)
+    if post_id:
+        version = (await db.execute(
+            select(Post.comment_count, *comments.c).join(Post.study).join(comments, true())
+            .where(Post.id == post_id, Study.deleted_at.is_(None))
+        )).first()
+    else:
+        version = (await db.execute(
+            select(Issue.comment_count, *comments.c).join(Issue.study).join(comments, true())
+            .where(Issue.id == issue_id, Study.deleted_at.is_(None))
+        )).first()
+    if not version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found" if post_id else "Issue not found"
+        )
+
+    not_modified = conditional_response(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    total = version[0]
+    items, next_cursor = await get_comment_page(db, post_id=post_id, issue_id=issue_id, limit=limit, cursor=cursor)
+
+    return json_response(
+        {"total": total if include_total else None, "items": items, "next_cursor": next_cursor}, response
+    )
+
+
 # ==================== 포스트 댓글 작성 ====================
 @router.post("", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 async def create_comment(
     comment: CommentCreate,
     post_id: Optional[int] = None,
     issue_id: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     댓글 작성 (포스트 또는 이슈)
@@ -39,7 +102,7 @@ async def create_comment(
         )
 
     if post_id:
-        post = db.query(Post).filter(Post.id == post_id).first()
+        post = await db.scalar(select(Post).join(Post.study).where(Post.id == post_id, Study.deleted_at.is_(None)))
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -51,12 +114,13 @@ async def create_comment(
             content=comment.content
         )
         db.add(db_comment)
-        db.commit()
-        db.refresh(db_comment)
+        await adjust_comment_count(db, 1, post_id=post_id)
+        await db.commit()
+        await db.refresh(db_comment)
 
         # 알림: 게시물 작성자에게 알림
         if post.user_id != current_user.id:
-            create_notification(
+            await create_notification(
                 db=db,
                 user_id=post.user_id,
                 notification_type="post_comment",
@@ -65,9 +129,9 @@ async def create_comment(
                 study_id=post.study_id,
                 from_user_id=current_user.id
             )
-            db.commit()
+            await db.commit()
     else:
-        issue = db.query(Issue).filter(Issue.id == issue_id).first()
+        issue = await db.scalar(select(Issue).join(Issue.study).where(Issue.id == issue_id, Study.deleted_at.is_(None)))
         if not issue:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -79,12 +143,13 @@ async def create_comment(
             content=comment.content
         )
         db.add(db_comment)
-        db.commit()
-        db.refresh(db_comment)
+        await adjust_comment_count(db, 1, issue_id=issue_id)
+        await db.commit()
+        await db.refresh(db_comment)
 
         # 알림: 이슈 작성자에게 알림
         if issue.user_id != current_user.id:
-            create_notification(
+            await create_notification(
                 db=db,
                 user_id=issue.user_id,
                 notification_type="issue_comment",
@@ -93,7 +158,7 @@ async def create_comment(
                 study_id=issue.study_id,
                 from_user_id=current_user.id
             )
-            db.commit()
+            await db.commit()
 
     return db_comment
 
@@ -103,8 +168,8 @@ async def create_comment(
 async def update_comment(
     comment_id: int,
     comment_update: CommentUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     댓글 수정 (작성자만 가능)
@@ -112,7 +177,7 @@ async def update_comment(
     - **comment_id**: 댓글 ID
     - **content**: 새로운 댓글 내용
     """
-    db_comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    db_comment = await db.scalar(select(Comment).where(Comment.id == comment_id))
     
     if not db_comment:
         raise HTTPException(
@@ -128,8 +193,8 @@ async def update_comment(
     
     db_comment.content = comment_update.content
     
-    db.commit()
-    db.refresh(db_comment)
+    await db.commit()
+    await db.refresh(db_comment)
     
     return db_comment
 
@@ -138,15 +203,15 @@ async def update_comment(
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(
     comment_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     댓글 삭제 (작성자만 가능)
     
     - **comment_id**: 댓글 ID
     """
-    db_comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    db_comment = await db.scalar(select(Comment).where(Comment.id == comment_id))
     
     if not db_comment:
         raise HTTPException(
@@ -160,5 +225,6 @@ async def delete_comment(
             detail="Not authorized to delete this comment"
         )
     
-    db.delete(db_comment)
-    db.commit()
+    await adjust_comment_count(db, -1, post_id=db_comment.post_id, issue_id=db_comment.issue_id)
+    await db.delete(db_comment)
+    await db.commit()
@@ -1,45 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from datetime import date
+from typing import Optional
 
-from database import get_db, Issue, User, Study, Comment, StudyMember
-from schemas import IssueCreate, IssueUpdate, IssueResponse, IssueDetailResponse
+from database import get_db, Issue, User, Study, StudyMember
+from schemas import IssueCreate, IssueUpdate, IssueResponse, IssueDetailResponse, IssueListResponse, Principal
 from auth import get_current_user
 from notification_utils import notify_study_members
+from pagination_utils import count_rows, paginate
+from comment_utils import COMMENT_PAGE_SIZE, get_comment_page, thread_version
+from etag_utils import collection_version, conditional_response
+from issue_utils import calculate_status, status_condition
+from serialization_utils import json_response
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
 
-def calculate_status(start_date: date, end_date: date) -> str:
-    """날짜를 기반으로 상태를 자동 계산"""
-    today = date.today()
-
-    if start_date is None and end_date is None:
-        return "In Progress"  # 날짜 미설정시 진행중으로
-
-    if start_date and today < start_date:
-        return "Scheduled"  # 시작일 전 = 예정
-
-    if end_date and today > end_date:
-        return "Closed"  # 종료일 후 = 완료
-
-    return "In Progress"  # 기간 내 = 진행중
-
-
 # ==================== 이슈 목록 조회 (메인 보드) ====================
-@router.get("/study/{study_id}", response_model=dict)
+@router.get("/study/{study_id}", response_model=IssueListResponse)
 async def get_study_issues(
     study_id: int,
+    request: Request,
+    response: Response,
     status_filter: str = Query(None, pattern="^(Scheduled|In Progress|Closed)$"),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 이슈 목록 조회 (멤버만 가능)
+
+    - **cursor**: 이전 응답의 next_cursor (지정 시 skip 무시)
+    - **include_total**: 전체 개수 포함 여부
+
+    이슈/댓글이 바뀌지 않았으면 If-None-Match에 304로 응답합니다.
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
 
     if not study:
         raise HTTPException(
@@ -48,58 +49,86 @@ async def get_study_issues(
         )
 
     # 멤버 여부 확인
-    is_member = db.query(StudyMember).filter(
+    is_member = await db.scalar(select(StudyMember).where(
         StudyMember.study_id == study_id,
         StudyMember.user_id == current_user.id
-    ).first()
+    ))
     if not is_member:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="스터디 멤버만 이슈를 조회할 수 있습니다"
         )
 
-    # 모든 이슈를 가져와서 상태를 계산
-    all_issues = db.query(Issue).filter(Issue.study_id == study_id).all()
+    # 상태 필터를 날짜 조건으로 변환해 DB에서 필터링/페이지네이션
+    today = date.today()
+    query = select(Issue).where(Issue.study_id == study_id)
+    if status_filter:
+        query = query.where(status_condition(status_filter, today))
+
+    # 상태는 날짜로 계산되므로 오늘 날짜도 ETag에 포함
+    not_modified = conditional_response(request, response, today, *await collection_version(db, query, Issue))
+    if not_modified:
+        return not_modified
+
+    total = await count_rows(db, query) if include_total else None
+    issues, next_cursor = await paginate(
+        db, query.options(joinedload(Issue.user)), Issue.created_at, Issue.id, limit,
+        skip=skip, cursor=cursor
+    )
 
-    # 상태를 계산하고 필터링
     items = []
-    for issue in all_issues:
-        calculated_status = calculate_status(issue.start_date, issue.end_date)
-
-        # 필터링
-        if status_filter and calculated_status != status_filter:
-            continue
-
+    for issue in issues:
         items.append({
             "id": issue.id,
             "study_id": issue.study_id,
             "title": issue.title,
-            "status": calculated_status,
-            "start_date": issue.start_date.isoformat() if issue.start_date else None,
-            "end_date": issue.end_date.isoformat() if issue.end_date else None,
+            "status": calculate_status(issue.start_date, issue.end_date),
+            "start_date": issue.start_date,
+            "end_date": issue.end_date,
             "author": {
                 "id": issue.user.id,
                 "username": issue.user.username
             },
-            "created_at": issue.created_at.isoformat()
+            "comment_count": issue.comment_count,
+            "created_at": issue.created_at
         })
 
-    # 페이지네이션 적용
-    total = len(items)
-    items = items[skip:skip + limit]
-
-    return {"total": total, "items": items}
+    return json_response({"total": total, "items": items, "next_cursor": next_cursor}, response)
 
 
 # ==================== 이슈 상세 조회 ====================
 @router.get("/{issue_id}", response_model=dict)
-async def get_issue(issue_id: int, db: Session = Depends(get_db)):
+async def get_issue(
+    issue_id: int,
+    request: Request,
+    response: Response,
+    comment_limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    이슈 상세 조회
+    이슈 상세 조회 (댓글 첫 페이지 포함)
 
     - **issue_id**: 이슈 ID
+    - **comment_limit**: 함께 조회할 댓글 수 (나머지는 GET /comments?issue_id= 의 comments_next_cursor로 조회)
+
+    이슈/댓글이 바뀌지 않았으면 If-None-Match에 304로 응답합니다.
     """
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    comments = thread_version(issue_id=issue_id)
+    version = (await db.execute(
+        select(Issue.updated_at, Issue.comment_count, User.updated_at, *comments.c)
+        .join(Issue.study).join(Issue.user).join(comments, true())
+        .where(Issue.id == issue_id, Study.deleted_at.is_(None))
+    )).first()
+    if version:
+        # 상태는 날짜로 계산되므로 오늘 날짜도 ETag에 포함
+        not_modified = conditional_response(request, response, date.today(), *version)
+        if not_modified:
+            return not_modified
+
+    issue = await db.scalar(
+        select(Issue).join(Issue.study).options(joinedload(Issue.user))
+        .where(Issue.id == issue_id, Study.deleted_at.is_(None))
+    )
 
     if not issue:
         raise HTTPException(
@@ -107,44 +136,29 @@ async def get_issue(issue_id: int, db: Session = Depends(get_db)):
             detail="Issue not found"
         )
 
-    # Get comments for this issue
-    comments = db.query(Comment).filter(Comment.issue_id == issue_id).all()
-    comments_data = []
-    for comment in comments:
-        comments_data.append({
-            "id": comment.id,
-            "issue_id": comment.issue_id,
-            "user_id": comment.user_id,
-            "content": comment.content,
-            "created_at": comment.created_at.isoformat(),
-            "updated_at": comment.updated_at.isoformat(),
-            "author": {
-                "id": comment.user.id,
-                "username": comment.user.username,
-                "email": comment.user.email
-            }
-        })
+    comments_data, comments_next_cursor = await get_comment_page(db, issue_id=issue_id, limit=comment_limit)
 
     # 상태 자동 계산
     calculated_status = calculate_status(issue.start_date, issue.end_date)
 
-    return {
+    return json_response({
         "id": issue.id,
         "study_id": issue.study_id,
         "title": issue.title,
         "description": issue.description,
         "status": calculated_status,
-        "start_date": issue.start_date.isoformat() if issue.start_date else None,
-        "end_date": issue.end_date.isoformat() if issue.end_date else None,
+        "start_date": issue.start_date,
+        "end_date": issue.end_date,
         "author": {
             "id": issue.user.id,
             "username": issue.user.username
         },
-        "created_at": issue.created_at.isoformat(),
-        "updated_at": issue.updated_at.isoformat(),
+        "created_at": issue.created_at,
+        "updated_at": issue.updated_at,
         "comments": comments_data,
-        "comment_count": len(comments_data)
-    }
+        "comments_next_cursor": comments_next_cursor,
+        "comment_count": issue.comment_count
+    }, response)
 
 
 # ==================== 이슈 생성 ====================
@@ -152,8 +166,8 @@ async def get_issue(issue_id: int, db: Session = Depends(get_db)):
 async def create_issue(
     study_id: int,
     issue: IssueCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     이슈 생성
@@ -164,7 +178,7 @@ async def create_issue(
     - **start_date**: 시작일 (선택사항)
     - **end_date**: 종료일 (선택사항)
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
 
     if not study:
         raise HTTPException(
@@ -186,11 +200,11 @@ async def create_issue(
     )
 
     db.add(db_issue)
-    db.commit()
-    db.refresh(db_issue)
+    await db.commit()
+    await db.refresh(db_issue)
 
     # 스터디 멤버들에게 알림
-    notify_study_members(
+    await notify_study_members(
         db=db,
         study_id=study_id,
         notification_type="new_issue",
@@ -199,7 +213,7 @@ async def create_issue(
         issue_id=db_issue.id,
         from_user_id=current_user.id
     )
-    db.commit()
+    await db.commit()
 
     return {
         "id": db_issue.id,
@@ -208,10 +222,10 @@ async def create_issue(
         "title": db_issue.title,
         "description": db_issue.description,
         "status": initial_status,
-        "start_date": db_issue.start_date.isoformat() if db_issue.start_date else None,
-        "end_date": db_issue.end_date.isoformat() if db_issue.end_date else None,
-        "created_at": db_issue.created_at.isoformat(),
-        "updated_at": db_issue.updated_at.isoformat()
+        "start_date": db_issue.start_date,
+        "end_date": db_issue.end_date,
+        "created_at": db_issue.created_at,
+        "updated_at": db_issue.updated_at
     }
 
 
@@ -220,8 +234,8 @@ async def create_issue(
 async def update_issue(
     issue_id: int,
     issue_update: IssueUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     이슈 정보 수정
@@ -232,7 +246,7 @@ async def update_issue(
     - **start_date**: 시작일 (선택사항)
     - **end_date**: 종료일 (선택사항)
     """
-    db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    db_issue = await db.scalar(select(Issue).join(Issue.study).where(Issue.id == issue_id, Study.deleted_at.is_(None)))
 
     if not db_issue:
         raise HTTPException(
@@ -258,17 +272,17 @@ async def update_issue(
     # 날짜 기반으로 상태 재계산
     db_issue.status = calculate_status(db_issue.start_date, db_issue.end_date)
 
-    db.commit()
-    db.refresh(db_issue)
+    await db.commit()
+    await db.refresh(db_issue)
 
     return {
         "id": db_issue.id,
         "title": db_issue.title,
         "description": db_issue.description,
         "status": db_issue.status,
-        "start_date": db_issue.start_date.isoformat() if db_issue.start_date else None,
-        "end_date": db_issue.end_date.isoformat() if db_issue.end_date else None,
-        "updated_at": db_issue.updated_at.isoformat()
+        "start_date": db_issue.start_date,
+        "end_date": db_issue.end_date,
+        "updated_at": db_issue.updated_at
     }
 
 
@@ -276,15 +290,15 @@ async def update_issue(
 @router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_issue(
     issue_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     이슈 삭제 (생성자만 가능)
     
     - **issue_id**: 이슈 ID
     """
-    db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    db_issue = await db.scalar(select(Issue).join(Issue.study).where(Issue.id == issue_id, Study.deleted_at.is_(None)))
     
     if not db_issue:
         raise HTTPException(
@@ -298,5 +312,5 @@ async def delete_issue(
             detail="Not authorized to delete this issue"
         )
     
-    db.delete(db_issue)
-    db.commit()
+    await db.delete(db_issue)
+    await db.commit()
@@ -1,10 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import asyncio
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, func, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload
 from typing import List, Optional
 
-from database import get_db, Notification, User
-from schemas import NotificationResponse, NotificationListResponse, NotificationMarkReadRequest
-from auth import get_current_user
+from database import get_db, AsyncSessionLocal, Notification, User
+from schemas import NotificationResponse, NotificationListResponse, NotificationMarkReadRequest, Principal
+from auth import get_current_user, resolve_principal, create_stream_token, STREAM_TOKEN_EXPIRE_SECONDS, STREAM_TOKEN_SCOPE
+from pagination_utils import page_statement, split_page
+from notification_utils import adjust_unread_counts, get_user_unread_count, reset_unread_count
+from notification_stream import broker, mark_notifications_changed, StreamLimitExceeded, STREAM_HEARTBEAT_SECONDS
+
+# 알림 목록 조회의 쿼리 수 (페이지 + 발신자 + total/unread_count를 한 번에, check_query_counts.py에서 확인)
+NOTIFICATION_LIST_MAX_QUERIES = 1
+# 재연결 시 Last-Event-ID 이후로 재전송할 최대 알림 수
+STREAM_REPLAY_LIMIT = 100
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -14,8 +27,10 @@ async def get_notifications(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     unread_only: bool = Query(False),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     현재 사용자의 알림 목록 조회
@@ -23,19 +38,48 @@ async def get_notifications(
     - **skip**: 스킵할 항목 수
     - **limit**: 반환할 최대 항목 수
     - **unread_only**: 읽지 않은 알림만 조회
+    - **cursor**: 이전 응답의 next_cursor (지정 시 skip 무시)
+    - **include_total**: 전체 개수 포함 여부
+
+    페이지, 발신자, 전체/읽지 않은 개수를 NOTIFICATION_LIST_MAX_QUERIES 개의 쿼리로 조회합니다.
+    include_total이 false이면 읽지 않은 개수는 카운터에서 가져옵니다.
     """
-    query = db.query(Notification).filter(Notification.user_id == current_user.id)
+    query = select(Notification).where(Notification.user_id == current_user.id)
 
     if unread_only:
-        query = query.filter(Notification.is_read == False)
+        query = query.where(Notification.is_read == False)
 
-    total = query.count()
-    unread_count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False
-    ).count()
+    page = page_statement(
+        query, Notification.created_at, Notification.id, limit,
+        skip=skip, cursor=cursor, descending=True
+    ).subquery()
+    page_notification = aliased(Notification, page)
 
-    notifications = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
+    if include_total:
+        # 전체/읽지 않은 개수를 필터 집계로 함께 계산하고, 페이지가 비어도 한 행은 남도록 외부 조인
+        counts = select(
+            func.count(Notification.id).label("total"),
+            func.count(Notification.id).filter(Notification.is_read == False).label("unread_count"),
+        ).where(Notification.user_id == current_user.id).subquery()
+        stmt = select(page_notification, counts.c.total, counts.c.unread_count) \
+            .select_from(counts).outerjoin(page, true())
+    else:
+        stmt = select(page_notification)
+
+    rows = (await db.execute(
+        stmt.options(joinedload(page_notification.from_user))
+        .order_by(page.c.created_at.desc(), page.c.id.desc())
+    )).all()
+
+    if include_total:
+        total, unread_count = rows[0].total, rows[0].unread_count
+        if unread_only:
+            total = unread_count
+    else:
+        total = None
+        unread_count = await get_user_unread_count(db, current_user.id)
+
+    notifications, next_cursor = split_page([row[0] for row in rows if row[0] is not None], limit)
 
     items = []
     for notification in notifications:
@@ -62,45 +106,155 @@ async def get_notifications(
     return {
         "total": total,
         "unread_count": unread_count,
-        "items": items
+        "items": items,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/unread-count")
 async def get_unread_count(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """읽지 않은 알림 개수 조회"""
-    count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False
-    ).count()
+    count = await get_user_unread_count(db, current_user.id)
 
     return {"unread_count": count}
 
 
+@router.post("/stream-token")
+async def issue_stream_token(current_user: Principal = Depends(get_current_user)):
+    """
+    알림 스트림 연결용 토큰 발급
+
+    EventSource는 헤더를 설정할 수 없어 토큰을 URL 쿼리로 전달하므로, 프록시/서버 접근 로그에
+    남아도 되도록 스트림 연결에만 쓸 수 있고 STREAM_TOKEN_EXPIRE_SECONDS 후 만료되는 토큰을 발급합니다.
+    토큰은 연결할 때만 확인하므로 이미 열린 스트림은 만료 후에도 유지됩니다.
+    """
+    return {"token": create_stream_token(current_user), "expires_in": STREAM_TOKEN_EXPIRE_SECONDS}
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    token: Optional[str] = Query(None),
+    authorization: Optional[str] = Header(None),
+    last_event_id: Optional[int] = Header(None)
+):
+    """
+    알림 실시간 스트림 (Server-Sent Events)
+
+    - **token**: POST /notifications/stream-token으로 발급받은 스트림 토큰 (EventSource는 헤더를 설정할 수 없으므로 쿼리로 전달)
+    - **Authorization**: 헤더를 설정할 수 있는 클라이언트는 액세스 토큰을 그대로 사용
+    - **Last-Event-ID**: 재연결 시 마지막으로 받은 알림 ID 이후부터 재전송
+
+    새 알림은 `notification` 이벤트로, 읽지 않은 개수 변경은 `unread_count` 이벤트로 전송됩니다.
+    """
+    principal = None
+    if authorization:
+        parts = authorization.split()
+        if len(parts) == 2 and parts[0].lower() == "bearer":
+            principal = await resolve_principal(parts[1])
+    elif token:
+        # 쿼리의 토큰은 접근 로그에 남으므로 수명이 짧은 스트림 토큰만 허용
+        principal = await resolve_principal(token, scope=STREAM_TOKEN_SCOPE)
+
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        wakeup = broker.subscribe(principal.id)
+    except StreamLimitExceeded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many notification streams",
+            headers={"Retry-After": "10"},
+        )
+
+    async def events():
+        last_id = last_event_id
+        last_unread_count = None
+        try:
+            yield "retry: 3000\n\n"
+
+            # 첫 연결이면 현재 시점 이후의 알림만 전송
+            if last_id is None:
+                async with AsyncSessionLocal() as db:
+                    last_id = await db.scalar(
+                        select(func.coalesce(func.max(Notification.id), 0))
+                        .where(Notification.user_id == principal.id)
+                    )
+
+            while True:
+                wakeup.clear()
+                async with AsyncSessionLocal() as db:
+                    notifications = (await db.scalars(
+                        select(Notification)
+                        .options(joinedload(Notification.from_user))
+                        .where(Notification.user_id == principal.id, Notification.id > last_id)
+                        .order_by(Notification.id)
+                        .limit(STREAM_REPLAY_LIMIT)
+                    )).all()
+                    unread_count = await get_user_unread_count(db, principal.id)
+
+                for notification in notifications:
+                    last_id = notification.id
+                    data = NotificationResponse.model_validate(notification).model_dump_json()
+                    yield f"id: {notification.id}\nevent: notification\ndata: {data}\n\n"
+
+                if unread_count != last_unread_count:
+                    last_unread_count = unread_count
+                    yield f"event: unread_count\ndata: {{\"unread_count\": {unread_count}}}\n\n"
+
+                # 재전송 한도를 채웠으면 남은 알림을 바로 이어서 전송
+                if len(notifications) == STREAM_REPLAY_LIMIT:
+                    continue
+
+                while not wakeup.is_set():
+                    if await request.is_disconnected():
+                        return
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=STREAM_HEARTBEAT_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": heartbeat\n\n"
+        finally:
+            broker.unsubscribe(principal.id, wakeup)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.put("/read")
 async def mark_notifications_read(
     request: NotificationMarkReadRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     알림 읽음 처리
 
     - **notification_ids**: 읽음 처리할 알림 ID 목록 (없으면 전체)
     """
-    query = db.query(Notification).filter(
+    stmt = update(Notification).where(
         Notification.user_id == current_user.id,
         Notification.is_read == False
     )
 
     if request.notification_ids:
-        query = query.filter(Notification.id.in_(request.notification_ids))
+        stmt = stmt.where(Notification.id.in_(request.notification_ids))
 
-    updated_count = query.update({"is_read": True}, synchronize_session=False)
-    db.commit()
+    result = await db.execute(stmt.values(is_read=True))
+    updated_count = result.rowcount
+    await adjust_unread_counts(db, {current_user.id: -updated_count})
+    mark_notifications_changed(db, {current_user.id})
+    await db.commit()
 
     return {"updated_count": updated_count}
 
@@ -108,14 +262,14 @@ async def mark_notifications_read(
 @router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_notification(
     notification_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """알림 삭제"""
-    notification = db.query(Notification).filter(
+    notification = await db.scalar(select(Notification).where(
         Notification.id == notification_id,
         Notification.user_id == current_user.id
-    ).first()
+    ))
 
     if not notification:
         raise HTTPException(
@@ -123,17 +277,22 @@ async def delete_notification(
             detail="Notification not found"
         )
 
-    db.delete(notification)
-    db.commit()
+    await db.delete(notification)
+    if not notification.is_read:
+        await adjust_unread_counts(db, {current_user.id: -1})
+    mark_notifications_changed(db, {current_user.id})
+    await db.commit()
 
 
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_all_notifications(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """모든 알림 삭제"""
-    db.query(Notification).filter(
+    await db.execute(delete(Notification).where(
         Notification.user_id == current_user.id
-    ).delete()
-    db.commit()
+    ))
+    await reset_unread_count(db, current_user.id)
+    mark_notifications_changed(db, {current_user.id})
+    await db.commit()
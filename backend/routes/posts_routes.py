@@ -1,29 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, undefer
+from typing import Optional
 
-from database import get_db, Post, User, Study, Comment, StudyMember
+from database import get_db, Post, User, Study, StudyMember
 from schemas import (
-    PostCreate, PostUpdate, PostResponse, PostDetailResponse, PostListItemResponse
+    PostCreate, PostUpdate, PostResponse, PostDetailResponse, PostListItemResponse, PostListResponse,
+    Principal
 )
 from auth import get_current_user
 from notification_utils import notify_study_members
+from pagination_utils import count_rows, paginate
+from comment_utils import COMMENT_PAGE_SIZE, get_comment_page, thread_version
+from etag_utils import collection_version, conditional_response
+from markdown_utils import get_rendered_html, invalidate_rendered, store_rendered_html
+from serialization_utils import json_response
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
 
 # ==================== 스터디별 게시물 목록 조회 ====================
-@router.get("/study/{study_id}", response_model=dict)
+@router.get("/study/{study_id}", response_model=PostListResponse)
 async def get_study_posts(
     study_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디별 게시물 목록 조회 (멤버만 가능)
+
+    - **cursor**: 이전 응답의 next_cursor (지정 시 skip 무시)
+    - **include_total**: 전체 개수 포함 여부
+
+    게시물/댓글이 바뀌지 않았으면 If-None-Match에 304로 응답합니다.
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
 
     if not study:
         raise HTTPException(
@@ -32,22 +50,28 @@ async def get_study_posts(
         )
 
     # 멤버 여부 확인
-    is_member = db.query(StudyMember).filter(
+    is_member = await db.scalar(select(StudyMember).where(
         StudyMember.study_id == study_id,
         StudyMember.user_id == current_user.id
-    ).first()
+    ))
     if not is_member:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="스터디 멤버만 게시물을 조회할 수 있습니다"
         )
     
-    total = db.query(Post).filter(Post.study_id == study_id).count()
-    posts = db.query(Post).filter(Post.study_id == study_id).offset(skip).limit(limit).all()
+    query = select(Post).where(Post.study_id == study_id)
+    not_modified = conditional_response(request, response, *await collection_version(db, query, Post))
+    if not_modified:
+        return not_modified
+
+    total = await count_rows(db, query) if include_total else None
+    posts, next_cursor = await paginate(
+        db, query.options(joinedload(Post.user)), Post.created_at, Post.id, limit, skip=skip, cursor=cursor
+    )
     
     items = []
     for post in posts:
-        comment_count = db.query(Comment).filter(Comment.post_id == post.id).count()
         items.append({
             "id": post.id,
             "study_id": post.study_id,
@@ -56,22 +80,47 @@ async def get_study_posts(
                 "id": post.user.id,
                 "username": post.user.username
             },
-            "comment_count": comment_count,
-            "created_at": post.created_at.isoformat()
+            "comment_count": post.comment_count,
+            "created_at": post.created_at
         })
     
-    return {"total": total, "items": items}
+    return json_response({"total": total, "items": items, "next_cursor": next_cursor}, response)
 
 
 # ==================== 게시물 상세 조회 ====================
 @router.get("/{post_id}", response_model=dict)
-async def get_post(post_id: int, db: Session = Depends(get_db)):
+async def get_post(
+    post_id: int,
+    request: Request,
+    response: Response,
+    comment_limit: int = Query(COMMENT_PAGE_SIZE, ge=1, le=100),
+    render: Optional[str] = Query(None, pattern="^html$"),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    게시물 상세 조회 (댓글 포함)
+    게시물 상세 조회 (댓글 첫 페이지 포함)
     
     - **post_id**: 게시물 ID
+    - **comment_limit**: 함께 조회할 댓글 수 (나머지는 GET /comments?post_id= 의 comments_next_cursor로 조회)
+    - **render**: html이면 서버에서 렌더링한 content_html 포함
+
+    게시물/댓글이 바뀌지 않았으면 If-None-Match에 304로 응답합니다.
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
+    comments = thread_version(post_id=post_id)
+    version = (await db.execute(
+        select(Post.updated_at, Post.comment_count, User.updated_at, *comments.c)
+        .join(Post.study).join(Post.user).join(comments, true())
+        .where(Post.id == post_id, Study.deleted_at.is_(None))
+    )).first()
+    if version:
+        not_modified = conditional_response(request, response, *version)
+        if not_modified:
+            return not_modified
+
+    query = select(Post).join(Post.study).options(joinedload(Post.user))
+    if render == "html":
+        query = query.options(undefer(Post.content_html))
+    post = await db.scalar(query.where(Post.id == post_id, Study.deleted_at.is_(None)))
     
     if not post:
         raise HTTPException(
@@ -79,35 +128,28 @@ async def get_post(post_id: int, db: Session = Depends(get_db)):
             detail="Post not found"
         )
     
-    comments = db.query(Comment).filter(Comment.post_id == post_id).all()
-    comments_data = []
-    
-    for comment in comments:
-        comments_data.append({
-            "id": comment.id,
-            "content": comment.content,
-            "author": {
-                "id": comment.user.id,
-                "username": comment.user.username
-            },
-            "created_at": comment.created_at.isoformat(),
-            "updated_at": comment.updated_at.isoformat()
-        })
+    comments_data, comments_next_cursor = await get_comment_page(db, post_id=post_id, limit=comment_limit)
+
+    content_html = None
+    if render == "html":
+        content_html = await get_rendered_html(post.content, post.content_html, post.content_hash)
     
-    return {
+    return json_response({
         "id": post.id,
         "study_id": post.study_id,
         "title": post.title,
         "content": post.content,
+        "content_html": content_html,
         "author": {
             "id": post.user.id,
             "username": post.user.username
         },
-        "created_at": post.created_at.isoformat(),
-        "updated_at": post.updated_at.isoformat(),
+        "created_at": post.created_at,
+        "updated_at": post.updated_at,
         "comments": comments_data,
-        "comment_count": len(comments_data)
-    }
+        "comments_next_cursor": comments_next_cursor,
+        "comment_count": post.comment_count
+    }, response)
 
 
 # ==================== 게시물 작성 ====================
@@ -115,8 +157,8 @@ async def get_post(post_id: int, db: Session = Depends(get_db)):
 async def create_post(
     study_id: int,
     post: PostCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     게시물 작성
@@ -125,7 +167,7 @@ async def create_post(
     - **title**: 게시물 제목
     - **content**: 게시물 내용 (Markdown 형식)
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     
     if not study:
         raise HTTPException(
@@ -139,13 +181,14 @@ async def create_post(
         title=post.title,
         content=post.content
     )
+    await store_rendered_html(db_post)
 
     db.add(db_post)
-    db.commit()
-    db.refresh(db_post)
+    await db.commit()
+    await db.refresh(db_post)
 
     # 스터디 멤버들에게 알림
-    notify_study_members(
+    await notify_study_members(
         db=db,
         study_id=study_id,
         notification_type="new_post",
@@ -154,7 +197,7 @@ async def create_post(
         post_id=db_post.id,
         from_user_id=current_user.id
     )
-    db.commit()
+    await db.commit()
 
     return db_post
 
@@ -164,8 +207,8 @@ async def create_post(
 async def update_post(
     post_id: int,
     post_update: PostUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     게시물 수정 (작성자만 가능)
@@ -174,7 +217,7 @@ async def update_post(
     - **title**: 새로운 제목 (선택사항)
     - **content**: 새로운 내용 (선택사항)
     """
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    db_post = await db.scalar(select(Post).join(Post.study).where(Post.id == post_id, Study.deleted_at.is_(None)))
     
     if not db_post:
         raise HTTPException(
@@ -190,11 +233,13 @@ async def update_post(
     
     if post_update.title is not None:
         db_post.title = post_update.title
-    if post_update.content is not None:
+    if post_update.content is not None and post_update.content != db_post.content:
+        invalidate_rendered(db_post.content)
         db_post.content = post_update.content
+        await store_rendered_html(db_post)
     
-    db.commit()
-    db.refresh(db_post)
+    await db.commit()
+    await db.refresh(db_post)
     
     return db_post
 
@@ -203,15 +248,15 @@ async def update_post(
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     게시물 삭제 (작성자만 가능)
     
     - **post_id**: 게시물 ID
     """
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    db_post = await db.scalar(select(Post).join(Post.study).where(Post.id == post_id, Study.deleted_at.is_(None)))
     
     if not db_post:
         raise HTTPException(
@@ -225,5 +270,5 @@ async def delete_post(
             detail="Not authorized to delete this post"
         )
     
-    db.delete(db_post)
-    db.commit()
+    await db.delete(db_post)
+    await db.commit()
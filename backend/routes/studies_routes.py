@@ -1,71 +1,157 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from datetime import datetime
 
-from database import get_db, Study, User, StudyMember, Post, Issue, Comment, Notification, JoinRequest
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import and_, case, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Optional
+
+from database import get_db, Study, User, StudyMember, JoinRequest
 from schemas import (
-    StudyCreate, StudyUpdate, StudyResponse, StudyDetailResponse,
+    StudyCreate, StudyUpdate, StudyResponse, StudyDetailResponse, StudyListResponse,
     StudyMemberCreate, StudyMemberResponse, StudyMemberWithUserResponse,
-    PaginatedResponse, JoinRequestResponse
+    PaginatedResponse, JoinRequestResponse, StudyDeletionResponse, Principal
 )
 from auth import get_current_user, get_current_user_optional
-from notification_utils import create_notification
+from notification_utils import create_notification, notify_study_members
+from study_purge import get_purge_progress, get_remaining_counts, request_purge
+from pagination_utils import count_rows, paginate
+from search_utils import parse_search_terms, search_study
+from etag_utils import conditional_response
+from serialization_utils import json_response
+from study_cache import cache_study, get_cached_study, invalidate_study
+from dashboard_utils import DASHBOARD_POST_LIMIT, get_study_dashboard
 
 router = APIRouter(prefix="/studies", tags=["studies"])
 
+# 스터디 목록 조회의 쿼리 수 상한 (total, 페이지, 멤버 집계, 가입 요청, check_query_counts.py에서 확인)
+STUDY_LIST_MAX_QUERIES = 4
+
+
+def study_to_dict(study: Study) -> dict:
+    """StudyResponse와 같은 형태의 dict (datetime은 응답 직렬화 시 변환)"""
+    return {
+        "id": study.id,
+        "name": study.name,
+        "description": study.description,
+        "creator_id": study.creator_id,
+        "created_at": study.created_at,
+        "updated_at": study.updated_at,
+    }
+
 
 # ==================== 스터디 목록 조회 ====================
-@router.get("", response_model=dict)
+@router.get("", response_model=StudyListResponse)
 async def get_studies(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    current_user: User = Depends(get_current_user_optional),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    current_user: Principal = Depends(get_current_user_optional),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 목록 조회
 
     - **skip**: 스킵할 항목 수
     - **limit**: 반환할 최대 항목 수
-    """
-    total = db.query(Study).count()
-    studies = db.query(Study).offset(skip).limit(limit).all()
+    - **cursor**: 이전 응답의 next_cursor (지정 시 skip 무시)
+    - **include_total**: 전체 개수 포함 여부
 
-    items = []
-    for study in studies:
-        member_count = db.query(StudyMember).filter(StudyMember.study_id == study.id).count()
-        is_member = False
-        has_pending_request = False
+    페이지 크기와 관계없이 최대 STUDY_LIST_MAX_QUERIES 개의 쿼리만 실행합니다.
+    """
+    query = select(Study).where(Study.deleted_at.is_(None))
+    total = await count_rows(db, query) if include_total else None
+    studies, next_cursor = await paginate(
+        db, query, Study.created_at, Study.id, limit, skip=skip, cursor=cursor
+    )
+    study_ids = [study.id for study in studies]
+
+    # 페이지에 포함된 스터디의 멤버 수와 현재 사용자의 멤버 여부를 한 번에 집계
+    member_counts = {}
+    member_study_ids = set()
+    pending_study_ids = set()
+    if study_ids:
+        columns = [StudyMember.study_id, func.count(StudyMember.id)]
         if current_user:
-            is_member = db.query(StudyMember).filter(
-                StudyMember.study_id == study.id,
-                StudyMember.user_id == current_user.id
-            ).first() is not None
-            if not is_member:
-                has_pending_request = db.query(JoinRequest).filter(
-                    JoinRequest.study_id == study.id,
+            columns.append(func.max(case((StudyMember.user_id == current_user.id, 1), else_=0)))
+        rows = (await db.execute(
+            select(*columns).where(
+                StudyMember.study_id.in_(study_ids)
+            ).group_by(StudyMember.study_id)
+        )).all()
+        for row in rows:
+            member_counts[row[0]] = row[1]
+            if current_user and row[2]:
+                member_study_ids.add(row[0])
+
+        # 멤버가 아닌 스터디에 대한 대기 중인 가입 요청
+        non_member_ids = [sid for sid in study_ids if sid not in member_study_ids]
+        if current_user and non_member_ids:
+            pending_study_ids = set((await db.scalars(
+                select(JoinRequest.study_id).where(
+                    JoinRequest.study_id.in_(non_member_ids),
                     JoinRequest.user_id == current_user.id,
                     JoinRequest.status == "pending"
-                ).first() is not None
+                )
+            )).all())
+
+    items = []
+    for study in studies:
         items.append({
-            **StudyResponse.from_orm(study).dict(),
-            "member_count": member_count,
-            "is_member": is_member,
-            "has_pending_request": has_pending_request
+            **study_to_dict(study),
+            "member_count": member_counts.get(study.id, 0),
+            "is_member": study.id in member_study_ids,
+            "has_pending_request": study.id in pending_study_ids
         })
 
-    return {"total": total, "items": items}
+    return json_response({"total": total, "items": items, "next_cursor": next_cursor})
 
 
 # ==================== 스터디 상세 조회 ====================
 @router.get("/{study_id}", response_model=dict)
-async def get_study(study_id: int, db: Session = Depends(get_db)):
+async def get_study(study_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db)):
     """
     스터디 상세 조회
     
     - **study_id**: 스터디 ID
+
+    스터디/멤버가 바뀌지 않았으면 If-None-Match에 304로 응답하고,
+    본문은 버전이 같으면 스터디 상세 캐시(study_cache.py)에서 가져옵니다.
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    members = (
+        select(
+            func.count(StudyMember.id).label("member_count"),
+            func.max(StudyMember.id).label("last_member_id"),
+            func.max(User.updated_at).label("members_updated_at"),
+        )
+        .join(StudyMember.user)
+        .where(StudyMember.study_id == study_id)
+        .subquery()
+    )
+    version = (await db.execute(
+        select(Study.updated_at, User.updated_at, *members.c)
+        .join(Study.creator).join(members, true())
+        .where(Study.id == study_id, Study.deleted_at.is_(None))
+    )).first()
+    if not version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Study not found"
+        )
+
+    not_modified = conditional_response(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    version = tuple(version)
+    payload = get_cached_study(study_id, version)
+    if payload is not None:
+        return json_response(payload, response)
+
+    study = await db.scalar(
+        select(Study).options(joinedload(Study.creator)).where(Study.id == study_id, Study.deleted_at.is_(None))
+    )
     
     if not study:
         raise HTTPException(
@@ -73,31 +159,37 @@ async def get_study(study_id: int, db: Session = Depends(get_db)):
             detail="Study not found"
         )
     
-    # 멤버 정보 조회
-    members = db.query(StudyMember).filter(StudyMember.study_id == study_id).all()
+    # 멤버 정보 조회 (사용자 정보와 한 번에)
+    rows = (await db.execute(
+        select(StudyMember.role, StudyMember.joined_at, User.id, User.username)
+        .join(StudyMember.user)
+        .where(StudyMember.study_id == study_id)
+        .order_by(StudyMember.id)
+    )).all()
     members_data = []
-    for member in members:
-        user = db.query(User).filter(User.id == member.user_id).first()
+    for row in rows:
         members_data.append({
-            "id": user.id,
-            "username": user.username,
-            "role": member.role,
-            "joined_at": member.joined_at.isoformat()
+            "id": row.id,
+            "username": row.username,
+            "role": row.role,
+            "joined_at": row.joined_at
         })
     
-    return {
-        **StudyResponse.from_orm(study).dict(),
+    payload = {
+        **study_to_dict(study),
         "creator": {"id": study.creator.id, "username": study.creator.username},
         "members": members_data
     }
+    cache_study(study_id, version, payload)
+    return json_response(payload, response)
 
 
 # ==================== 스터디 생성 ====================
 @router.post("", response_model=StudyResponse, status_code=status.HTTP_201_CREATED)
 async def create_study(
     study: StudyCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 생성
@@ -106,7 +198,7 @@ async def create_study(
     - **description**: 스터디 설명 (선택사항)
     """
     # 스터디 이름 중복 체크
-    existing = db.query(Study).filter(Study.name == study.name).first()
+    existing = await db.scalar(select(Study).where(Study.name == study.name, Study.deleted_at.is_(None)))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -120,8 +212,8 @@ async def create_study(
     )
 
     db.add(db_study)
-    db.commit()
-    db.refresh(db_study)
+    await db.commit()
+    await db.refresh(db_study)
     
     # 생성자를 자동으로 멤버에 추가 (admin)
     creator_member = StudyMember(
@@ -130,7 +222,7 @@ async def create_study(
         role="admin"
     )
     db.add(creator_member)
-    db.commit()
+    await db.commit()
     
     return db_study
 
@@ -140,8 +232,8 @@ async def create_study(
 async def update_study(
     study_id: int,
     study_update: StudyUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 수정 (생성자만 가능)
@@ -150,7 +242,7 @@ async def update_study(
     - **name**: 새로운 스터디 이름 (선택사항)
     - **description**: 새로운 설명 (선택사항)
     """
-    db_study = db.query(Study).filter(Study.id == study_id).first()
+    db_study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     
     if not db_study:
         raise HTTPException(
@@ -169,25 +261,29 @@ async def update_study(
     if study_update.description is not None:
         db_study.description = study_update.description
     
-    db.commit()
-    db.refresh(db_study)
+    await db.commit()
+    await db.refresh(db_study)
+    invalidate_study(study_id)
     
     return db_study
 
 
 # ==================== 스터디 삭제 ====================
-@router.delete("/{study_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{study_id}", response_model=StudyDeletionResponse, status_code=status.HTTP_202_ACCEPTED)
 async def delete_study(
     study_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 삭제 (생성자만 가능)
     
     - **study_id**: 스터디 ID
+
+    스터디는 즉시 조회에서 제외되고, 게시물/이슈/댓글/알림은 백그라운드에서 정리됩니다.
+    진행 상황은 GET /studies/{study_id}/deletion 으로 확인합니다.
     """
-    db_study = db.query(Study).filter(Study.id == study_id).first()
+    db_study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     
     if not db_study:
         raise HTTPException(
@@ -201,25 +297,128 @@ async def delete_study(
             detail="Not authorized to delete this study"
         )
 
-    # 관련 알림 삭제
-    db.query(Notification).filter(Notification.study_id == study_id).delete()
-    # 게시물/이슈의 댓글 삭제
-    post_ids = [p.id for p in db.query(Post).filter(Post.study_id == study_id).all()]
-    issue_ids = [i.id for i in db.query(Issue).filter(Issue.study_id == study_id).all()]
-    if post_ids:
-        db.query(Notification).filter(Notification.post_id.in_(post_ids)).delete(synchronize_session=False)
-        db.query(Comment).filter(Comment.post_id.in_(post_ids)).delete(synchronize_session=False)
-    if issue_ids:
-        db.query(Notification).filter(Notification.issue_id.in_(issue_ids)).delete(synchronize_session=False)
-        db.query(Comment).filter(Comment.issue_id.in_(issue_ids)).delete(synchronize_session=False)
-    # 게시물, 이슈, 멤버, 가입 요청 삭제
-    db.query(Post).filter(Post.study_id == study_id).delete()
-    db.query(Issue).filter(Issue.study_id == study_id).delete()
-    db.query(StudyMember).filter(StudyMember.study_id == study_id).delete()
-    db.query(JoinRequest).filter(JoinRequest.study_id == study_id).delete()
-    # 스터디 삭제
-    db.delete(db_study)
-    db.commit()
+    db_study.deleted_at = datetime.utcnow()
+    await db.commit()
+    invalidate_study(study_id)
+    request_purge()
+
+    return {"study_id": study_id, "status": "pending", "deleted_at": db_study.deleted_at}
+
+
+# ==================== 스터디 삭제 진행 상황 ====================
+@router.get("/{study_id}/deletion", response_model=StudyDeletionResponse)
+async def get_study_deletion(
+    study_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    스터디 삭제 진행 상황 조회 (생성자만 가능)
+
+    - **study_id**: 스터디 ID
+    """
+    progress = get_purge_progress(study_id)
+    db_study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.isnot(None)))
+
+    if not db_study:
+        # 정리가 끝나 스터디 행이 삭제된 경우 (이 워커에서 처리한 것만 알 수 있음)
+        if progress and progress["status"] == "completed":
+            return {**progress, "study_id": study_id, "remaining": dict.fromkeys(progress["removed"], 0)}
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Study deletion not found"
+        )
+
+    if db_study.creator_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this study deletion"
+        )
+
+    return {
+        "study_id": study_id,
+        "status": progress["status"] if progress else "pending",
+        "deleted_at": db_study.deleted_at,
+        "removed": progress["removed"] if progress else {},
+        "remaining": await get_remaining_counts(db, study_id),
+    }
+
+
+# ==================== 스터디 내 검색 ====================
+@router.get("/{study_id}/search", response_model=dict)
+async def search_study_content(
+    study_id: int,
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=50),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    스터디의 게시물/이슈/댓글 전문 검색 (멤버만 가능)
+
+    - **q**: 검색어 (모든 단어를 포함하는 항목을 접두어 일치로 검색)
+    - **skip**: 건너뛸 항목 수
+    - **limit**: 반환할 최대 항목 수
+
+    결과는 관련도 순이며 title/snippet의 일치 구간은 <mark>로 표시됩니다.
+    """
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
+
+    if not study:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Study not found"
+        )
+
+    is_member = await db.scalar(select(StudyMember).where(
+        StudyMember.study_id == study_id,
+        StudyMember.user_id == current_user.id
+    ))
+    if not is_member:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="스터디 멤버만 검색할 수 있습니다"
+        )
+
+    terms = parse_search_terms(q)
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must contain at least one word"
+        )
+
+    items, has_more = await search_study(db, study_id, terms, limit=limit, skip=skip)
+    return {"query": q, "items": items, "has_more": has_more}
+
+
+# ==================== 스터디 대시보드 ====================
+@router.get("/{study_id}/dashboard", response_model=dict)
+async def get_dashboard(
+    study_id: int,
+    post_limit: int = Query(DASHBOARD_POST_LIMIT, ge=1, le=20),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    스터디 대시보드 조회
+
+    - **study_id**: 스터디 ID
+    - **post_limit**: 함께 조회할 최근 게시물 수
+
+    스터디 정보, 멤버 수, 내 역할(role), 최근 게시물, 진행 중인 이슈,
+    대기 중인 가입 요청 수(관리자만)를 최대 DASHBOARD_MAX_QUERIES 개의 쿼리로 조회합니다.
+    멤버가 아니면 게시물/이슈는 null입니다.
+    """
+    dashboard = await get_study_dashboard(db, study_id, current_user.id, post_limit)
+
+    if dashboard is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Study not found"
+        )
+
+    return json_response(dashboard)
 
 
 # ==================== 스터디 멤버 추가 ====================
@@ -227,8 +426,8 @@ async def delete_study(
 async def add_study_member(
     study_id: int,
     member: StudyMemberCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 멤버 추가
@@ -236,7 +435,7 @@ async def add_study_member(
     - **study_id**: 스터디 ID
     - **email**: 추가할 사용자 이메일
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
 
     if not study:
         raise HTTPException(
@@ -245,7 +444,7 @@ async def add_study_member(
         )
 
     # 이메일로 사용자 조회
-    user_to_add = db.query(User).filter(User.email == member.email).first()
+    user_to_add = await db.scalar(select(User).where(User.email == member.email))
     if not user_to_add:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -253,9 +452,9 @@ async def add_study_member(
         )
 
     # 이미 멤버인지 확인
-    existing_member = db.query(StudyMember).filter(
+    existing_member = await db.scalar(select(StudyMember).where(
         and_(StudyMember.study_id == study_id, StudyMember.user_id == user_to_add.id)
-    ).first()
+    ))
 
     if existing_member:
         raise HTTPException(
@@ -270,8 +469,9 @@ async def add_study_member(
     )
 
     db.add(db_member)
-    db.commit()
-    db.refresh(db_member)
+    await db.commit()
+    await db.refresh(db_member)
+    invalidate_study(study_id)
 
     return db_member
 
@@ -282,14 +482,18 @@ async def get_study_members(
     study_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 멤버 조회
     
     - **study_id**: 스터디 ID
+    - **cursor**: 이전 응답의 next_cursor (지정 시 skip 무시)
+    - **include_total**: 전체 개수 포함 여부
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     
     if not study:
         raise HTTPException(
@@ -297,23 +501,24 @@ async def get_study_members(
             detail="Study not found"
         )
     
-    total = db.query(StudyMember).filter(StudyMember.study_id == study_id).count()
-    members = db.query(StudyMember).filter(
-        StudyMember.study_id == study_id
-    ).offset(skip).limit(limit).all()
+    query = select(StudyMember).where(StudyMember.study_id == study_id)
+    total = await count_rows(db, query) if include_total else None
+    members, next_cursor = await paginate(
+        db, query.options(joinedload(StudyMember.user)), StudyMember.joined_at, StudyMember.id, limit,
+        skip=skip, cursor=cursor
+    )
     
     items = []
     for member in members:
-        user = db.query(User).filter(User.id == member.user_id).first()
         items.append({
             "id": member.id,
             "user_id": member.user_id,
-            "username": user.username,
+            "username": member.user.username,
             "role": member.role,
-            "joined_at": member.joined_at.isoformat()
+            "joined_at": member.joined_at
         })
 
-    return {"total": total, "items": items}
+    return {"total": total, "items": items, "next_cursor": next_cursor}
 
 
 # ==================== 스터디 멤버 삭제 ====================
@@ -321,8 +526,8 @@ async def get_study_members(
 async def remove_study_member(
     study_id: int,
     user_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 멤버 삭제 (생성자만 가능, 자기 자신은 삭제 불가)
@@ -330,7 +535,7 @@ async def remove_study_member(
     - **study_id**: 스터디 ID
     - **user_id**: 삭제할 멤버의 사용자 ID
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
 
     if not study:
         raise HTTPException(
@@ -353,9 +558,9 @@ async def remove_study_member(
         )
 
     # 멤버 조회
-    member = db.query(StudyMember).filter(
+    member = await db.scalar(select(StudyMember).where(
         and_(StudyMember.study_id == study_id, StudyMember.user_id == user_id)
-    ).first()
+    ))
 
     if not member:
         raise HTTPException(
@@ -363,39 +568,40 @@ async def remove_study_member(
             detail="Member not found in this study"
         )
 
-    db.delete(member)
-    db.commit()
+    await db.delete(member)
+    await db.commit()
+    invalidate_study(study_id)
 
 
 # ==================== 가입 요청 생성 ====================
 @router.post("/{study_id}/join-requests", status_code=status.HTTP_201_CREATED)
 async def create_join_request(
     study_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 가입 요청
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     if not study:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Study not found")
 
     # 이미 멤버인지 확인
-    existing_member = db.query(StudyMember).filter(
+    existing_member = await db.scalar(select(StudyMember).where(
         and_(StudyMember.study_id == study_id, StudyMember.user_id == current_user.id)
-    ).first()
+    ))
     if existing_member:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 스터디 멤버입니다")
 
     # 이미 대기 중인 요청이 있는지 확인
-    existing_request = db.query(JoinRequest).filter(
+    existing_request = await db.scalar(select(JoinRequest).where(
         and_(
             JoinRequest.study_id == study_id,
             JoinRequest.user_id == current_user.id,
             JoinRequest.status == "pending"
         )
-    ).first()
+    ))
     if existing_request:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 가입 요청이 대기 중입니다")
 
@@ -405,24 +611,19 @@ async def create_join_request(
         status="pending"
     )
     db.add(join_request)
-    db.commit()
-    db.refresh(join_request)
+    await db.commit()
+    await db.refresh(join_request)
 
     # 스터디 관리자들에게 알림 전송
-    admins = db.query(StudyMember).filter(
-        StudyMember.study_id == study_id,
-        StudyMember.role == "admin"
-    ).all()
-    for admin in admins:
-        create_notification(
-            db=db,
-            user_id=admin.user_id,
-            notification_type="join_request",
-            message=f"{current_user.username}님이 '{study.name}' 스터디에 가입을 요청했습니다",
-            study_id=study_id,
-            from_user_id=current_user.id
-        )
-    db.commit()
+    await notify_study_members(
+        db=db,
+        study_id=study_id,
+        notification_type="join_request",
+        message=f"{current_user.username}님이 '{study.name}' 스터디에 가입을 요청했습니다",
+        from_user_id=current_user.id,
+        role="admin"
+    )
+    await db.commit()
 
     return {"id": join_request.id, "status": "pending", "message": "가입 요청이 전송되었습니다"}
 
@@ -431,39 +632,40 @@ async def create_join_request(
 @router.get("/{study_id}/join-requests", response_model=dict)
 async def get_join_requests(
     study_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     스터디 가입 요청 목록 조회 (관리자만 가능)
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     if not study:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Study not found")
 
     # 관리자 권한 확인
-    member = db.query(StudyMember).filter(
+    member = await db.scalar(select(StudyMember).where(
         and_(StudyMember.study_id == study_id, StudyMember.user_id == current_user.id)
-    ).first()
+    ))
     if not member or member.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자만 가입 요청을 조회할 수 있습니다")
 
-    requests = db.query(JoinRequest).filter(
-        JoinRequest.study_id == study_id,
-        JoinRequest.status == "pending"
-    ).all()
+    # 요청한 사용자의 이름/이메일을 같은 쿼리로 조회
+    rows = (await db.execute(
+        select(JoinRequest, User.username, User.email)
+        .outerjoin(User, User.id == JoinRequest.user_id)
+        .where(JoinRequest.study_id == study_id, JoinRequest.status == "pending")
+    )).all()
 
     items = []
-    for req in requests:
-        user = db.query(User).filter(User.id == req.user_id).first()
+    for req, username, email in rows:
         items.append({
             "id": req.id,
             "study_id": req.study_id,
             "user_id": req.user_id,
-            "username": user.username if user else "Unknown",
-            "email": user.email if user else "",
+            "username": username or "Unknown",
+            "email": email or "",
             "status": req.status,
-            "created_at": req.created_at.isoformat()
+            "created_at": req.created_at
         })
 
     return {"total": len(items), "items": items}
@@ -474,28 +676,28 @@ async def get_join_requests(
 async def approve_join_request(
     study_id: int,
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     가입 요청 승인 (관리자만 가능)
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     if not study:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Study not found")
 
     # 관리자 권한 확인
-    member = db.query(StudyMember).filter(
+    member = await db.scalar(select(StudyMember).where(
         and_(StudyMember.study_id == study_id, StudyMember.user_id == current_user.id)
-    ).first()
+    ))
     if not member or member.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자만 가입 요청을 승인할 수 있습니다")
 
-    join_request = db.query(JoinRequest).filter(
+    join_request = await db.scalar(select(JoinRequest).where(
         JoinRequest.id == request_id,
         JoinRequest.study_id == study_id,
         JoinRequest.status == "pending"
-    ).first()
+    ))
     if not join_request:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="가입 요청을 찾을 수 없습니다")
 
@@ -514,7 +716,7 @@ async def approve_join_request(
     db.add(new_member)
 
     # 요청자에게 승인 알림 전송
-    create_notification(
+    await create_notification(
         db=db,
         user_id=join_request.user_id,
         notification_type="join_approved",
@@ -522,7 +724,8 @@ async def approve_join_request(
         study_id=study_id,
         from_user_id=current_user.id
     )
-    db.commit()
+    await db.commit()
+    invalidate_study(study_id)
 
     return {"message": "가입 요청이 승인되었습니다"}
 
@@ -532,28 +735,28 @@ async def approve_join_request(
 async def reject_join_request(
     study_id: int,
     request_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     가입 요청 거절 (관리자만 가능)
     """
-    study = db.query(Study).filter(Study.id == study_id).first()
+    study = await db.scalar(select(Study).where(Study.id == study_id, Study.deleted_at.is_(None)))
     if not study:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Study not found")
 
     # 관리자 권한 확인
-    member = db.query(StudyMember).filter(
+    member = await db.scalar(select(StudyMember).where(
         and_(StudyMember.study_id == study_id, StudyMember.user_id == current_user.id)
-    ).first()
+    ))
     if not member or member.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자만 가입 요청을 거절할 수 있습니다")
 
-    join_request = db.query(JoinRequest).filter(
+    join_request = await db.scalar(select(JoinRequest).where(
         JoinRequest.id == request_id,
         JoinRequest.study_id == study_id,
         JoinRequest.status == "pending"
-    ).first()
+    ))
     if not join_request:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="가입 요청을 찾을 수 없습니다")
 
@@ -563,7 +766,7 @@ async def reject_join_request(
     join_request.reviewed_by = current_user.id
 
     # 요청자에게 거절 알림 전송
-    create_notification(
+    await create_notification(
         db=db,
         user_id=join_request.user_id,
         notification_type="join_rejected",
@@ -571,6 +774,6 @@ async def reject_join_request(
         study_id=study_id,
         from_user_id=current_user.id
     )
-    db.commit()
+    await db.commit()
 
     return {"message": "가입 요청이 거절되었습니다"}
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime, date
 
 # ==================== User Schemas ====================
@@ -25,6 +25,14 @@ class UserResponse(UserBase):
 class UserInDB(UserResponse):
     password: str
 
+class AuthorResponse(BaseModel):
+    """목록/댓글에 함께 내려주는 작성자 정보"""
+    id: int
+    username: str
+
+    class Config:
+        from_attributes = True
+
 
 class UserUpdateRequest(BaseModel):
     username: Optional[str] = Field(None, min_length=3, max_length=100)
@@ -54,11 +62,29 @@ class StudyResponse(StudyBase):
     class Config:
         from_attributes = True
 
+class StudyListItemResponse(StudyResponse):
+    member_count: int = 0
+    is_member: bool = False
+    has_pending_request: bool = False
+
+class StudyListResponse(BaseModel):
+    total: Optional[int] = None
+    items: List[StudyListItemResponse]
+    next_cursor: Optional[str] = None
+
 class StudyDetailResponse(StudyResponse):
     creator: UserResponse
     member_count: int = 0
     members: Optional[List['StudyMemberResponse']] = None
 
+class StudyDeletionResponse(BaseModel):
+    study_id: int
+    status: str  # pending, purging, completed
+    deleted_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    removed: Dict[str, int] = {}    # 이 워커에서 지금까지 삭제한 수
+    remaining: Dict[str, int] = {}  # 아직 남아 있는 수
+
 
 # ==================== Study Member Schemas ====================
 
@@ -109,19 +135,25 @@ class PostResponse(PostBase):
 class PostDetailResponse(PostResponse):
     author: Optional[UserResponse] = None
     comments: Optional[List['CommentResponse']] = None
+    comments_next_cursor: Optional[str] = None
     comment_count: int = 0
 
 class PostListItemResponse(BaseModel):
     id: int
     study_id: int
     title: str
-    author: Optional[UserResponse] = None
+    author: Optional[AuthorResponse] = None
     comment_count: int = 0
     created_at: datetime
     
     class Config:
         from_attributes = True
 
+class PostListResponse(BaseModel):
+    total: Optional[int] = None
+    items: List[PostListItemResponse]
+    next_cursor: Optional[str] = None
+
 
 # ==================== Comment Schemas ====================
 
@@ -148,6 +180,14 @@ class CommentResponse(CommentBase):
 class CommentDetailResponse(CommentResponse):
     author: Optional[UserResponse] = None
 
+class CommentListItemResponse(CommentResponse):
+    author: Optional[AuthorResponse] = None
+
+class CommentListResponse(BaseModel):
+    total: Optional[int] = None
+    items: List[CommentListItemResponse]
+    next_cursor: Optional[str] = None
+
 
 # ==================== Issue Schemas ====================
 
@@ -181,6 +221,7 @@ class IssueResponse(IssueBase):
 class IssueDetailResponse(IssueResponse):
     author: Optional[UserResponse] = None
     comments: Optional[List['CommentDetailResponse']] = None
+    comments_next_cursor: Optional[str] = None
     comment_count: int = 0
 
 class IssueListItemResponse(BaseModel):
@@ -190,12 +231,18 @@ class IssueListItemResponse(BaseModel):
     status: str
     start_date: Optional[date] = None
     end_date: Optional[date] = None
-    author: Optional[UserResponse] = None
+    author: Optional[AuthorResponse] = None
+    comment_count: int = 0
     created_at: datetime
 
     class Config:
         from_attributes = True
 
+class IssueListResponse(BaseModel):
+    total: Optional[int] = None
+    items: List[IssueListItemResponse]
+    next_cursor: Optional[str] = None
+
 
 # ==================== Auth Schemas ====================
 
@@ -207,6 +254,13 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     email: Optional[str] = None
 
+class Principal(BaseModel):
+    """토큰 클레임으로 식별된 현재 사용자"""
+    id: int
+    email: str
+    username: str
+    token_version: int = 0
+
 
 # ==================== Password Reset Schemas ====================
 
@@ -253,9 +307,10 @@ class NotificationResponse(NotificationBase):
         from_attributes = True
 
 class NotificationListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
     unread_count: int
     items: List[NotificationResponse]
+    next_cursor: Optional[str] = None
 
 class NotificationMarkReadRequest(BaseModel):
     notification_ids: Optional[List[int]] = None  # None이면 전체 읽음 처리
@@ -286,6 +341,16 @@ class PaginatedResponse(BaseModel):
         arbitrary_types_allowed = True
 
 
+# ==================== Batch Schemas ====================
+
+class BatchRequestItem(BaseModel):
+    id: str = Field(..., min_length=1, max_length=50)
+    url: str = Field(..., min_length=1, max_length=2000)  # /api 기준 경로 (예: /studies/1?limit=10)
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem] = Field(..., min_length=1)
+
+
 # Update forward references
 StudyDetailResponse.model_rebuild()
 StudyMemberResponse.model_rebuild()
@@ -0,0 +1,155 @@
+"""
+스터디 내 전문 검색 (게시물/이슈/댓글)
+
+- PostgreSQL: search_vector 생성 컬럼 + GIN 인덱스 (migrations/0005_full_text_search.sql)
+- SQLite: FTS5 search_index 테이블 + 트리거 (database.SQLITE_SEARCH_DDL)
+"""
+import html
+import re
+from datetime import datetime
+
+from sqlalchemy import Integer, Text, and_, case, cast, func, literal, literal_column, null, or_, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import Comment, Issue, Post, engine
+
+# 검색어에서 사용할 최대 단어 수
+SEARCH_MAX_TERMS = 8
+
+# DB에서 하이라이트 구간을 표시할 문자 (HTML 이스케이프 후 <mark>로 바꿈)
+_MARK_START = "\ue000"
+_MARK_STOP = "\ue001"
+
+_TS_CONFIG = literal_column("'simple'::regconfig")
+_HEADLINE_OPTIONS = f"StartSel={_MARK_START}, StopSel={_MARK_STOP}, MaxFragments=2, MaxWords=20, MinWords=5"
+_TITLE_HEADLINE_OPTIONS = f"StartSel={_MARK_START}, StopSel={_MARK_STOP}, HighlightAll=true"
+
+
+def parse_search_terms(q: str) -> list:
+    """검색어를 단어 목록으로 변환 (특수문자 제거, 소문자)"""
+    return re.findall(r"\w+", q.lower())[:SEARCH_MAX_TERMS]
+
+
+def _highlight(value):
+    if value is None:
+        return None
+    return html.escape(value).replace(_MARK_START, "<mark>").replace(_MARK_STOP, "</mark>")
+
+
+def _search_vector(model):
+    return literal_column(f"{model.__tablename__}.search_vector")
+
+
+def _postgres_statement(study_id: int, terms: list, limit: int, skip: int):
+    # 조사가 붙은 한국어 단어도 찾을 수 있도록 모든 단어를 접두어로 검색
+    query = func.to_tsquery(_TS_CONFIG, cast(" & ".join(f"{term}:*" for term in terms), Text))
+
+    posts = select(
+        literal("post").label("kind"), Post.id.label("item_id"),
+        Post.id.label("post_id"), cast(null(), Integer).label("issue_id"),
+        func.ts_rank_cd(_search_vector(Post), query).label("rank"), Post.created_at,
+    ).where(Post.study_id == study_id, _search_vector(Post).op("@@")(query))
+
+    issues = select(
+        literal("issue").label("kind"), Issue.id.label("item_id"),
+        cast(null(), Integer).label("post_id"), Issue.id.label("issue_id"),
+        func.ts_rank_cd(_search_vector(Issue), query).label("rank"), Issue.created_at,
+    ).where(Issue.study_id == study_id, _search_vector(Issue).op("@@")(query))
+
+    comments = (
+        select(
+            literal("comment").label("kind"), Comment.id.label("item_id"),
+            Comment.post_id, Comment.issue_id,
+            func.ts_rank_cd(_search_vector(Comment), query).label("rank"), Comment.created_at,
+        )
+        .outerjoin(Post, Post.id == Comment.post_id)
+        .outerjoin(Issue, Issue.id == Comment.issue_id)
+        .where(or_(Post.study_id == study_id, Issue.study_id == study_id), _search_vector(Comment).op("@@")(query))
+    )
+
+    ranked = union_all(posts, issues, comments).subquery()
+    page = (
+        select(ranked)
+        .order_by(ranked.c.rank.desc(), ranked.c.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+
+    # 하이라이트(ts_headline)는 비용이 크므로 잘라낸 페이지에만 적용
+    def headline(column, options=_HEADLINE_OPTIONS):
+        return func.ts_headline(_TS_CONFIG, func.coalesce(column, ""), query, options)
+
+    return (
+        select(
+            page.c.kind, page.c.item_id, page.c.post_id, page.c.issue_id,
+            case(
+                (page.c.kind == "post", headline(Post.title, _TITLE_HEADLINE_OPTIONS)),
+                (page.c.kind == "issue", headline(Issue.title, _TITLE_HEADLINE_OPTIONS)),
+                else_=func.coalesce(Post.title, Issue.title),
+            ).label("title"),
+            case(
+                (page.c.kind == "post", headline(Post.content)),
+                (page.c.kind == "issue", headline(Issue.description)),
+                else_=headline(Comment.content),
+            ).label("snippet"),
+            page.c.rank, page.c.created_at,
+        )
+        .select_from(page)
+        .outerjoin(Post, Post.id == page.c.post_id)
+        .outerjoin(Issue, Issue.id == page.c.issue_id)
+        .outerjoin(Comment, and_(page.c.kind == "comment", Comment.id == page.c.item_id))
+        .order_by(page.c.rank.desc(), page.c.created_at.desc())
+    )
+
+
+_SQLITE_SEARCH = text("""
+    SELECT search_index.kind, search_index.item_id, search_index.post_id, search_index.issue_id,
+           CASE WHEN search_index.kind = 'comment' THEN COALESCE(p.title, i.title)
+                ELSE highlight(search_index, 6, :start, :stop) END AS title,
+           snippet(search_index, 7, :start, :stop, '...', 24) AS snippet,
+           -bm25(search_index, 0, 0, 0, 0, 0, 0, 10.0, 1.0) AS rank,
+           search_index.created_at
+    FROM search_index
+    LEFT JOIN posts p ON p.id = search_index.post_id AND search_index.kind = 'comment'
+    LEFT JOIN issues i ON i.id = search_index.issue_id AND search_index.kind = 'comment'
+    WHERE search_index MATCH :query AND search_index.study_id = :study_id
+    ORDER BY rank DESC, search_index.created_at DESC
+    LIMIT :limit OFFSET :skip
+""")
+
+
+async def search_study(db: AsyncSession, study_id: int, terms: list, limit: int = 20, skip: int = 0):
+    """
+    스터디의 게시물/이슈/댓글을 관련도 순으로 검색합니다.
+
+    title/snippet은 HTML 이스케이프 후 일치 구간을 <mark>로 감싸며 (items, has_more)를 반환합니다.
+    """
+    if engine.dialect.name == "postgresql":
+        rows = (await db.execute(_postgres_statement(study_id, terms, limit + 1, skip))).all()
+    else:
+        rows = (await db.execute(_SQLITE_SEARCH, {
+            "start": _MARK_START,
+            "stop": _MARK_STOP,
+            "query": " ".join(f'"{term}"*' for term in terms),
+            "study_id": study_id,
+            "limit": limit + 1,
+            "skip": skip,
+        })).all()
+
+    items = []
+    for row in rows[:limit]:
+        created_at = row.created_at
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        items.append({
+            "type": row.kind,
+            "id": row.item_id,
+            "post_id": row.post_id,
+            "issue_id": row.issue_id,
+            "title": _highlight(row.title),
+            "snippet": _highlight(row.snippet),
+            "rank": round(float(row.rank), 4),
+            "created_at": created_at,
+        })
+    return items, len(rows) > limit
@@ -0,0 +1,22 @@
+"""
+응답 직렬화
+
+앱 기본 응답 클래스는 ORJSONResponse입니다 (main.py).
+목록/상세 API는 datetime 등을 변환하지 않은 dict를 json_response로 반환해
+FastAPI의 response_model 검증과 인코딩 단계를 건너뛰고 orjson으로 바로 bytes를 만듭니다.
+(측정: python benchmark_serialization.py)
+"""
+from typing import Optional
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+
+def json_response(content, response: Optional[Response] = None, status_code: int = 200) -> ORJSONResponse:
+    """
+    content를 orjson으로 직렬화한 응답을 반환합니다.
+
+    - **response**: 라우트에 주입된 Response (ETag 등 미리 설정한 헤더를 옮겨 담음)
+    """
+    headers = dict(response.headers) if response is not None else None
+    return ORJSONResponse(content, status_code=status_code, headers=headers)
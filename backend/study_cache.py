@@ -0,0 +1,74 @@
+"""
+스터디 상세 조회 캐시
+
+GET /studies/{study_id} 응답(스터디 + 생성자 + 멤버 목록)을 스터디 ID별로 보관하는
+TTL/LRU 캐시입니다. 스터디 수정/삭제, 멤버 추가/제거, 가입 승인, 사용자명 변경 시 해당
+항목을 바로 무효화합니다. 항목에는 ETag 계산에 쓰는 버전 값도 함께 저장해, 다른 워커에서
+바뀐 경우에도 버전이 다르면 캐시를 사용하지 않습니다.
+"""
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# 캐시할 최대 스터디 수 (0이면 캐시 사용 안 함)
+STUDY_CACHE_SIZE = int(os.getenv("STUDY_CACHE_SIZE", 256))
+# 캐시 항목 유지 시간 (초)
+STUDY_CACHE_TTL_SECONDS = int(os.getenv("STUDY_CACHE_TTL_SECONDS", 300))
+
+# study_id -> (저장 시각, 버전, 관련 사용자 ID 집합, 응답 dict) (가장 최근에 사용한 항목이 끝)
+_study_cache = OrderedDict()
+study_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+
+def get_cached_study(study_id: int, version: tuple) -> Optional[dict]:
+    """버전이 같고 만료되지 않은 캐시 항목의 응답 dict를 반환 (없으면 None)"""
+    entry = _study_cache.get(study_id)
+    if entry is None:
+        study_cache_stats["misses"] += 1
+        return None
+    cached_at, cached_version, _, payload = entry
+    if time.monotonic() - cached_at >= STUDY_CACHE_TTL_SECONDS:
+        study_cache_stats["expirations"] += 1
+        study_cache_stats["misses"] += 1
+        del _study_cache[study_id]
+        return None
+    if cached_version != version:
+        study_cache_stats["misses"] += 1
+        return None
+    study_cache_stats["hits"] += 1
+    _study_cache.move_to_end(study_id)
+    return payload
+
+
+def cache_study(study_id: int, version: tuple, payload: dict):
+    if STUDY_CACHE_SIZE <= 0:
+        return
+    user_ids = {payload["creator"]["id"], *(member["id"] for member in payload["members"])}
+    _study_cache[study_id] = (time.monotonic(), version, user_ids, payload)
+    _study_cache.move_to_end(study_id)
+    while len(_study_cache) > STUDY_CACHE_SIZE:
+        _study_cache.popitem(last=False)
+        study_cache_stats["evictions"] += 1
+
+
+def invalidate_study(study_id: int):
+    """스터디 수정/삭제, 멤버 변경 시 호출"""
+    if _study_cache.pop(study_id, None) is not None:
+        study_cache_stats["invalidations"] += 1
+
+
+def invalidate_user(user_id: int):
+    """사용자명 변경 시 그 사용자가 생성자/멤버로 포함된 스터디 항목을 모두 무효화"""
+    for study_id in [sid for sid, entry in _study_cache.items() if user_id in entry[2]]:
+        invalidate_study(study_id)
+
+
+def describe_study_cache() -> dict:
+    """스터디 상세 캐시 상태 (/api/study-cache)"""
+    return {
+        "size": len(_study_cache),
+        "max_size": STUDY_CACHE_SIZE,
+        "ttl_seconds": STUDY_CACHE_TTL_SECONDS,
+        **study_cache_stats,
+    }
@@ -0,0 +1,226 @@
+"""
+삭제된 스터디 정리 (백그라운드)
+
+스터디 삭제 요청은 studies.deleted_at만 기록하고 즉시 반환합니다.
+이 모듈의 작업이 알림, 댓글, 게시물, 이슈를 작은 배치로 나눠 삭제한 뒤
+마지막으로 스터디 행을 삭제하며, 멤버/가입 요청은 DB의 ON DELETE CASCADE로 함께 삭제됩니다.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, func, or_, select
+
+from database import AsyncSessionLocal, Comment, Issue, JoinRequest, Notification, Post, Study, StudyMember
+from notification_stream import mark_notifications_changed
+from notification_utils import adjust_unread_counts
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 삭제할 행 수
+STUDY_PURGE_BATCH_SIZE = int(os.getenv("STUDY_PURGE_BATCH_SIZE", 500))
+# 배치 사이 대기 시간 (초)
+STUDY_PURGE_PAUSE_SECONDS = float(os.getenv("STUDY_PURGE_PAUSE_SECONDS", 0.05))
+# 삭제 요청이 없을 때 정리 대상을 다시 확인하는 주기 (초)
+STUDY_PURGE_POLL_SECONDS = int(os.getenv("STUDY_PURGE_POLL_SECONDS", 60))
+# 정리가 끝난 스터디의 진행 상황을 보관하는 시간 (초)
+STUDY_PURGE_PROGRESS_TTL_SECONDS = int(os.getenv("STUDY_PURGE_PROGRESS_TTL_SECONDS", 3600))
+# 보관할 최대 진행 상황 수 (넘으면 먼저 끝난 것부터 삭제)
+STUDY_PURGE_PROGRESS_MAX_SIZE = int(os.getenv("STUDY_PURGE_PROGRESS_MAX_SIZE", 256))
+
+# 삭제 요청 시 작업을 바로 깨우기 위한 이벤트
+_purge_wakeup = asyncio.Event()
+# study_id -> 진행 상황 (이 워커에서 처리한 것만, 끝난 항목은 TTL/최대 개수에 따라 삭제)
+purge_progress = {}
+
+
+def request_purge():
+    """스터디 삭제 커밋 후 정리 작업을 깨움"""
+    _purge_wakeup.set()
+
+
+def _prune_progress():
+    """TTL이 지났거나 최대 개수를 넘은 완료 항목을 삭제"""
+    now = datetime.utcnow()
+    completed = sorted(
+        (progress["finished_at"], study_id)
+        for study_id, progress in purge_progress.items()
+        if progress["status"] == "completed"
+    )
+    overflow = len(purge_progress) - STUDY_PURGE_PROGRESS_MAX_SIZE
+    for finished_at, study_id in completed:
+        if overflow > 0 or (now - finished_at).total_seconds() >= STUDY_PURGE_PROGRESS_TTL_SECONDS:
+            del purge_progress[study_id]
+            overflow -= 1
+
+
+def get_purge_progress(study_id: int) -> Optional[dict]:
+    """스터디 정리 진행 상황 (/studies/{study_id}/deletion)"""
+    _prune_progress()
+    return purge_progress.get(study_id)
+
+
+def _study_posts(study_id: int):
+    return select(Post.id).where(Post.study_id == study_id)
+
+
+def _study_issues(study_id: int):
+    return select(Issue.id).where(Issue.study_id == study_id)
+
+
+async def _delete_notifications_batch(db, study_id: int) -> int:
+    candidates = (
+        select(Notification.id)
+        .where(Notification.study_id == study_id)
+        .limit(STUDY_PURGE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    rows = (await db.execute(
+        delete(Notification)
+        .where(Notification.id.in_(candidates))
+        .returning(Notification.user_id, Notification.is_read)
+        .execution_options(synchronize_session=False)
+    )).all()
+
+    # 읽지 않은 알림이 삭제된 사용자의 카운터 감소
+    deltas = defaultdict(int)
+    for user_id, is_read in rows:
+        if not is_read:
+            deltas[user_id] -= 1
+    if deltas:
+        await adjust_unread_counts(db, deltas)
+        mark_notifications_changed(db, deltas.keys())
+    return len(rows)
+
+
+async def _delete_batch(db, model, condition) -> int:
+    candidates = (
+        select(model.id)
+        .where(condition)
+        .limit(STUDY_PURGE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        delete(model)
+        .where(model.id.in_(candidates))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def _delete_comments_batch(db, study_id: int) -> int:
+    # 게시물/이슈도 이어서 삭제되므로 comment_count는 갱신하지 않음
+    return await _delete_batch(db, Comment, or_(
+        Comment.post_id.in_(_study_posts(study_id)),
+        Comment.issue_id.in_(_study_issues(study_id)),
+    ))
+
+
+async def _delete_posts_batch(db, study_id: int) -> int:
+    return await _delete_batch(db, Post, Post.study_id == study_id)
+
+
+async def _delete_issues_batch(db, study_id: int) -> int:
+    return await _delete_batch(db, Issue, Issue.study_id == study_id)
+
+
+# (진행 상황 키, 배치 삭제 함수) - 댓글을 먼저 지워 게시물/이슈 삭제 시 CASCADE 범위를 작게 유지
+PURGE_STEPS = [
+    ("notifications", _delete_notifications_batch),
+    ("comments", _delete_comments_batch),
+    ("posts", _delete_posts_batch),
+    ("issues", _delete_issues_batch),
+]
+
+
+async def purge_study(study_id: int) -> dict:
+    """
+    삭제 표시된 스터디 하나를 배치 단위로 정리하고 진행 상황을 반환
+
+    다른 트랜잭션이 잠가 건너뛴 행이 남아 있으면 스터디 행을 삭제하지 않고 다음 주기에 다시 정리합니다
+    (남은 행이 스터디 삭제 CASCADE로 한 트랜잭션에서 지워지지 않도록).
+    """
+    progress = purge_progress.setdefault(study_id, {
+        "status": "purging",
+        "removed": {key: 0 for key, _ in PURGE_STEPS},
+        "started_at": datetime.utcnow(),
+        "finished_at": None,
+    })
+    started = time.perf_counter()
+
+    for key, delete_batch in PURGE_STEPS:
+        while True:
+            async with AsyncSessionLocal() as db:
+                deleted = await delete_batch(db, study_id)
+                await db.commit()
+            progress["removed"][key] += deleted
+            if deleted < STUDY_PURGE_BATCH_SIZE:
+                break
+            await asyncio.sleep(STUDY_PURGE_PAUSE_SECONDS)
+
+    # 남은 멤버/가입 요청은 ON DELETE CASCADE로 함께 삭제
+    async with AsyncSessionLocal() as db:
+        remaining = await get_remaining_counts(db, study_id)
+        skipped = {key: remaining[key] for key, _ in PURGE_STEPS if remaining[key]}
+        if skipped:
+            logger.info("Study %d still has locked rows %s, retrying later", study_id, skipped)
+            return progress
+        await db.execute(delete(Study).where(Study.id == study_id, Study.deleted_at.isnot(None)))
+        await db.commit()
+
+    progress["status"] = "completed"
+    progress["finished_at"] = datetime.utcnow()
+    logger.info(
+        "Purged study %d in %.3fs: %s", study_id, time.perf_counter() - started, progress["removed"]
+    )
+    _prune_progress()
+    return progress
+
+
+async def purge_deleted_studies() -> int:
+    """삭제 표시된 모든 스터디를 정리하고 처리한 스터디 수를 반환"""
+    async with AsyncSessionLocal() as db:
+        study_ids = (await db.scalars(
+            select(Study.id).where(Study.deleted_at.isnot(None)).order_by(Study.deleted_at)
+        )).all()
+
+    for study_id in study_ids:
+        await purge_study(study_id)
+    return len(study_ids)
+
+
+async def get_remaining_counts(db, study_id: int) -> dict:
+    """정리되지 않고 남아 있는 하위 데이터 수를 한 번의 쿼리로 조회"""
+    posts = _study_posts(study_id)
+    issues = _study_issues(study_id)
+    row = (await db.execute(select(
+        select(func.count(Notification.id)).where(Notification.study_id == study_id).scalar_subquery(),
+        select(func.count(Comment.id)).where(or_(
+            Comment.post_id.in_(posts), Comment.issue_id.in_(issues)
+        )).scalar_subquery(),
+        select(func.count(Post.id)).where(Post.study_id == study_id).scalar_subquery(),
+        select(func.count(Issue.id)).where(Issue.study_id == study_id).scalar_subquery(),
+        select(func.count(StudyMember.id)).where(StudyMember.study_id == study_id).scalar_subquery(),
+        select(func.count(JoinRequest.id)).where(JoinRequest.study_id == study_id).scalar_subquery(),
+    ))).one()
+    return dict(zip(
+        ["notifications", "comments", "posts", "issues", "members", "join_requests"], row
+    ))
+
+
+async def run_study_purger():
+    """삭제 요청이 들어오거나 STUDY_PURGE_POLL_SECONDS가 지나면 삭제된 스터디를 정리"""
+    while True:
+        try:
+            await asyncio.wait_for(_purge_wakeup.wait(), timeout=STUDY_PURGE_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        _purge_wakeup.clear()
+        try:
+            await purge_deleted_studies()
+        except Exception:
+            logger.exception("Study purge failed")
@@ -4,6 +4,13 @@ import { useAuth } from './AuthContext';
 
 const NotificationContext = createContext();
 
+// 스트림 재연결 대기 시간 (실패할 때마다 두 배, 최대값까지)
+const STREAM_RETRY_BASE_MS = 1000;
+const STREAM_RETRY_MAX_MS = 30000;
+// 연속으로 이만큼 연결에 실패하면 재연결될 때까지 읽지 않은 개수를 폴링
+const STREAM_MAX_FAILURES = 3;
+const UNREAD_POLL_INTERVAL_MS = 10000;
+
 export const useNotifications = () => {
   const context = useContext(NotificationContext);
   if (!context) {
@@ -17,7 +24,7 @@ export const NotificationProvider = ({ children }) => {
   const [notifications, setNotifications] = useState([]);
   const [unreadCount, setUnreadCount] = useState(0);
   const [loading, setLoading] = useState(false);
-  const intervalRef = useRef(null);
+  const streamRef = useRef(null);
 
   const fetchNotifications = useCallback(async () => {
     if (!user) return;
@@ -31,17 +38,6 @@ export const NotificationProvider = ({ children }) => {
     }
   }, [user]);
 
-  const fetchUnreadCount = useCallback(async () => {
-    if (!user) return;
-
-    try {
-      const response = await notificationsAPI.getUnreadCount();
-      setUnreadCount(response.data.unread_count);
-    } catch (err) {
-      console.error('Failed to fetch unread count:', err);
-    }
-  }, [user]);
-
   const markAsRead = useCallback(async (notificationIds = null) => {
     try {
       await notificationsAPI.markAsRead(notificationIds);
@@ -88,25 +84,99 @@ export const NotificationProvider = ({ children }) => {
     }
   }, []);
 
-  // 폴링: 10초마다 읽지 않은 알림 개수 확인
+  // 실시간 스트림: 새 알림과 읽지 않은 개수를 서버에서 푸시
+  // 연결이 끊기면 새 스트림 토큰으로 다시 연결하고, 계속 실패하면 폴링으로 대신함
   useEffect(() => {
-    if (user) {
-      fetchNotifications();
-
-      intervalRef.current = setInterval(() => {
-        fetchUnreadCount();
-      }, 10000);
-    } else {
+    if (!user) {
       setNotifications([]);
       setUnreadCount(0);
+      return undefined;
     }
 
+    let cancelled = false;
+    let failures = 0;
+    let retryTimer = null;
+    let pollTimer = null;
+
+    const pollUnreadCount = async () => {
+      try {
+        const response = await notificationsAPI.getUnreadCount();
+        setUnreadCount(response.data.unread_count);
+      } catch (err) {
+        console.error('Failed to fetch unread count:', err);
+      }
+    };
+
+    const scheduleReconnect = () => {
+      if (cancelled) return;
+      failures += 1;
+      if (failures >= STREAM_MAX_FAILURES && !pollTimer) {
+        pollUnreadCount();
+        pollTimer = setInterval(pollUnreadCount, UNREAD_POLL_INTERVAL_MS);
+      }
+      const delay = Math.min(STREAM_RETRY_MAX_MS, STREAM_RETRY_BASE_MS * 2 ** (failures - 1));
+      retryTimer = setTimeout(connect, delay);
+    };
+
+    const connect = async () => {
+      let url;
+      try {
+        // 액세스 토큰이 만료/폐기되었으면 여기서 401이 나고 응답 인터셉터가 로그아웃 처리
+        url = await notificationsAPI.getStreamUrl();
+      } catch (err) {
+        console.error('Failed to open notification stream:', err);
+        scheduleReconnect();
+        return;
+      }
+      if (cancelled) return;
+
+      const stream = new EventSource(url);
+      streamRef.current = stream;
+
+      stream.addEventListener('open', () => {
+        if (failures > 0) {
+          // 끊겨 있던 동안의 알림과 개수를 다시 가져옴
+          fetchNotifications();
+        }
+        failures = 0;
+        clearInterval(pollTimer);
+        pollTimer = null;
+      });
+
+      stream.addEventListener('notification', (event) => {
+        const notification = JSON.parse(event.data);
+        setNotifications(prev =>
+          prev.some(n => n.id === notification.id) ? prev : [notification, ...prev]
+        );
+      });
+
+      stream.addEventListener('unread_count', (event) => {
+        setUnreadCount(JSON.parse(event.data).unread_count);
+      });
+
+      // 브라우저의 자동 재연결은 같은 URL(만료된 스트림 토큰)을 다시 사용하므로 직접 닫고 재연결
+      stream.onerror = () => {
+        stream.close();
+        if (streamRef.current === stream) {
+          streamRef.current = null;
+        }
+        scheduleReconnect();
+      };
+    };
+
+    fetchNotifications();
+    connect();
+
     return () => {
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
+      cancelled = true;
+      clearTimeout(retryTimer);
+      clearInterval(pollTimer);
+      if (streamRef.current) {
+        streamRef.current.close();
+        streamRef.current = null;
       }
     };
-  }, [user, fetchNotifications, fetchUnreadCount]);
+  }, [user, fetchNotifications]);
 
   const value = {
     notifications,
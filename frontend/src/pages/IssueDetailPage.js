@@ -15,6 +15,9 @@ const IssueDetailPage = () => {
 
   const [issue, setIssue] = useState(null);
   const [comments, setComments] = useState([]);
+  const [commentCount, setCommentCount] = useState(0);
+  const [commentsCursor, setCommentsCursor] = useState(null);
+  const [loadingMoreComments, setLoadingMoreComments] = useState(false);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [newComment, setNewComment] = useState('');
@@ -37,6 +40,8 @@ const IssueDetailPage = () => {
       const response = await issuesAPI.getIssueDetail(issueId);
       setIssue(response.data);
       setComments(response.data.comments || []);
+      setCommentCount(response.data.comment_count || 0);
+      setCommentsCursor(response.data.comments_next_cursor || null);
     } catch (err) {
       setError(err.response?.data?.detail || 'Failed to load issue');
     } finally {
@@ -44,6 +49,21 @@ const IssueDetailPage = () => {
     }
   };
 
+  const handleLoadMoreComments = async () => {
+    if (!commentsCursor) return;
+
+    setLoadingMoreComments(true);
+    try {
+      const response = await commentsAPI.list({ issueId: issueId, cursor: commentsCursor });
+      setComments(prev => [...prev, ...response.data.items]);
+      setCommentsCursor(response.data.next_cursor || null);
+    } catch (err) {
+      toast.error(err.response?.data?.detail || '댓글을 불러오지 못했습니다.');
+    } finally {
+      setLoadingMoreComments(false);
+    }
+  };
+
   const handleAddComment = async (e) => {
     e.preventDefault();
     if (!newComment.trim()) {
@@ -202,7 +222,7 @@ const IssueDetailPage = () => {
       </article>
 
       <section className="comments-section">
-        <h2>Comments ({comments.length})</h2>
+        <h2>Comments ({commentCount})</h2>
 
         <form className="comment-form" onSubmit={handleAddComment}>
           <textarea
@@ -282,6 +302,16 @@ const IssueDetailPage = () => {
             ))
           )}
         </div>
+
+        {commentsCursor && (
+          <button
+            className="btn btn-secondary"
+            onClick={handleLoadMoreComments}
+            disabled={loadingMoreComments}
+          >
+            {loadingMoreComments ? '불러오는 중...' : '댓글 더 보기'}
+          </button>
+        )}
       </section>
     </div>
   );
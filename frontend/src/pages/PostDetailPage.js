@@ -15,6 +15,9 @@ const PostDetailPage = () => {
 
   const [post, setPost] = useState(null);
   const [comments, setComments] = useState([]);
+  const [commentCount, setCommentCount] = useState(0);
+  const [commentsCursor, setCommentsCursor] = useState(null);
+  const [loadingMoreComments, setLoadingMoreComments] = useState(false);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [newComment, setNewComment] = useState('');
@@ -34,9 +37,12 @@ const PostDetailPage = () => {
     setLoading(true);
     setError('');
     try {
-      const response = await postsAPI.getDetail(postId);
+      // 본문은 서버에서 렌더링한 HTML을 사용 (긴 문서도 클라이언트에서 다시 렌더링하지 않음)
+      const response = await postsAPI.getDetail(postId, { render: 'html' });
       setPost(response.data);
       setComments(response.data.comments || []);
+      setCommentCount(response.data.comment_count || 0);
+      setCommentsCursor(response.data.comments_next_cursor || null);
     } catch (err) {
       setError(err.response?.data?.detail || 'Failed to load post');
     } finally {
@@ -44,6 +50,21 @@ const PostDetailPage = () => {
     }
   };
 
+  const handleLoadMoreComments = async () => {
+    if (!commentsCursor) return;
+
+    setLoadingMoreComments(true);
+    try {
+      const response = await commentsAPI.list({ postId: postId, cursor: commentsCursor });
+      setComments(prev => [...prev, ...response.data.items]);
+      setCommentsCursor(response.data.next_cursor || null);
+    } catch (err) {
+      toast.error(err.response?.data?.detail || '댓글을 불러오지 못했습니다.');
+    } finally {
+      setLoadingMoreComments(false);
+    }
+  };
+
   const handleAddComment = async (e) => {
     e.preventDefault();
     if (!newComment.trim()) {
@@ -165,9 +186,16 @@ const PostDetailPage = () => {
           </div>
         </div>
 
-        <div className="post-body markdown-content">
-          <ReactMarkdown>{post.content}</ReactMarkdown>
-        </div>
+        {post.content_html != null ? (
+          <div
+            className="post-body markdown-content"
+            dangerouslySetInnerHTML={{ __html: post.content_html }}
+          />
+        ) : (
+          <div className="post-body markdown-content">
+            <ReactMarkdown>{post.content}</ReactMarkdown>
+          </div>
+        )}
 
         {isAuthor && (
           <div className="post-actions">
@@ -188,7 +216,7 @@ const PostDetailPage = () => {
       </article>
 
       <section className="comments-section">
-        <h2>Comments ({comments.length})</h2>
+        <h2>Comments ({commentCount})</h2>
 
         <form className="comment-form" onSubmit={handleAddComment}>
           <textarea
@@ -268,6 +296,16 @@ const PostDetailPage = () => {
             ))
           )}
         </div>
+
+        {commentsCursor && (
+          <button
+            className="btn btn-secondary"
+            onClick={handleLoadMoreComments}
+            disabled={loadingMoreComments}
+          >
+            {loadingMoreComments ? '불러오는 중...' : '댓글 더 보기'}
+          </button>
+        )}
       </section>
     </div>
   );
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate, useParams } from 'react-router-dom';
 import ReactMarkdown from 'react-markdown';
-import { studiesAPI } from '../services/api';
+import { studiesAPI, batchAPI } from '../services/api';
 import { useAuth } from '../context/AuthContext';
 import { useToast } from '../context/ToastContext';
 import LoadingSpinner from '../components/LoadingSpinner';
@@ -45,17 +45,27 @@ const StudyDetailPage = () => {
     setLoading(true);
     setError('');
     try {
-      const studyRes = await studiesAPI.getDetail(studyId);
-      setStudy(studyRes.data);
-      setEditName(studyRes.data.name);
-      setEditDescription(studyRes.data.description || '');
+      // 스터디 상세/멤버/가입 요청을 한 번의 요청으로 조회 (가입 요청은 관리자만 200)
+      const results = await batchAPI.get({
+        study: `/studies/${studyId}`,
+        members: `/studies/${studyId}/members`,
+        joinRequests: `/studies/${studyId}/join-requests`,
+      });
+      if (results.study.status !== 200) {
+        setError(results.study.body?.detail || 'Failed to load study details');
+        return;
+      }
+      const studyData = results.study.body;
+      setStudy(studyData);
+      setEditName(studyData.name);
+      setEditDescription(studyData.description || '');
 
-      const membersRes = await studiesAPI.getMembers(studyId);
-      setMembers(membersRes.data.items || membersRes.data);
+      if (results.members.status === 200) {
+        setMembers(results.members.body.items || results.members.body);
+      }
 
-      // 관리자인 경우 가입 요청 조회
-      if (studyRes.data.creator_id === user?.id) {
-        fetchJoinRequests();
+      if (studyData.creator_id === user?.id && results.joinRequests.status === 200) {
+        setJoinRequests(results.joinRequests.body.items || []);
       }
     } catch (err) {
       setError(err.response?.data?.detail || 'Failed to load study details');
@@ -68,6 +68,9 @@ export const studiesAPI = {
   
   getDetail: (studyId) =>
     api.get(`/studies/${studyId}`),
+
+  getDashboard: (studyId, postLimit = 5) =>
+    api.get(`/studies/${studyId}/dashboard`, { params: { post_limit: postLimit } }),
   
   createStudy: (name, description) =>
     api.post('/studies', { name, description }),
@@ -107,8 +110,8 @@ export const postsAPI = {
   listByStudy: (studyId, skip = 0, limit = 10) =>
     api.get(`/posts/study/${studyId}`, { params: { skip, limit } }),
   
-  getDetail: (postId) =>
-    api.get(`/posts/${postId}`),
+  getDetail: (postId, { render } = {}) =>
+    api.get(`/posts/${postId}`, { params: render ? { render } : {} }),
   
   create: (studyId, title, content) =>
     api.post('/posts', { title, content }, { params: { study_id: studyId } }),
@@ -123,6 +126,12 @@ export const postsAPI = {
 // ==================== 댓글 API ====================
 
 export const commentsAPI = {
+  // 댓글 목록 (postId 또는 issueId, cursor는 이전 응답의 next_cursor)
+  list: ({ postId, issueId, cursor, limit = 20 }) =>
+    api.get('/comments', {
+      params: { post_id: postId, issue_id: issueId, cursor, limit, include_total: false },
+    }),
+
   // 포스트 댓글
   create: (postId, content) =>
     api.post('/comments', { content }, { params: { post_id: postId } }),
@@ -187,6 +196,25 @@ export const notificationsAPI = {
 
   deleteAllNotifications: () =>
     api.delete('/notifications'),
+
+  // EventSource는 헤더를 설정할 수 없어 토큰을 쿼리로 전달
+  // (URL은 접근 로그에 남으므로 액세스 토큰 대신 수명이 짧은 스트림 전용 토큰을 발급받아 사용)
+  getStreamUrl: async () => {
+    const res = await api.post('/notifications/stream-token');
+    return `${API_BASE_URL}/notifications/stream?token=${encodeURIComponent(res.data.token)}`;
+  },
+};
+
+// ==================== 배치 API ====================
+
+export const batchAPI = {
+  // requests: { id: url } (url은 /api 기준 경로) -> { id: { status, body } }
+  get: async (requests) => {
+    const res = await api.post('/batch', {
+      requests: Object.entries(requests).map(([id, url]) => ({ id, url })),
+    });
+    return Object.fromEntries(res.data.responses.map(({ id, ...result }) => [id, result]));
+  },
 };
 
 export default api;